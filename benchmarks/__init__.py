@@ -0,0 +1,5 @@
+"""
+性能基准测试
+
+离线运行的基准脚本，GUI 相关基准使用 offscreen 平台
+"""
@@ -0,0 +1,138 @@
+"""
+评论浏览面板滚动基准测试
+
+向评论浏览面板分页追加 1 千、1 万、10 万条评论，测量加载后的进程内存增长和
+滚动时每帧重绘视口的耗时；行高固定、只绘制可见行，帧耗时应与评论总数无关
+
+近似去重在本测试中关闭（生成的评论内容相似，会被当作重复去掉）
+
+运行方式:
+    python -m benchmarks.bench_comment_browser [--counts 1000,10000,100000] [--frames 300]
+"""
+
+import argparse
+import gc
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtWidgets import QApplication
+
+from src.config.settings import get_config
+from src.models.comment import Comment, CommentPage
+
+PAGE_SIZE = 1000
+
+
+def rss_mib() -> float:
+    """当前进程常驻内存（MiB）"""
+    import psutil
+
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+def make_page(start: int, count: int, has_more: bool) -> CommentPage:
+    """生成一页评论
+
+    Args:
+        start: 第一条评论的序号
+        count: 条数
+        has_more: 是否还有下一页
+
+    Returns:
+        CommentPage: 分页结果
+    """
+    base = "那年夏天我们在操场上听着这首歌，以为会一直这样下去。"
+    comments = [
+        Comment(
+            content=f"{base[: 10 + i % 20]} #{i}",
+            user=f"用户{i % 5000}",
+            likes=i * 7,
+            time_ms=1489154520000 + i * 60000,
+            comment_id=100000000 + i,
+        )
+        for i in range(start, start + count)
+    ]
+    return CommentPage(comments=comments, cursor=str(start + count), has_more=has_more, total=start + count)
+
+
+def bench_scroll(count: int, frames: int) -> dict:
+    """加载 count 条评论后从头到尾滚动，测量内存和帧耗时
+
+    Args:
+        count: 评论数
+        frames: 滚动帧数（均匀分布在整个滚动范围内）
+
+    Returns:
+        dict: 内存增长（MiB）、加载耗时（ms）和帧耗时统计（ms）
+    """
+    from src.gui.comment_browser import CommentBrowser
+
+    gc.collect()
+    rss_before = rss_mib()
+
+    browser = CommentBrowser()
+    browser.show()
+    browser.set_song("1")
+
+    start = time.perf_counter()
+    for offset in range(0, count, PAGE_SIZE):
+        size = min(PAGE_SIZE, count - offset)
+        browser.append_page("1", make_page(offset, size, has_more=offset + size < count))
+    QApplication.processEvents()
+    load_ms = (time.perf_counter() - start) * 1000
+
+    gc.collect()
+    rss_growth = rss_mib() - rss_before
+
+    view = browser.list_view
+    scroll_bar = view.verticalScrollBar()
+    samples = []
+    for frame in range(frames):
+        value = scroll_bar.maximum() * frame // max(frames - 1, 1)
+        start = time.perf_counter()
+        scroll_bar.setValue(value)
+        view.viewport().repaint()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    rows = browser.model.rowCount()
+    browser.close()
+    browser.deleteLater()
+    QApplication.processEvents()
+
+    ordered = sorted(samples)
+    return {
+        "rows": rows,
+        "rss_mib": rss_growth,
+        "load_ms": load_ms,
+        "p50": statistics.median(ordered),
+        "p95": ordered[int(len(ordered) * 0.95) - 1],
+        "max": ordered[-1],
+    }
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="评论浏览面板滚动基准测试")
+    parser.add_argument("--counts", default="1000,10000,100000", help="评论数（逗号分隔）")
+    parser.add_argument("--frames", type=int, default=300, help="每种规模的滚动帧数")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    get_config().dedup_hamming_threshold = -1
+
+    print(f"{'comments':>10}{'rows':>10}{'rss MiB':>10}{'load ms':>10}{'p50':>10}{'p95':>10}{'max':>10}  (ms/frame)")
+    for count in (int(value) for value in args.counts.split(",")):
+        result = bench_scroll(count, args.frames)
+        print(
+            f"{count:>10}{result['rows']:>10}{result['rss_mib']:>10.1f}{result['load_ms']:>10.0f}"
+            f"{result['p50']:>10.3f}{result['p95']:>10.3f}{result['max']:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
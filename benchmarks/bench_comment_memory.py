@@ -0,0 +1,131 @@
+"""
+评论内存占用基准测试
+
+用 tracemalloc 统计每 10 万条评论在三种表示下的内存占用：
+旧版普通 dataclass（带 __dict__、预先格式化时间字符串、昵称不驻留）、
+带 __slots__ 的 Comment，以及按列存储的 CommentBatch
+
+运行方式:
+    python -m benchmarks.bench_comment_memory [--count 100000] [--users 5000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.comment import Comment, CommentBatch
+
+
+@dataclass
+class LegacyComment:
+    """旧版评论结构（用于对比）"""
+    content: str
+    user: str
+    likes: int
+    time: str = ""
+
+
+def make_raw_json(count: int, users: int) -> str:
+    """生成模拟接口返回的评论 JSON
+
+    Args:
+        count: 评论数量
+        users: 不同用户的数量（昵称会在评论间重复）
+
+    Returns:
+        str: 评论数据（JSON 数组）
+    """
+    base = "那年夏天我们在操场上听着这首歌，以为会一直这样下去。"
+    return json.dumps([
+        {
+            "content": base[: 10 + i % 20],
+            "nickname": f"用户{i % users}",
+            "likedCount": i * 7,
+            "time": 1489154520000 + i * 60000,
+            "commentId": 100000000 + i,
+        }
+        for i in range(count)
+    ], ensure_ascii=False)
+
+
+def build_legacy(raw: str) -> list:
+    """按旧版方式构建评论（预先格式化时间，昵称不驻留）"""
+    return [
+        LegacyComment(
+            content=item["content"],
+            user=item["nickname"],
+            likes=item["likedCount"],
+            time=datetime.fromtimestamp(item["time"] / 1000).strftime('%Y-%m-%d %H:%M'),
+        )
+        for item in json.loads(raw)
+    ]
+
+
+def build_slotted(raw: str) -> list:
+    """构建带 __slots__ 的 Comment 列表"""
+    return [
+        Comment(
+            content=item["content"],
+            user=item["nickname"],
+            likes=item["likedCount"],
+            time_ms=item["time"],
+            comment_id=item["commentId"],
+        )
+        for item in json.loads(raw)
+    ]
+
+
+def build_batch(raw: str) -> CommentBatch:
+    """构建按列存储的 CommentBatch"""
+    return CommentBatch(build_slotted(raw))
+
+
+def measure(builder, raw: str) -> int:
+    """测量构建结果常驻的内存（字节）
+
+    Args:
+        builder: 构建函数
+        raw: 评论 JSON（在构建函数内解析，解析出的字符串计入结果）
+
+    Returns:
+        int: 构建完成后仍被结果引用的内存
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = builder(raw)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="评论内存占用基准测试")
+    parser.add_argument("--count", type=int, default=100000, help="评论数量")
+    parser.add_argument("--users", type=int, default=5000, help="不同用户数量")
+    args = parser.parse_args()
+
+    raw = make_raw_json(args.count, args.users)
+    scale = 100000 / args.count
+
+    print(f"{'representation':<16}{'MiB / 100k':>12}{'bytes / item':>14}")
+    for name, builder in (
+        ("legacy", build_legacy),
+        ("slotted", build_slotted),
+        ("batch", build_batch),
+    ):
+        size = measure(builder, raw)
+        print(f"{name:<16}{size * scale / 1024 / 1024:>12.2f}{size / args.count:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
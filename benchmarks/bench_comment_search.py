@@ -0,0 +1,117 @@
+"""
+评论全文搜索基准测试
+
+生成合成评论库（默认 100 万条），统计写入速度和不同关键词的查询延迟；
+评论由随机汉字组成，约 5% 的评论混入一个常见短语，接近真实评论的关键词分布
+
+运行方式:
+    python -m benchmarks.bench_comment_search [--count 1000000] [--db PATH]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.comment_store import CommentStore
+from src.models.comment import Comment
+from src.models.song_info import SongInfo
+
+# 随机正文使用的汉字（常用字区段）
+_CHARS = [chr(code) for code in range(0x4E00, 0x4E00 + 3000)]
+
+# 混入评论的常见短语
+_FRAGMENTS = [
+    "那年夏天", "下雨的夜晚", "一个人走在路上", "耳机里循环这首歌", "高三的晚自习",
+    "后来我们都没有再见", "前奏一响就哭了", "单曲循环一整晚", "毕业那天", "凌晨三点",
+    "想起了外婆", "第一次去看演唱会", "地铁上", "雨一直下", "分手以后", "异地恋的第三年",
+]
+
+# 查询关键词：长关键词走 trigram 索引，短关键词退化为 LIKE
+_QUERIES = ["下雨的夜晚", "演唱会", "单曲循环 一整晚", "异地恋", "外婆"]
+
+# 每首歌的评论数
+_COMMENTS_PER_SONG = 100
+
+
+def make_content(rng: random.Random) -> str:
+    """生成一条合成评论
+
+    Args:
+        rng: 随机数生成器
+
+    Returns:
+        str: 评论内容
+    """
+    text = "".join(rng.choices(_CHARS, k=rng.randrange(10, 60)))
+    if rng.random() < 0.05:
+        pos = rng.randrange(len(text))
+        text = text[:pos] + rng.choice(_FRAGMENTS) + text[pos:]
+    return text
+
+
+def build_corpus(store: CommentStore, count: int, seed: int = 42) -> float:
+    """写入合成评论
+
+    Args:
+        store: 评论库
+        count: 评论数量
+        seed: 随机种子
+
+    Returns:
+        float: 写入耗时（秒）
+    """
+    rng = random.Random(seed)
+    start = time.perf_counter()
+
+    for song_index in range(count // _COMMENTS_PER_SONG):
+        song_id = str(1000000 + song_index)
+        store.save_song(SongInfo(song_id=song_id, name=f"歌曲{song_index}", artist=f"歌手{song_index % 500}"))
+        store.save_comments(song_id, [
+            Comment(
+                content=make_content(rng),
+                user=f"用户{rng.randrange(20000)}",
+                likes=rng.randrange(100000),
+                comment_id=song_index * _COMMENTS_PER_SONG + i + 1,
+            )
+            for i in range(_COMMENTS_PER_SONG)
+        ])
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="评论全文搜索基准测试")
+    parser.add_argument("--count", type=int, default=1000000, help="评论数量")
+    parser.add_argument("--repeat", type=int, default=20, help="每个关键词的查询次数")
+    parser.add_argument("--db", type=Path, default=None, help="评论库路径，默认使用临时文件")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.db or Path(tmp_dir) / "comments.db"
+        store = CommentStore(path)
+
+        if store.count_comments() < args.count:
+            elapsed = build_corpus(store, args.count)
+            print(f"写入 {args.count} 条评论，耗时 {elapsed:.1f} s（{args.count / elapsed:.0f} 条/秒）")
+
+        print(f"{'query':<16}{'hits':>6}{'p50 ms':>10}{'max ms':>10}")
+        for query in _QUERIES:
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                hits = store.search_comments(query, limit=20)
+                timings.append((time.perf_counter() - start) * 1000)
+            print(f"{query:<16}{len(hits):>6}{statistics.median(timings):>10.2f}{max(timings):>10.2f}")
+
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+拖动重绘基准测试
+
+模拟拖动无边框窗口时的连续移动和重绘，对比每次重绘都重新绘制圆角背景
+与使用缓存 pixmap 贴图两种方式的耗时
+
+运行方式:
+    python -m benchmarks.bench_drag_repaint [--moves 2000]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QBrush, QPainter
+from PyQt6.QtWidgets import QApplication
+
+from src.models.song_info import SongInfo
+from src.models.comment import Comment
+
+
+def uncached_paint_event(self, event):
+    """未缓存的背景绘制（每次重绘都重新绘制抗锯齿圆角矩形）"""
+    painter = QPainter(self)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setBrush(QBrush(self.bg_color))
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawRoundedRect(self.rect(), self.CORNER_RADIUS, self.CORNER_RADIUS)
+    painter.end()
+
+
+def bench_drag(cached: bool, moves: int) -> dict:
+    """测量拖动过程中每次重绘的耗时
+
+    Args:
+        cached: 是否使用缓存背景
+        moves: 移动次数
+
+    Returns:
+        dict: 重绘耗时统计（毫秒）
+    """
+    from src.gui.main_window import BackgroundContainer, TransparentWindow
+
+    original_paint = BackgroundContainer.paintEvent
+    if not cached:
+        BackgroundContainer.paintEvent = uncached_paint_event
+
+    try:
+        window = TransparentWindow()
+        window.show()
+        window.update_song(
+            SongInfo(song_id="1", name="浪人情歌", artist="伍佰"),
+            [Comment(content="这首歌陪我度过了很多个夜晚。" * 4, user="用户", likes=1234)]
+        )
+        window.comment_widget.stop_rotation()
+        QApplication.processEvents()
+
+        samples = []
+        origin = window.pos()
+        for i in range(moves):
+            start = time.perf_counter()
+            window.move(origin.x() + i % 200, origin.y() + i % 100)
+            window.repaint()
+            samples.append((time.perf_counter() - start) * 1000)
+
+        window.close()
+        window.deleteLater()
+        QApplication.processEvents()
+    finally:
+        BackgroundContainer.paintEvent = original_paint
+
+    ordered = sorted(samples)
+    return {
+        "p50": statistics.median(ordered),
+        "p95": ordered[int(len(ordered) * 0.95) - 1],
+        "mean": statistics.fmean(ordered),
+    }
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="拖动重绘基准测试")
+    parser.add_argument("--moves", type=int, default=2000, help="移动次数")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+
+    print(f"{'background':<12}{'p50':>10}{'p95':>10}{'mean':>10}  (ms/repaint)")
+    for cached in (False, True):
+        result = bench_drag(cached, args.moves)
+        label = "cached" if cached else "uncached"
+        print(f"{label:<12}{result['p50']:>10.3f}{result['p95']:>10.3f}{result['mean']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
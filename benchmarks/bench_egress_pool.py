@@ -0,0 +1,81 @@
+"""
+出口池吞吐量基准测试
+
+经 1、2、4、8 个本地替身代理并发获取歌曲详情，每个出口限速 --rate 次/秒，
+报告总吞吐量和相对于单出口线性扩展的效率
+
+运行方式:
+    python -m benchmarks.bench_egress_pool [--egresses 1,2,4,8] [--rate 5] [--seconds 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.stub_proxy import StubProxy
+from benchmarks.stub_server import StubNeteaseServer
+from src.config.settings import get_config
+from src.core.egress_pool import EgressPool
+from src.core.netease_crawler import NeteaseMusicCrawler
+
+
+def bench_throughput(server: StubNeteaseServer, count: int, rate: float, seconds: float) -> float:
+    """经 count 个代理获取约 seconds 秒的歌曲详情
+
+    Args:
+        server: 替身服务
+        count: 出口数
+        rate: 每个出口每秒的请求数
+        seconds: 预计时长（决定请求数）
+
+    Returns:
+        float: 总吞吐量（请求/秒）
+    """
+    with ExitStack() as stack:
+        proxies = [stack.enter_context(StubProxy()) for _ in range(count)]
+        crawler = NeteaseMusicCrawler()
+        crawler.egress_pool = EgressPool([proxy.url for proxy in proxies], rate=rate)
+        server.apply_to(crawler)
+
+        total = max(1, int(count * rate * seconds))
+        song_ids = [str(1000 * count + i) for i in range(total)]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=count * 2) as executor:
+            results = list(executor.map(crawler.get_song_detail, song_ids))
+        elapsed = time.perf_counter() - start
+
+        crawler.egress_pool.close()
+
+    assert all(result is not None for result in results)
+    # 每个出口的第一个请求不需要等待，按 total - count 个间隔计算稳态吞吐量
+    return (total - count) / elapsed if elapsed > 0 else 0.0
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="出口池吞吐量基准测试")
+    parser.add_argument("--egresses", default="1,2,4,8", help="出口数（逗号分隔）")
+    parser.add_argument("--rate", type=float, default=5.0, help="每个出口每秒的请求数")
+    parser.add_argument("--seconds", type=float, default=3.0, help="每种规模的预计时长（秒）")
+    args = parser.parse_args()
+
+    config = get_config()
+    config.comment_store_enabled = False
+    config.shared_cache_enabled = False
+
+    print(f"{'egresses':>10}{'req/s':>10}{'ideal':>10}{'scaling':>10}")
+    with StubNeteaseServer(latency=0.02) as server:
+        for count in (int(value) for value in args.egresses.split(",")):
+            throughput = bench_throughput(server, count, args.rate, args.seconds)
+            ideal = count * args.rate
+            print(f"{count:>10}{throughput:>10.1f}{ideal:>10.1f}{throughput / ideal:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+评论渲染基准测试
+
+在 offscreen 平台下对比 QLabel 组合与自绘两种评论渲染方式，
+统计每次轮播的更新耗时、绘制耗时和 CPU 时间
+
+运行方式:
+    python -m benchmarks.bench_renderer [--rotations 500]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtWidgets import QApplication
+
+from src.models.song_info import SongInfo
+from src.models.comment import Comment
+
+
+def make_comments(count: int = 20) -> list[Comment]:
+    """生成长短不一的测试评论
+
+    Args:
+        count: 评论数量
+
+    Returns:
+        list[Comment]: 评论列表
+    """
+    base = "那年夏天我们在操场上听着这首歌，以为会一直这样下去。"
+    return [
+        Comment(content=base * (1 + i % 5), user=f"用户{i}", likes=1000 + i * 37)
+        for i in range(count)
+    ]
+
+
+def bench_renderer(renderer: str, rotations: int) -> dict:
+    """测量一种渲染方式的轮播开销
+
+    Args:
+        renderer: "label" 或 "painted"
+        rotations: 轮播次数
+
+    Returns:
+        dict: 各项耗时的统计结果（毫秒）
+    """
+    from src.config.settings import get_config
+    from src.gui.main_window import TransparentWindow
+
+    get_config().comment_renderer = renderer
+    window = TransparentWindow()
+    window.show()
+    window.update_song(SongInfo(song_id="1", name="浪人情歌", artist="伍佰"), make_comments())
+    QApplication.processEvents()
+
+    widget = window.comment_widget
+    widget.stop_rotation()
+
+    update_ms, paint_ms = [], []
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+
+    for _ in range(rotations):
+        start = time.perf_counter()
+        widget._next_comment()
+        QApplication.processEvents()
+        middle = time.perf_counter()
+        # 同步重绘整个半透明窗口
+        window.repaint()
+        end = time.perf_counter()
+
+        update_ms.append((middle - start) * 1000)
+        paint_ms.append((end - middle) * 1000)
+
+    cpu_ms = (time.process_time() - cpu_start) * 1000
+    wall_ms = (time.perf_counter() - wall_start) * 1000
+
+    window.close()
+    window.deleteLater()
+    QApplication.processEvents()
+
+    return {
+        "update_p50": statistics.median(update_ms),
+        "paint_p50": statistics.median(paint_ms),
+        "cpu_per_rotation": cpu_ms / rotations,
+        "wall_per_rotation": wall_ms / rotations,
+    }
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="评论渲染基准测试")
+    parser.add_argument("--rotations", type=int, default=500, help="轮播次数")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+
+    print(f"{'renderer':<10}{'update p50':>12}{'paint p50':>12}{'cpu/rot':>12}{'wall/rot':>12}  (ms)")
+    for renderer in ("label", "painted"):
+        result = bench_renderer(renderer, args.rotations)
+        print(
+            f"{renderer:<10}{result['update_p50']:>12.3f}{result['paint_p50']:>12.3f}"
+            f"{result['cpu_per_rotation']:>12.3f}{result['wall_per_rotation']:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""
+切歌负载生成器
+
+用脚本化的歌曲来源替换 NeteaseWindowMonitor，用本地替身服务替换 music.163.com，
+驱动真实的 MusicCommentApp 完成 检测 → 获取 → 显示 全流程，模拟几种播放习惯：
+随机播放、快速切歌、反复播放热门歌单、长尾冷门歌曲。
+
+统计每次切歌的 API 调用数、缓存命中率、切歌到评论显示的耗时分位数和限速等待，
+用于为重度切歌用户确定缓存大小和限速参数。
+所有时间按 --speed 加速运行，报告中的时间已换算回应用时间。
+
+运行方式:
+    python -m benchmarks.load_churn [--scenario all] [--tracks 40] [--speed 20]
+        [--cache-size 50] [--min-interval 1.0] [--latency 0.08] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtCore import QEventLoop, QTimer
+
+from benchmarks.stub_server import StubNeteaseServer
+from src.config.settings import get_config
+from src.models.song_info import SongInfo
+
+# 曲库：歌曲 i 的标题为 "歌曲i - 歌手(i % 50)"
+_ARTISTS = 50
+
+
+def _title(index: int) -> tuple[str, str]:
+    """曲库中第 index 首歌的 (歌曲名, 歌手名)"""
+    return f"歌曲{index}", f"歌手{index % _ARTISTS}"
+
+
+# ---- 播放脚本 ----
+
+def shuffle_play(rng: random.Random, tracks: int) -> list[tuple[int, float]]:
+    """随机播放：500 首曲库中随机挑选，每首听 15~60 秒"""
+    return [(rng.randrange(500), rng.uniform(15, 60)) for _ in range(tracks)]
+
+
+def rapid_skip(rng: random.Random, tracks: int) -> list[tuple[int, float]]:
+    """快速切歌：每首只停留 0.3~3 秒"""
+    return [(rng.randrange(500), rng.uniform(0.3, 3)) for _ in range(tracks)]
+
+
+def hot_set(rng: random.Random, tracks: int) -> list[tuple[int, float]]:
+    """热门歌单：80% 的时间在 10 首歌之间循环，每首 5~30 秒"""
+    return [
+        (rng.randrange(10) if rng.random() < 0.8 else rng.randrange(10, 500), rng.uniform(5, 30))
+        for _ in range(tracks)
+    ]
+
+
+def long_tail(rng: random.Random, tracks: int) -> list[tuple[int, float]]:
+    """长尾冷门：几乎每首都是新歌，每首 5~20 秒"""
+    return [(rng.randrange(100000), rng.uniform(5, 20)) for _ in range(tracks)]
+
+
+SCENARIOS = {
+    "shuffle": shuffle_play,
+    "skip": rapid_skip,
+    "hot_set": hot_set,
+    "long_tail": long_tail,
+}
+
+
+class ScriptedSongSource:
+    """脚本化的歌曲来源（替代 NeteaseWindowMonitor）
+
+    由负载生成器切换当前歌曲，应用定时检测时读到的就是脚本中的当前歌曲
+    """
+
+    def __init__(self):
+        """初始化歌曲来源"""
+        self.current: Optional[tuple[str, str]] = None
+
+    def get_current_song(self) -> Optional[SongInfo]:
+        """获取当前播放的歌曲（与 NeteaseWindowMonitor 接口一致）"""
+        if self.current is None:
+            return None
+        name, artist = self.current
+        return SongInfo(song_id="", name=name, artist=artist)
+
+
+@dataclass
+class ScenarioReport:
+    """单个场景的统计结果（时间均为应用时间）"""
+    scenario: str
+    song_changes: int = 0
+    displayed: int = 0
+    abandoned: int = 0
+    api_calls: dict = field(default_factory=dict)
+    api_calls_per_change: float = 0.0
+    detail_hit_ratio: float = 0.0
+    comments_hit_ratio: float = 0.0
+    ttc_p50_ms: float = 0.0
+    ttc_p95_ms: float = 0.0
+    ttc_max_ms: float = 0.0
+    rate_limit_stalls: int = 0
+    rate_limit_stall_s: float = 0.0
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """简单分位数（最近秩）"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _hit_ratio(info) -> float:
+    """lru_cache 命中率"""
+    total = info.hits + info.misses
+    return info.hits / total if total else 0.0
+
+
+class ChurnDriver:
+    """负载驱动器：持有一个应用实例和替身服务，依次运行各场景"""
+
+    def __init__(self, speed: float, cache_size: int, min_interval: float, latency: float):
+        """初始化驱动器
+
+        Args:
+            speed: 时间加速倍数
+            cache_size: 歌曲详情/评论缓存大小
+            min_interval: 爬虫最小请求间隔（应用时间，秒）
+            latency: 替身服务每个请求的延迟（应用时间，秒）
+        """
+        from src.main import MusicCommentApp
+        from src.core.netease_crawler import NeteaseMusicCrawler
+
+        self.speed = speed
+
+        # 不写用户目录下的评论库和会话快照；爬虫按 cache_size 创建缓存
+        config = get_config()
+        config.comment_store_enabled = False
+        config.shared_cache_enabled = False
+        config.cache_size = cache_size
+
+        self.server = StubNeteaseServer(latency=latency / speed).start()
+
+        self.app = MusicCommentApp()
+        self.app._save_snapshot = lambda: None
+        self.source = ScriptedSongSource()
+        self.app.monitor = self.source
+        self.app.timer.setInterval(max(1, int(self.app.CHECK_INTERVAL / speed)))
+
+        crawler = NeteaseMusicCrawler()
+        crawler.min_interval = min_interval / speed
+        self.server.apply_to(crawler)
+
+        # 统计限速等待
+        self._stalls: list[float] = []
+        original_rate_limit = crawler._rate_limit
+
+        def timed_rate_limit():
+            start = time.perf_counter()
+            egress = original_rate_limit()
+            waited = time.perf_counter() - start
+            if waited > 0.0005:
+                self._stalls.append(waited)
+            return egress
+
+        crawler._rate_limit = timed_rate_limit
+        self.crawler = crawler
+        self.app._crawler = crawler
+
+        # 记录评论显示时间（过期结果在 _on_song_data_ready 中已被丢弃）
+        self._change_times: dict[tuple[str, str], float] = {}
+        self._ttc: list[float] = []
+        original_update = self.app.window.update_song
+
+        def timed_update(song_info, comments, start_index=0):
+            key = (self.app.current_song_name, self.app.current_artist_name)
+            changed_at = self._change_times.pop(key, None)
+            if changed_at is not None:
+                self._ttc.append(time.perf_counter() - changed_at)
+            original_update(song_info, comments, start_index)
+
+        self.app.window.update_song = timed_update
+
+    def run(self, name: str, script: list[tuple[int, float]]) -> ScenarioReport:
+        """运行一个场景
+
+        Args:
+            name: 场景名
+            script: [(曲库下标, 停留时间（应用时间，秒）)]
+
+        Returns:
+            ScenarioReport: 统计结果
+        """
+        # 重置状态
+        self.server.reset_counters()
+        self.crawler.get_song_detail.cache_clear()
+        self.crawler.get_hot_comments.cache_clear()
+        self.app.current_song_name = self.app.current_artist_name = ""
+        self.source.current = None
+        self._change_times.clear()
+        self._ttc.clear()
+        self._stalls.clear()
+
+        report = ScenarioReport(scenario=name)
+        loop = QEventLoop()
+        steps = iter(script)
+
+        def next_step():
+            step = next(steps, None)
+            if step is None:
+                # 等待最后一首歌的获取完成后结束
+                QTimer.singleShot(int(5000 / self.speed), loop.quit)
+                return
+
+            index, dwell = step
+            title = _title(index)
+            if title != self.source.current:
+                report.song_changes += 1
+                # 上一首还没显示就被切走
+                report.abandoned += len(self._change_times)
+                self._change_times.clear()
+                self._change_times[title] = time.perf_counter()
+                self.source.current = title
+            QTimer.singleShot(max(1, int(dwell * 1000 / self.speed)), next_step)
+
+        self.app.timer.start()
+        QTimer.singleShot(0, next_step)
+        loop.exec()
+        self.app.timer.stop()
+
+        report.abandoned += len(self._change_times)
+        report.displayed = len(self._ttc)
+        report.api_calls = dict(self.server.request_counts)
+        report.api_calls_per_change = sum(report.api_calls.values()) / max(1, report.song_changes)
+        report.detail_hit_ratio = _hit_ratio(self.crawler.get_song_detail.cache_info())
+        report.comments_hit_ratio = _hit_ratio(self.crawler.get_hot_comments.cache_info())
+
+        ttc_ms = [t * self.speed * 1000 for t in self._ttc]
+        report.ttc_p50_ms = statistics.median(ttc_ms) if ttc_ms else 0.0
+        report.ttc_p95_ms = _percentile(ttc_ms, 95)
+        report.ttc_max_ms = max(ttc_ms, default=0.0)
+        report.rate_limit_stalls = len(self._stalls)
+        report.rate_limit_stall_s = sum(self._stalls) * self.speed
+        return report
+
+    def close(self) -> None:
+        """停止后台线程和替身服务"""
+        self.app._scheduler.shutdown(wait=True, cancel_futures=True)
+        self.server.stop()
+
+
+def format_reports(reports: list[ScenarioReport]) -> str:
+    """格式化为表格"""
+    header = (
+        f"{'scenario':<10}{'changes':>8}{'shown':>7}{'abandon':>8}{'api/chg':>9}"
+        f"{'detail hit':>11}{'cmt hit':>9}{'ttc p50':>9}{'ttc p95':>9}{'ttc max':>9}"
+        f"{'stalls':>8}{'stall s':>9}"
+    )
+    lines = [header]
+    for r in reports:
+        lines.append(
+            f"{r.scenario:<10}{r.song_changes:>8}{r.displayed:>7}{r.abandoned:>8}"
+            f"{r.api_calls_per_change:>9.2f}{r.detail_hit_ratio:>11.0%}{r.comments_hit_ratio:>9.0%}"
+            f"{r.ttc_p50_ms:>9.0f}{r.ttc_p95_ms:>9.0f}{r.ttc_max_ms:>9.0f}"
+            f"{r.rate_limit_stalls:>8}{r.rate_limit_stall_s:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="切歌负载生成器")
+    parser.add_argument("--scenario", default="all", choices=["all", *SCENARIOS], help="场景")
+    parser.add_argument("--tracks", type=int, default=40, help="每个场景的切歌次数")
+    parser.add_argument("--speed", type=float, default=20, help="时间加速倍数")
+    parser.add_argument("--cache-size", type=int, default=get_config().cache_size, help="详情/评论缓存大小")
+    parser.add_argument("--min-interval", type=float, default=1.0, help="爬虫最小请求间隔（秒）")
+    parser.add_argument("--latency", type=float, default=0.08, help="替身服务请求延迟（秒）")
+    parser.add_argument("--seed", type=int, default=1, help="随机种子")
+    parser.add_argument("--json", default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    names = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+    driver = ChurnDriver(args.speed, args.cache_size, args.min_interval, args.latency)
+    try:
+        reports = [
+            driver.run(name, SCENARIOS[name](random.Random(args.seed), args.tracks))
+            for name in names
+        ]
+    finally:
+        driver.close()
+
+    print(
+        f"cache_size={args.cache_size} min_interval={args.min_interval}s "
+        f"latency={args.latency}s speed={args.speed}x（时间为应用时间，ttc 单位 ms）"
+    )
+    print(format_reports(reports))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([asdict(r) for r in reports], f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
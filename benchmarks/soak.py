@@ -0,0 +1,341 @@
+"""
+长时间运行（soak）测试
+
+用虚拟时钟在几分钟内模拟数周的使用：按播放脚本切歌、定时检测、评论轮播、
+每天夜间隐藏窗口数小时。歌曲来源使用脚本化替身，API 使用本地替身服务，
+驱动的是真实的 MusicCommentApp（离屏 Qt）。
+
+每隔若干虚拟小时采样进程 RSS、Python 对象数和 Qt 对象数；跳过预热期后按
+最小二乘估计每个虚拟日的增长量，超过预算时以非零退出码结束，用于发现
+定时器、缓存等随运行时间累积的泄漏。
+
+运行方式:
+    python -m benchmarks.soak [--days 14] [--sample-hours 6] [--warmup-days 1]
+        [--rss-budget 1.0] [--object-budget 500] [--qt-budget 1] [--json out.json]
+"""
+
+import argparse
+import gc
+import heapq
+import itertools
+import json
+import logging
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6 import sip
+from PyQt6.QtCore import QEventLoop, QObject, QTimer
+
+from benchmarks.load_churn import ScriptedSongSource, _title
+from benchmarks.stub_server import StubNeteaseServer
+from src.config.settings import get_config
+from src.utils.logger import get_logger
+
+DAY = 86400.0
+HOUR = 3600.0
+
+
+class VirtualClock:
+    """虚拟时钟：按时间顺序执行计划任务，不真正等待"""
+
+    def __init__(self):
+        """初始化时钟（从 0 秒开始）"""
+        self.now = 0.0
+        self._queue: list[tuple[float, int, Callable[[], None]]] = []
+        self._seq = itertools.count()
+
+    def call_at(self, when: float, callback: Callable[[], None]) -> None:
+        """在虚拟时间 when 执行 callback
+
+        Args:
+            when: 虚拟时间（秒）
+            callback: 回调
+        """
+        heapq.heappush(self._queue, (when, next(self._seq), callback))
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> None:
+        """在 delay 秒（虚拟时间）后执行 callback
+
+        Args:
+            delay: 延迟（秒）
+            callback: 回调
+        """
+        self.call_at(self.now + delay, callback)
+
+    def run_until(self, end: float) -> None:
+        """执行所有不晚于 end 的任务，并把时钟推进到 end
+
+        Args:
+            end: 结束时间（秒）
+        """
+        while self._queue and self._queue[0][0] <= end:
+            when, _, callback = heapq.heappop(self._queue)
+            self.now = when
+            callback()
+        self.now = end
+
+
+@dataclass
+class Sample:
+    """一次采样"""
+    day: float
+    rss_mib: float
+    py_objects: int
+    qt_objects: int
+    song_changes: int
+    rotations: int
+
+
+@dataclass
+class Growth:
+    """某项指标在预热期之后的每日增长"""
+    metric: str
+    per_day: float
+    budget: float
+
+    @property
+    def ok(self) -> bool:
+        return self.per_day <= self.budget
+
+
+def rss_mib() -> float:
+    """当前进程常驻内存（MiB）"""
+    import psutil
+
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+def count_qt_objects(app) -> int:
+    """统计存活的 Qt 对象数
+
+    包括所有顶层窗口和 QApplication 的子对象树，以及 Python 持有的无父对象
+    （如未设置父对象的 QTimer），按 C++ 地址去重
+
+    Args:
+        app: QApplication 实例
+
+    Returns:
+        int: Qt 对象数
+    """
+    addresses = set()
+    for root in (app, *app.topLevelWidgets()):
+        addresses.add(sip.unwrapinstance(root))
+        addresses.update(sip.unwrapinstance(child) for child in root.findChildren(QObject))
+
+    for obj in gc.get_objects():
+        if isinstance(obj, QObject) and not sip.isdeleted(obj):
+            addresses.add(sip.unwrapinstance(obj))
+    return len(addresses)
+
+
+def growth_per_day(samples: list[Sample], metric: str, warmup_days: float) -> float:
+    """最小二乘估计预热期之后的每日增长量
+
+    Args:
+        samples: 采样序列
+        metric: 指标字段名
+        warmup_days: 预热天数（缓存填充等一次性增长不计入）
+
+    Returns:
+        float: 每个虚拟日的增长量
+    """
+    points = [(s.day, getattr(s, metric)) for s in samples if s.day >= warmup_days]
+    if len(points) < 2:
+        return 0.0
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+class SoakDriver:
+    """soak 驱动器：把应用的定时行为映射到虚拟时钟上"""
+
+    # 每天夜间隐藏窗口的时间段（虚拟时间，小时）
+    HIDE_AT_HOUR = 1
+    HIDE_HOURS = 7
+
+    def __init__(self, seed: int, latency: float):
+        """初始化驱动器
+
+        Args:
+            seed: 播放脚本随机种子
+            latency: 替身服务请求延迟（秒，真实时间）
+        """
+        from src.main import MusicCommentApp
+
+        # 不写用户目录下的评论库和会话快照；逐条切歌日志会淹没日志文件
+        get_config().comment_store_enabled = False
+        get_config().shared_cache_enabled = False
+        get_logger().setLevel(logging.WARNING)
+
+        # 替身服务与应用在同一进程，关闭其评论缓存以免计入增长
+        self.server = StubNeteaseServer(latency=latency, cache_comments=False).start()
+
+        self.app = MusicCommentApp()
+        self.app._save_snapshot = lambda: None
+        self.source = ScriptedSongSource()
+        self.app.monitor = self.source
+        self.server.apply_to(self.app.crawler)
+        self.app.crawler.min_interval = 0
+
+        self.widget = self.app.window.comment_widget
+        self.clock = VirtualClock()
+        self.rng = random.Random(seed)
+        self.song_changes = 0
+        self.rotations = 0
+
+        # 等待后台获取完成用的事件循环和超时定时器（复用，不计入 Qt 对象增长）
+        self._loop = QEventLoop()
+        self.app._signals.song_data_ready.connect(self._loop.quit)
+        self._timeout = QTimer()
+        self._timeout.setSingleShot(True)
+        self._timeout.timeout.connect(self._loop.quit)
+
+    # ---- 虚拟时钟上的定时行为 ----
+
+    def _next_track(self) -> None:
+        """切到下一首：八成时间在 30 首常听歌曲中，其余为冷门歌曲"""
+        index = self.rng.randrange(30) if self.rng.random() < 0.8 else self.rng.randrange(30, 100000)
+        title = _title(index)
+        if title != self.source.current:
+            self.song_changes += 1
+            self.source.current = title
+        self.clock.call_later(self.rng.uniform(150, 330), self._next_track)
+
+    def _check(self) -> None:
+        """应用的歌曲检测定时器（隐藏时按降频后的间隔）"""
+        self.app.check_and_update()
+        if self.app._fetch_in_flight:
+            self._wait_for_fetch()
+        self.clock.call_later(self.app.timer.interval() / 1000, self._check)
+
+    def _rotate(self) -> None:
+        """评论轮播定时器（组件停止轮播时跳过）"""
+        if self.widget.timer.isActive():
+            self.widget._next_comment()
+            self.rotations += 1
+        self.clock.call_later(self.widget.config.rotation_interval / 1000, self._rotate)
+
+    def _hide(self) -> None:
+        """夜间隐藏窗口，数小时后恢复"""
+        self.app.window.hide()
+        self.clock.call_later(self.HIDE_HOURS * HOUR, self.app.window.show)
+        self.clock.call_later(DAY, self._hide)
+
+    def _wait_for_fetch(self) -> None:
+        """处理 Qt 事件直到后台获取结果送达界面"""
+        while self.app._fetch_in_flight:
+            self._timeout.start(10000)
+            self._loop.exec()
+            self._timeout.stop()
+
+    # ---- 采样 ----
+
+    def sample(self) -> Sample:
+        """回收垃圾后采样一次"""
+        self.app.app.processEvents()
+        gc.collect()
+        return Sample(
+            day=round(self.clock.now / DAY, 3),
+            rss_mib=round(rss_mib(), 2),
+            py_objects=len(gc.get_objects()),
+            qt_objects=count_qt_objects(self.app.app),
+            song_changes=self.song_changes,
+            rotations=self.rotations,
+        )
+
+    def run(self, days: float, sample_hours: float, progress: bool = True) -> list[Sample]:
+        """运行 days 个虚拟日
+
+        Args:
+            days: 虚拟天数
+            sample_hours: 采样间隔（虚拟小时）
+            progress: 是否打印每次采样
+
+        Returns:
+            list[Sample]: 采样序列
+        """
+        self.app.window.show()
+        self.clock.call_at(0, self._next_track)
+        self.clock.call_at(0, self._check)
+        self.clock.call_at(0, self._rotate)
+        self.clock.call_at(self.HIDE_AT_HOUR * HOUR, self._hide)
+
+        samples = []
+        step = sample_hours * HOUR
+        now = 0.0
+        while now <= days * DAY:
+            self.clock.run_until(now)
+            sample = self.sample()
+            samples.append(sample)
+            if progress:
+                print(
+                    f"day {sample.day:6.2f}  rss {sample.rss_mib:8.2f} MiB  "
+                    f"objects {sample.py_objects:>8}  qt {sample.qt_objects:>6}  "
+                    f"songs {sample.song_changes:>6}  rotations {sample.rotations:>7}",
+                    flush=True,
+                )
+            now += step
+        return samples
+
+    def close(self) -> None:
+        """停止后台线程和替身服务"""
+        self.app._scheduler.shutdown(wait=True, cancel_futures=True)
+        self.server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="长时间运行（soak）测试")
+    parser.add_argument("--days", type=float, default=14, help="模拟的天数")
+    parser.add_argument("--sample-hours", type=float, default=6, help="采样间隔（虚拟小时）")
+    parser.add_argument("--warmup-days", type=float, default=1, help="预热天数，不计入增长")
+    parser.add_argument("--rss-budget", type=float, default=1.0, help="RSS 每日增长预算（MiB）")
+    parser.add_argument("--object-budget", type=float, default=500, help="Python 对象每日增长预算")
+    parser.add_argument("--qt-budget", type=float, default=1, help="Qt 对象每日增长预算")
+    parser.add_argument("--latency", type=float, default=0.0, help="替身服务请求延迟（秒）")
+    parser.add_argument("--seed", type=int, default=1, help="随机种子")
+    parser.add_argument("--json", default=None, help="把采样和结论写入 JSON 文件")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    driver = SoakDriver(args.seed, args.latency)
+    try:
+        samples = driver.run(args.days, args.sample_hours)
+    finally:
+        driver.close()
+    elapsed = time.perf_counter() - started
+
+    growths = [
+        Growth("rss_mib", growth_per_day(samples, "rss_mib", args.warmup_days), args.rss_budget),
+        Growth("py_objects", growth_per_day(samples, "py_objects", args.warmup_days), args.object_budget),
+        Growth("qt_objects", growth_per_day(samples, "qt_objects", args.warmup_days), args.qt_budget),
+    ]
+
+    print(f"\n模拟 {args.days:g} 天，用时 {elapsed:.0f} s；预热 {args.warmup_days:g} 天后的每日增长：")
+    for g in growths:
+        print(f"  {g.metric:<12}{g.per_day:>12.2f} / 天（预算 {g.budget:g}）  {'OK' if g.ok else '超出预算'}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "samples": [asdict(s) for s in samples],
+                "growth": [{**asdict(g), "ok": g.ok} for g in growths],
+            }, f, indent=2, ensure_ascii=False)
+
+    if not all(g.ok for g in growths):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
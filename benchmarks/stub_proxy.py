@@ -0,0 +1,115 @@
+"""
+本地替身 HTTP 代理
+
+在 127.0.0.1 上转发明文 HTTP 代理请求（请求行为绝对 URL），用于离线测试出口池：
+统计经过本代理的请求数，可以模拟固定延迟，或切换为故障状态（直接返回 502）
+
+用法:
+    with StubNeteaseServer() as server, StubProxy() as proxy:
+        crawler.egress_pool = EgressPool([proxy.url])
+        ...
+"""
+
+import http.client
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+# 不转发的逐跳头部
+_HOP_HEADERS = {"connection", "keep-alive", "proxy-connection", "proxy-authorization", "te", "trailers",
+                "transfer-encoding", "upgrade"}
+
+
+class StubProxy:
+    """本地替身 HTTP 代理
+
+    Attributes:
+        requests: 收到的请求数（包括故障状态下拒绝的）
+        failing: 为 True 时所有请求返回 502
+    """
+
+    def __init__(self, latency: float = 0.0, failing: bool = False):
+        """创建代理（绑定随机端口，调用 start 后开始服务）
+
+        Args:
+            latency: 每个请求额外增加的延迟（秒）
+            failing: 初始是否为故障状态
+        """
+        self.latency = latency
+        self.failing = failing
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread = None
+
+    @property
+    def url(self) -> str:
+        """代理地址（用作出口描述）"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubProxy":
+        """在后台线程启动代理"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-proxy", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """停止代理"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubProxy":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _make_handler(self):
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _forward(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length) if length else None
+                with proxy._lock:
+                    proxy.requests += 1
+
+                if proxy.latency:
+                    time.sleep(proxy.latency)
+                if proxy.failing:
+                    self.send_error(502, "stub proxy failing")
+                    return
+
+                target = urlsplit(self.path)
+                path = target.path + (f"?{target.query}" if target.query else "")
+                headers = {k: v for k, v in self.headers.items() if k.lower() not in _HOP_HEADERS}
+
+                upstream = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=10)
+                try:
+                    upstream.request(self.command, path, body=body, headers=headers)
+                    response = upstream.getresponse()
+                    payload = response.read()
+                finally:
+                    upstream.close()
+
+                self.send_response(response.status)
+                for key, value in response.getheaders():
+                    if key.lower() not in _HOP_HEADERS and key.lower() != "content-length":
+                        self.send_header(key, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = _forward
+            do_POST = _forward
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,361 @@
+"""
+本地网易云 API 替身服务
+
+在 127.0.0.1 上模拟搜索、歌曲详情、歌词和 weapi 评论接口，供基准测试和负载测试离线使用。
+客户端加密使用固定随机密钥，替身服务可以直接解密 weapi 参数，从而支持真实的分页游标
+
+用法:
+    with StubNeteaseServer(latency=0.02) as server:
+        server.apply_to(crawler)
+        ...
+"""
+
+import base64
+import json
+import random
+import struct
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from src.core.crypto import NeteaseCrypto
+
+# 评论接口路径
+COMMENT_PATH = "/weapi/comment/resource/comments/get"
+
+# 合成评论使用的短语
+_PHRASES = [
+    "那年夏天", "下雨的夜晚", "一个人走在路上", "耳机里循环这首歌", "高三的晚自习",
+    "后来我们都没有再见", "前奏一响就哭了", "单曲循环一整晚", "毕业那天", "凌晨三点",
+    "想起了外婆", "第一次去看演唱会", "地铁上", "雨一直下", "分手以后", "异地恋的第三年",
+]
+
+
+def decrypt_weapi_params(params: str) -> dict:
+    """解密 weapi 请求参数（与 NeteaseCrypto.encrypt_request 相反）
+
+    Args:
+        params: 请求中的 params 字段
+
+    Returns:
+        dict: 原始请求数据
+    """
+    from Crypto.Cipher import AES
+    from Crypto.Util.Padding import unpad
+
+    def aes_decrypt(text: str, key: str) -> str:
+        cipher = AES.new(key.encode("utf-8"), AES.MODE_CBC, NeteaseCrypto.AES_IV.encode("utf-8"))
+        return unpad(cipher.decrypt(base64.b64decode(text)), AES.block_size).decode("utf-8")
+
+    inner = aes_decrypt(params, NeteaseCrypto.FIXED_RANDOM)
+    return json.loads(aes_decrypt(inner, NeteaseCrypto.AES_KEY))
+
+
+def make_comments(song_id: int, count: int) -> list[dict]:
+    """确定性生成某首歌的评论（按时间倒序）
+
+    Args:
+        song_id: 歌曲ID（作为随机种子）
+        count: 评论数量
+
+    Returns:
+        list[dict]: 接口格式的评论数据
+    """
+    rng = random.Random(song_id)
+    return [
+        {
+            "commentId": song_id * 10000 + i,
+            "content": "，".join(rng.sample(_PHRASES, 2)) + f"（{i}）",
+            "user": {"nickname": f"用户{rng.randrange(5000)}"},
+            "likedCount": rng.randrange(100000),
+            "time": 1700000000000 - i * 60000,
+        }
+        for i in range(count)
+    ]
+
+
+def make_png(width: int, height: int, seed: str) -> bytes:
+    """生成纯色 PNG 图片（颜色由 seed 决定），用作头像和封面
+
+    Args:
+        width: 宽度
+        height: 高度
+        seed: 颜色种子
+
+    Returns:
+        bytes: PNG 文件内容
+    """
+    crc = zlib.crc32(seed.encode("utf-8"))
+    pixel = bytes([crc & 0xFF, (crc >> 8) & 0xFF, (crc >> 16) & 0xFF])
+    raw = b"".join(b"\x00" + pixel * width for _ in range(height))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw))
+        + chunk(b"IEND", b"")
+    )
+
+
+def song_id_for(keywords: str) -> int:
+    """由搜索关键词得到稳定的歌曲ID
+
+    Args:
+        keywords: 搜索关键词
+
+    Returns:
+        int: 歌曲ID
+    """
+    return 100000 + zlib.crc32(keywords.encode("utf-8")) % 900000000
+
+
+class StubNeteaseServer:
+    """网易云 API 替身服务
+
+    每首歌的评论按歌曲ID确定性生成；记录各接口的请求次数和响应字节数
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        hot_comments: int = 20,
+        total_comments: int = 200,
+        cache_comments: bool = True,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """初始化替身服务
+
+        Args:
+            latency: 每个请求的模拟延迟（秒）
+            hot_comments: 每首歌的热门评论数
+            total_comments: 每首歌的评论总数（分页接口）
+            cache_comments: 是否缓存生成的评论；长时间运行的测试关闭缓存，避免替身服务自身的内存增长
+            host: 监听地址
+            port: 监听端口，0 表示随机端口
+        """
+        self.latency = latency
+        self.hot_comments = hot_comments
+        self.total_comments = total_comments
+        self.cache_comments = cache_comments
+
+        self.request_counts: Counter = Counter()
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._comment_cache: dict[int, list[dict]] = {}
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """服务地址，如 http://127.0.0.1:54321"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def apply_to(self, crawler) -> None:
+        """把爬虫实例的接口地址指向替身服务
+
+        Args:
+            crawler: NeteaseMusicCrawler 实例
+        """
+        crawler.BASE_URL = f"{self.base_url}/api"
+        crawler.COMMENT_URL = f"{self.base_url}{COMMENT_PATH}?csrf_token="
+
+    def start(self) -> "StubNeteaseServer":
+        """在后台线程启动服务"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-netease", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """停止服务"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubNeteaseServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def reset_counters(self) -> None:
+        """清零请求计数和字节数"""
+        with self._lock:
+            self.request_counts.clear()
+            self.bytes_sent = 0
+
+    def comments_for(self, song_id: int) -> list[dict]:
+        """某首歌的全部评论（按时间倒序，确定性生成）
+
+        Args:
+            song_id: 歌曲ID
+
+        Returns:
+            list[dict]: 接口格式的评论数据
+        """
+        if not self.cache_comments:
+            return make_comments(song_id, self.total_comments)
+
+        with self._lock:
+            comments = self._comment_cache.get(song_id)
+            if comments is None:
+                comments = self._comment_cache[song_id] = make_comments(song_id, self.total_comments)
+        return comments
+
+    def post_comments(self, song_id: int, count: int, like_bump: int = 0) -> None:
+        """模拟评论区的变化：在最前面加入 count 条新评论，已有评论的点赞数增加 like_bump
+
+        Args:
+            song_id: 歌曲ID
+            count: 新评论数
+            like_bump: 已有评论增加的点赞数
+        """
+        comments = self.comments_for(song_id)
+        rng = random.Random(song_id + len(comments))
+        newest = comments[0]["time"] if comments else 1700000000000
+        fresh = [
+            {
+                "commentId": song_id * 10000 + len(comments) + i,
+                "content": "，".join(rng.sample(_PHRASES, 2)) + f"（新{i}）",
+                "user": {"nickname": f"用户{rng.randrange(5000)}"},
+                "likedCount": rng.randrange(100),
+                "time": newest + (count - i) * 60000,
+            }
+            for i in range(count)
+        ]
+        with self._lock:
+            self._comment_cache[song_id] = fresh + [
+                {**comment, "likedCount": comment["likedCount"] + like_bump} for comment in comments
+            ]
+
+    # ---- 各接口响应 ----
+
+    def _search(self, query: dict) -> dict:
+        keywords = query.get("s", [""])[0]
+        name = keywords.split(" ")[0]
+        return {"code": 200, "result": {"songs": [{"id": song_id_for(keywords), "name": name}]}}
+
+    def _detail(self, query: dict) -> dict:
+        song_id = int(json.loads(query.get("ids", ["[0]"])[0])[0])
+        return {
+            "code": 200,
+            "songs": [{
+                "id": song_id,
+                "name": f"歌曲{song_id}",
+                "artists": [{"name": f"歌手{song_id % 100}"}],
+                "album": {
+                    "name": f"专辑{song_id % 1000}", "type": "Album", "subType": "录音室版",
+                    "picUrl": f"{self.base_url}/img/album{song_id % 1000}.png",
+                },
+                "duration": 240000,
+            }],
+        }
+
+    def _lyric(self, query: dict) -> dict:
+        """确定性生成 LRC 歌词：每 5 秒一行，共 48 行；歌曲ID 为 10 的倍数时视为纯音乐"""
+        song_id = int(query.get("id", ["0"])[0])
+        if song_id % 10 == 0:
+            return {"code": 200, "nolyric": True}
+
+        rng = random.Random(song_id)
+        lines = [f"[{i * 5 // 60:02d}:{i * 5 % 60:02d}.00]{rng.choice(_PHRASES)}" for i in range(48)]
+        return {"code": 200, "lrc": {"version": 1, "lyric": "\n".join(lines)}}
+
+    def _comments(self, request: dict) -> dict:
+        song_id = int(request["rid"].rsplit("_", 1)[-1])
+        page_no = int(request.get("pageNo", 1))
+        page_size = int(request.get("pageSize", 20))
+        comments = self.comments_for(song_id)
+
+        # 游标为上一页最后一条评论的时间；第一页为 "-1"
+        cursor = request.get("cursor", "-1")
+        if cursor in ("-1", ""):
+            start = (page_no - 1) * page_size
+        else:
+            start = next((i for i, c in enumerate(comments) if c["time"] < int(cursor)), len(comments))
+
+        page = [self._with_avatar(c) for c in comments[start:start + page_size]]
+        hot = [
+            self._with_avatar(c)
+            for c in sorted(comments, key=lambda c: c["likedCount"], reverse=True)[:self.hot_comments]
+        ]
+        return {
+            "code": 200,
+            "data": {
+                "hotComments": hot if page_no == 1 else [],
+                "comments": page,
+                "cursor": str(page[-1]["time"]) if page else "",
+                "hasMore": start + page_size < len(comments),
+                "totalCount": len(comments),
+            },
+        }
+
+    def _with_avatar(self, comment: dict) -> dict:
+        """给评论的用户加上指向替身服务的头像地址"""
+        nickname = comment["user"]["nickname"]
+        return {**comment, "user": {"nickname": nickname, "avatarUrl": f"{self.base_url}/img/{nickname}.png"}}
+
+    def _image(self, path: str, query: dict) -> bytes:
+        """按 ?param=宽y高 生成缩略图（默认 64x64）"""
+        width, _, height = query.get("param", ["64y64"])[0].partition("y")
+        return make_png(int(width), int(height or width), path)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # 头部和正文分两次写出，关闭 Nagle 避免与延迟确认叠加出 40ms 停顿
+            disable_nagle_algorithm = True
+
+            def _respond(self, endpoint: str, payload, content_type: str = "application/json; charset=utf-8") -> None:
+                if server.latency:
+                    time.sleep(server.latency)
+                body = payload if isinstance(payload, bytes) else json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                # 先计数再回复：客户端收到响应后立即读取计数也不会漏计
+                with server._lock:
+                    server.request_counts[endpoint] += 1
+                    server.bytes_sent += len(body)
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                if url.path == "/api/search/get/web":
+                    self._respond("search", server._search(query))
+                elif url.path == "/api/song/detail":
+                    self._respond("detail", server._detail(query))
+                elif url.path == "/api/song/lyric":
+                    self._respond("lyric", server._lyric(query))
+                elif url.path.startswith("/img/"):
+                    self._respond("image", server._image(url.path, query), "image/png")
+                else:
+                    self.send_error(404)
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                length = int(self.headers.get("Content-Length", 0))
+                form = parse_qs(self.rfile.read(length).decode("utf-8"))
+                if url.path == COMMENT_PATH:
+                    request = decrypt_weapi_params(form["params"][0])
+                    self._respond("comments", server._comments(request))
+                else:
+                    self.send_error(404)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,412 @@
+"""
+核心基准测试套件（带回归跟踪）
+
+覆盖加密、窗口标题解析、评论 JSON 解析、各级缓存，以及针对本地替身服务的完整
+fetch_song_data 流程；全部离线运行。结果可追加到 benchmarks/history.json，
+compare 命令对比两次结果，中位数变慢超过阈值即视为回归（退出码 1）
+
+运行方式:
+    python -m benchmarks.suite run [-k encrypt] [--save] [--compare] [--threshold 0.15]
+    python -m benchmarks.suite compare [--base -2] [--head -1] [--threshold 0.15]
+    python -m benchmarks.suite list
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Iterator, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config.settings import get_config
+
+# 基准结果历史文件
+HISTORY_PATH = Path(__file__).with_name("history.json")
+
+# 默认回归阈值（中位数变慢 15%）
+DEFAULT_THRESHOLD = 0.15
+
+# 基准注册表：名称 -> 准备函数（生成器，yield 被测操作，结束后清理）
+BENCHMARKS: dict[str, Callable[[], Iterator[Callable[[], object]]]] = {}
+
+
+def benchmark(name: str):
+    """注册基准测试
+
+    被装饰的函数是一个生成器：完成准备工作后 yield 被测操作（无参可调用对象），
+    测量结束后生成器继续执行清理代码
+
+    Args:
+        name: 基准名称
+
+    Returns:
+        装饰器
+    """
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def _make_crawler():
+    """创建不写本地评论库、不限速的爬虫实例"""
+    from src.core.netease_crawler import NeteaseMusicCrawler
+
+    get_config().comment_store_enabled = False
+    get_config().shared_cache_enabled = False
+    crawler = NeteaseMusicCrawler()
+    crawler.min_interval = 0
+    return crawler
+
+
+def _sample_comment_payload() -> bytes:
+    """一首歌的评论接口响应（20 条热门评论）"""
+    from benchmarks.stub_server import make_comments
+
+    payload = {"code": 200, "data": {"hotComments": make_comments(347230, 20), "comments": [], "totalCount": 200}}
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+# ---- 基准用例 ----
+
+@benchmark("encrypt_request")
+def bench_encrypt_request():
+    from src.core.crypto import NeteaseCrypto
+
+    request_data = {
+        "csrf_token": "", "cursor": "-1", "offset": "0", "orderType": "1",
+        "pageNo": "1", "pageSize": "20", "rid": "R_SO_4_347230", "threadId": "R_SO_4_347230",
+    }
+    yield lambda: NeteaseCrypto.encrypt_request(request_data)
+
+
+@benchmark("parse_window_title")
+def bench_parse_window_title():
+    from src.core.monitor import NeteaseWindowMonitor
+
+    monitor = NeteaseWindowMonitor()
+    yield lambda: monitor.parse_window_title("浪人情歌 - 伍佰")
+
+
+@benchmark("comment_json_parse")
+def bench_comment_json_parse():
+    from src.core.netease_crawler import NeteaseMusicCrawler
+
+    body = _sample_comment_payload()
+
+    def op():
+        data = json.loads(body)["data"]
+        return [NeteaseMusicCrawler._parse_comment(item) for item in data["hotComments"]]
+
+    yield op
+
+
+@benchmark("crawler_cache_hit")
+def bench_crawler_cache_hit():
+    from benchmarks.stub_server import StubNeteaseServer
+
+    with StubNeteaseServer() as server:
+        crawler = _make_crawler()
+        server.apply_to(crawler)
+        song_id = crawler.search_song("浪人情歌", "伍佰")
+        crawler.get_song_detail(song_id)
+        crawler.get_hot_comments(song_id)
+
+        def op():
+            crawler.get_song_detail(song_id)
+            return crawler.get_hot_comments(song_id)
+
+        yield op
+
+
+@benchmark("session_snapshot_round_trip")
+def bench_session_snapshot():
+    from src.core.session_snapshot import SessionSnapshot, load_session_snapshot, save_session_snapshot
+    from src.core.netease_crawler import NeteaseMusicCrawler
+    from src.models.song_info import SongInfo
+
+    data = json.loads(_sample_comment_payload())["data"]
+    snapshot = SessionSnapshot(
+        title_song="浪人情歌",
+        title_artist="伍佰",
+        song=SongInfo(song_id="347230", name="浪人情歌", artist="伍佰"),
+        comments=[NeteaseMusicCrawler._parse_comment(item) for item in data["hotComments"]],
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "last_session.json"
+
+        def op():
+            save_session_snapshot(snapshot, path)
+            return load_session_snapshot(path)
+
+        yield op
+
+
+@benchmark("comment_store_write")
+def bench_comment_store_write():
+    from src.core.comment_store import CommentStore
+    from src.core.netease_crawler import NeteaseMusicCrawler
+
+    data = json.loads(_sample_comment_payload())["data"]
+    comments = [NeteaseMusicCrawler._parse_comment(item) for item in data["hotComments"]]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = CommentStore(Path(tmp_dir) / "comments.db")
+        # 同一批评论重复写入只更新点赞数（缓存命中时的常见情况）
+        yield lambda: store.save_comments("347230", comments)
+        store.close()
+
+
+@benchmark("comment_store_search")
+def bench_comment_store_search():
+    from benchmarks.stub_server import make_comments
+    from src.core.comment_store import CommentStore
+    from src.core.netease_crawler import NeteaseMusicCrawler
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = CommentStore(Path(tmp_dir) / "comments.db")
+        for song_id in range(1000, 1100):
+            store.save_comments(str(song_id), [
+                NeteaseMusicCrawler._parse_comment(item) for item in make_comments(song_id, 200)
+            ])
+        yield lambda: store.search_comments("下雨的夜晚", limit=20)
+        store.close()
+
+
+@benchmark("fetch_song_data_stub")
+def bench_fetch_song_data():
+    from benchmarks.stub_server import StubNeteaseServer
+    from src.main import MusicCommentApp
+
+    with StubNeteaseServer() as server:
+        crawler = _make_crawler()
+        server.apply_to(crawler)
+        app = SimpleNamespace(crawler=crawler)
+
+        def op():
+            # 每次都清空缓存，测量完整的 搜索 → 详情 → 评论 流程
+            crawler.get_song_detail.cache_clear()
+            crawler.get_hot_comments.cache_clear()
+            return MusicCommentApp.fetch_song_data(app, "浪人情歌", "伍佰")
+
+        yield op
+
+
+# ---- 测量与历史记录 ----
+
+def measure(op: Callable[[], object], min_time: float = 0.2, repeats: int = 7) -> dict:
+    """测量单个操作的耗时
+
+    先标定每轮的调用次数使单轮不少于 min_time / repeats 秒，再重复 repeats 轮
+
+    Args:
+        op: 被测操作
+        min_time: 总测量时长下限（秒）
+        repeats: 重复轮数
+
+    Returns:
+        dict: median_us、min_us、stdev_us（单次调用，微秒）和 loops
+    """
+    op()  # 预热
+
+    loops = 1
+    target = min_time / repeats
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            op()
+        elapsed = time.perf_counter() - start
+        if elapsed >= target or loops >= 1 << 20:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(target / elapsed) + 1))
+
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(loops):
+            op()
+        samples.append((time.perf_counter() - start) / loops * 1e6)
+
+    return {
+        "median_us": statistics.median(samples),
+        "min_us": min(samples),
+        "stdev_us": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "loops": loops,
+    }
+
+
+def run_benchmarks(pattern: str = "", min_time: float = 0.2) -> dict:
+    """运行匹配的基准测试
+
+    Args:
+        pattern: 名称过滤（子串匹配），为空时运行全部
+        min_time: 每个基准的测量时长下限（秒）
+
+    Returns:
+        dict: 基准名称 -> 测量结果
+    """
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+
+        gen = setup()
+        op = next(gen)
+        try:
+            results[name] = measure(op, min_time)
+        finally:
+            gen.close()
+
+        print(f"{name:<30}{results[name]['median_us']:>12.1f} us")
+
+    return results
+
+
+def _git_commit() -> str:
+    """当前 git 提交（不可用时返回空字符串）"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent, capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def load_history(path: Path = HISTORY_PATH) -> list[dict]:
+    """读取基准历史
+
+    Args:
+        path: 历史文件路径
+
+    Returns:
+        list[dict]: 按时间顺序排列的运行记录
+    """
+    if not path.exists():
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("runs", [])
+
+
+def save_run(results: dict, path: Path = HISTORY_PATH) -> dict:
+    """把一次运行结果追加到历史文件
+
+    Args:
+        results: 测量结果
+        path: 历史文件路径
+
+    Returns:
+        dict: 写入的运行记录
+    """
+    run = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    runs = load_history(path)
+    runs.append(run)
+
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"runs": runs}, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return run
+
+
+def compare_runs(base: dict, head: dict, threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """对比两次运行，打印变化并返回回归的基准名称
+
+    Args:
+        base: 基准运行记录
+        head: 对比运行记录
+        threshold: 回归阈值（中位数相对变化）
+
+    Returns:
+        list[str]: 回归的基准名称
+    """
+    print(f"base: {base.get('commit') or '-'} {base.get('timestamp', '')}")
+    print(f"head: {head.get('commit') or '-'} {head.get('timestamp', '')}")
+    print(f"{'benchmark':<30}{'base us':>12}{'head us':>12}{'change':>10}")
+
+    regressions = []
+    for name, head_result in head["results"].items():
+        base_result = base["results"].get(name)
+        if base_result is None:
+            print(f"{name:<30}{'-':>12}{head_result['median_us']:>12.1f}{'new':>10}")
+            continue
+
+        change = head_result["median_us"] / base_result["median_us"] - 1
+        status = ""
+        if change > threshold:
+            status = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            status = "  improved"
+        print(
+            f"{name:<30}{base_result['median_us']:>12.1f}{head_result['median_us']:>12.1f}"
+            f"{change:>+10.1%}{status}"
+        )
+
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="核心基准测试套件")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="运行基准测试")
+    run_parser.add_argument("-k", dest="pattern", default="", help="只运行名称包含该子串的基准")
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="每个基准的测量时长下限（秒）")
+    run_parser.add_argument("--save", action="store_true", help="把结果追加到 history.json")
+    run_parser.add_argument("--compare", action="store_true", help="与 history.json 中最近一次结果对比")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="回归阈值")
+
+    compare_parser = subparsers.add_parser("compare", help="对比 history.json 中的两次结果")
+    compare_parser.add_argument("--base", type=int, default=-2, help="基准运行的下标（默认倒数第二次）")
+    compare_parser.add_argument("--head", type=int, default=-1, help="对比运行的下标（默认最近一次）")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="回归阈值")
+
+    subparsers.add_parser("list", help="列出所有基准")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name in BENCHMARKS:
+            print(name)
+        return 0
+
+    if args.command == "compare":
+        runs = load_history()
+        if len(runs) < 2:
+            print("history.json 中至少需要两次运行记录", file=sys.stderr)
+            return 2
+        return 1 if compare_runs(runs[args.base], runs[args.head], args.threshold) else 0
+
+    previous = load_history()
+    results = run_benchmarks(args.pattern, args.min_time)
+    run = save_run(results) if args.save else {"results": results, "timestamp": "current"}
+
+    if args.compare:
+        if not previous:
+            print("history.json 中没有可对比的记录")
+            return 0
+        print()
+        return 1 if compare_runs(previous[-1], run, args.threshold) else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
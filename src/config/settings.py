@@ -26,14 +26,57 @@ class AppConfig:
     rotation_interval: int = 8000  # 毫秒（8秒）
     animation_duration: int = 500   # 毫秒
 
+    # 评论渲染方式："label"（QLabel 组合）或 "painted"（自绘，缓存排版结果）
+    comment_renderer: str = "label"
+
+    # 省电模式配置（窗口隐藏到托盘时生效）
+    hidden_check_interval: int = 10000  # 隐藏时歌曲检测间隔（毫秒）
+
     # 爬虫配置
     # 注意：使用网易云官方 Web API，无需本地 API 服务
     api_timeout: int = 10
     max_retries: int = 3
+    scheduler_aging_seconds: float = 10.0  # 请求调度老化时间：低一级优先级每等待这么久提升一级
+    scheduler_workers: int = 2             # 网络任务线程数：后台任务执行中前台任务也能开始排队取请求名额
 
     # 缓存配置
     cache_size: int = 50
     comment_cache_time: int = 3600  # 秒
+    comment_refresh_max_pages: int = 5  # 批量增量刷新最多请求的页数（已缓存的评论都已获取到时提前停止）
+
+    # 跨进程共享配置（同一台机器上的多个实例共用缓存和限速）
+    shared_cache_enabled: bool = True  # 是否使用配置目录下的共享缓存（有效期为 comment_cache_time）
+    rate_limit_burst: int = 1          # 共享令牌桶容量（允许的突发请求数）
+
+    # 出口池配置（批量预热时把请求分散到多个出口，每个出口单独限速，不再使用共享令牌桶）
+    # 出口描述："direct"（直连）、"src:本机IP"（绑定源地址）或代理 URL；为空时使用单个直连会话
+    egresses: list = field(default_factory=list)
+    egress_rate: float = 1.0           # 每个出口每秒的请求数
+    egress_burst: int = 1              # 每个出口允许的突发请求数
+    egress_eject_seconds: float = 30.0 # 出口连续失败后首次剔除的时长（秒），再次剔除时加倍
+
+    # 图片配置（评论头像和专辑封面模糊背景）
+    images_enabled: bool = True
+    image_memory_cache_size: int = 64  # 内存中保留的已解码图片数
+    image_disk_cache_mb: int = 50      # 磁盘缓存上限（MB）
+    image_prefetch_count: int = 3      # 预取接下来几条评论的头像
+
+    # 歌词配置（歌曲名下方显示当前歌词行）
+    # 播放位置按检测到切歌的时间估算，启动时已在播放的歌曲位置未知，不显示歌词
+    lyrics_enabled: bool = False
+
+    # 评论去重配置
+    dedup_hamming_threshold: int = 3  # SimHash 海明距离阈值，小于 0 时关闭近似去重
+
+    # 本地评论库配置（离线全文搜索）
+    comment_store_enabled: bool = True  # 是否把获取到的歌曲和评论保存到本地评论库
+
+    # 本地推送接口配置（HTTP + Server-Sent Events，仅监听 127.0.0.1）
+    push_api_enabled: bool = False
+    push_api_port: int = 17380
+
+    # 性能分析配置
+    profile_window_seconds: int = 60  # CPU 分析自动结束时长（秒）
 
     # 风格标签配置（MVP版本）
     max_genre_tags: int = 3          # 最多显示的标签数
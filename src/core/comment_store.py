@@ -0,0 +1,446 @@
+"""
+本地评论库
+
+把获取过的歌曲和热门评论保存到 SQLite，并用 FTS5 trigram 分词建立全文索引，
+离线即可按关键词搜索所有缓存过的评论（trigram 按字符切分，适合没有空格的中文）
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.config.settings import AppConfig
+from src.utils.logger import get_logger
+from src.models.song_info import SongInfo
+from src.models.comment import Comment
+
+logger = get_logger()
+
+# trigram 分词要求关键词至少 3 个字符，更短的关键词改用 LIKE 匹配
+_TRIGRAM_MIN_CHARS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS songs (
+    id INTEGER PRIMARY KEY,
+    song_id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    artist TEXT NOT NULL,
+    album TEXT NOT NULL DEFAULT '',
+    genres TEXT NOT NULL DEFAULT '',
+    duration INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY,
+    song_id TEXT NOT NULL,
+    comment_id INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    user TEXT NOT NULL,
+    likes INTEGER NOT NULL,
+    time_ms INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (song_id, comment_id)
+);
+
+-- 短关键词无法使用 trigram 索引，按点赞数倒序扫描，凑满条数即可提前结束
+CREATE INDEX IF NOT EXISTS comments_likes ON comments (likes);
+
+-- 原始 LRC 歌词；纯音乐或没有歌词时为空字符串，同样缓存，避免重复请求
+CREATE TABLE IF NOT EXISTS lyrics (
+    song_id TEXT PRIMARY KEY,
+    lrc TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS comments_fts USING fts5(
+    content, user, content='comments', content_rowid='id', tokenize='trigram'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS songs_fts USING fts5(
+    name, artist, album, content='songs', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS comments_ai AFTER INSERT ON comments BEGIN
+    INSERT INTO comments_fts(rowid, content, user) VALUES (new.id, new.content, new.user);
+END;
+
+CREATE TRIGGER IF NOT EXISTS comments_ad AFTER DELETE ON comments BEGIN
+    INSERT INTO comments_fts(comments_fts, rowid, content, user)
+    VALUES ('delete', old.id, old.content, old.user);
+END;
+
+CREATE TRIGGER IF NOT EXISTS comments_au AFTER UPDATE OF content, user ON comments BEGIN
+    INSERT INTO comments_fts(comments_fts, rowid, content, user)
+    VALUES ('delete', old.id, old.content, old.user);
+    INSERT INTO comments_fts(rowid, content, user) VALUES (new.id, new.content, new.user);
+END;
+
+CREATE TRIGGER IF NOT EXISTS songs_ai AFTER INSERT ON songs BEGIN
+    INSERT INTO songs_fts(rowid, name, artist, album) VALUES (new.id, new.name, new.artist, new.album);
+END;
+
+CREATE TRIGGER IF NOT EXISTS songs_ad AFTER DELETE ON songs BEGIN
+    INSERT INTO songs_fts(songs_fts, rowid, name, artist, album)
+    VALUES ('delete', old.id, old.name, old.artist, old.album);
+END;
+
+CREATE TRIGGER IF NOT EXISTS songs_au AFTER UPDATE OF name, artist, album ON songs BEGIN
+    INSERT INTO songs_fts(songs_fts, rowid, name, artist, album)
+    VALUES ('delete', old.id, old.name, old.artist, old.album);
+    INSERT INTO songs_fts(rowid, name, artist, album) VALUES (new.id, new.name, new.artist, new.album);
+END;
+"""
+
+
+@dataclass
+class CommentMatch:
+    """评论搜索结果
+
+    Attributes:
+        song_id: 歌曲ID
+        song_name: 歌曲名（歌曲信息未缓存时为空）
+        artist: 歌手名
+        comment: 评论
+        score: 相关度（bm25，越小越相关；LIKE 匹配时为 0）
+    """
+    song_id: str
+    song_name: str
+    artist: str
+    comment: Comment
+    score: float = 0.0
+
+
+def get_store_path() -> Path:
+    """获取评论库路径（与配置文件同目录）
+
+    Returns:
+        Path: 数据库文件的完整路径
+    """
+    return AppConfig.get_config_path().parent / "comments.db"
+
+
+def _fts_phrase(term: str) -> str:
+    """把关键词转为 FTS5 短语（转义双引号）"""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like_pattern(term: str) -> str:
+    """把关键词转为 LIKE 子串匹配模式（转义通配符）"""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class CommentStore:
+    """本地评论库
+
+    单个连接在线程间共享（由锁保护）；写入只追加新评论并更新点赞数，
+    全文索引由触发器随之增量更新
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """打开（必要时创建）评论库
+
+        Args:
+            path: 数据库文件路径，默认为配置目录下的 comments.db，":memory:" 表示内存库
+        """
+        self.path = path or get_store_path()
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        # 旧版 SQLite 不支持 trigram 分词时退化为 LIKE 搜索
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+            self.fts_enabled = True
+        except sqlite3.OperationalError as e:
+            logger.warning("SQLite 不支持 FTS5 trigram，评论搜索退化为 LIKE: %s", e)
+            self.fts_enabled = False
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+    def save_song(self, song: SongInfo) -> None:
+        """保存（或更新）歌曲信息
+
+        Args:
+            song: 歌曲信息
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO songs (song_id, name, artist, album, genres, duration, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(song_id) DO UPDATE SET
+                    name = excluded.name, artist = excluded.artist, album = excluded.album,
+                    genres = excluded.genres, duration = excluded.duration,
+                    updated_at = excluded.updated_at
+                """,
+                (song.song_id, song.name, song.artist, song.album,
+                 "/".join(song.genres), song.duration, time.time())
+            )
+
+    def save_comments(self, song_id: str, comments: Iterable[Comment]) -> None:
+        """保存歌曲的评论（已存在的评论只更新点赞数）
+
+        Args:
+            song_id: 歌曲ID
+            comments: 评论
+        """
+        rows = [
+            (song_id, comment.comment_id, comment.content, comment.user, comment.likes, comment.time_ms)
+            for comment in comments
+            if comment.comment_id
+        ]
+        if not rows:
+            return
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO comments (song_id, comment_id, content, user, likes, time_ms)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(song_id, comment_id) DO UPDATE SET likes = excluded.likes
+                """,
+                rows
+            )
+
+    def get_song(self, song_id: str) -> Optional[SongInfo]:
+        """读取缓存的歌曲信息
+
+        Args:
+            song_id: 歌曲ID
+
+        Returns:
+            Optional[SongInfo]: 歌曲信息，未缓存则返回 None
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM songs WHERE song_id = ?", (song_id,)).fetchone()
+
+        if row is None:
+            return None
+        return SongInfo(
+            song_id=row["song_id"],
+            name=row["name"],
+            artist=row["artist"],
+            album=row["album"],
+            genres=row["genres"].split("/") if row["genres"] else [],
+            duration=row["duration"],
+        )
+
+    def get_comment_likes(self, song_id: str) -> Dict[int, int]:
+        """读取歌曲已缓存评论的点赞数（增量刷新时与新获取的评论比对）
+
+        Args:
+            song_id: 歌曲ID
+
+        Returns:
+            Dict[int, int]: 评论ID → 点赞数
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT comment_id, likes FROM comments WHERE song_id = ?", (song_id,)
+            ).fetchall()
+        return {comment_id: likes for comment_id, likes in rows}
+
+    def save_lyrics(self, song_id: str, lrc: str) -> None:
+        """保存（或更新）歌曲的原始 LRC 歌词
+
+        Args:
+            song_id: 歌曲ID
+            lrc: LRC 文本，没有歌词时为空字符串
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO lyrics (song_id, lrc, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(song_id) DO UPDATE SET lrc = excluded.lrc, updated_at = excluded.updated_at
+                """,
+                (song_id, lrc, time.time())
+            )
+
+    def get_lyrics(self, song_id: str) -> Optional[str]:
+        """读取缓存的原始 LRC 歌词
+
+        Args:
+            song_id: 歌曲ID
+
+        Returns:
+            Optional[str]: LRC 文本（已知没有歌词时为空字符串），未缓存则返回 None
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT lrc FROM lyrics WHERE song_id = ?", (song_id,)).fetchone()
+        return row[0] if row else None
+
+    def count_comments(self, since_rowid: int = 0) -> int:
+        """已缓存的评论总数
+
+        Args:
+            since_rowid: 只统计行号大于此值的评论
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM comments WHERE id > ?", (since_rowid,)).fetchone()[0]
+
+    def iter_comment_chunks(self, since_rowid: int = 0, chunk_size: int = 5000) -> Iterator[List[sqlite3.Row]]:
+        """按行号顺序分块读取评论（附带歌曲信息）
+
+        按行号做键集分页，每块单独查询、只短暂持有锁，内存占用与评论总数无关，
+        导出期间应用仍可写入。行号只增不减，上次导出的最大行号即可作为增量导出的水位
+
+        Args:
+            since_rowid: 只读取行号大于此值的评论
+            chunk_size: 每块的行数
+
+        Yields:
+            List[sqlite3.Row]: 一块评论行，列为 rowid、song_id、comment_id、content、user、
+            likes、time_ms、song_name、artist、album（歌曲未缓存时歌曲列为空字符串）
+        """
+        sql = """
+            SELECT c.id AS rowid, c.song_id, c.comment_id, c.content, c.user, c.likes, c.time_ms,
+                   COALESCE(s.name, '') AS song_name, COALESCE(s.artist, '') AS artist,
+                   COALESCE(s.album, '') AS album
+            FROM comments c
+            LEFT JOIN songs s ON s.song_id = c.song_id
+            WHERE c.id > ?
+            ORDER BY c.id
+            LIMIT ?
+        """
+        while True:
+            with self._lock:
+                rows = self._conn.execute(sql, (since_rowid, chunk_size)).fetchall()
+            if not rows:
+                return
+            yield rows
+            since_rowid = rows[-1]["rowid"]
+
+    def search_comments(self, query: str, limit: int = 20) -> List[CommentMatch]:
+        """按关键词搜索评论
+
+        多个关键词以空格分隔，需同时出现；结果按相关度排序，相关度相同时点赞多的在前
+
+        Args:
+            query: 关键词
+            limit: 最多返回的条数
+
+        Returns:
+            List[CommentMatch]: 搜索结果
+        """
+        terms = query.split()
+        if not terms:
+            return []
+
+        fts_terms = [t for t in terms if self.fts_enabled and len(t) >= _TRIGRAM_MIN_CHARS]
+        like_terms = [t for t in terms if t not in fts_terms]
+
+        like_sql = "".join(" AND c.content LIKE ? ESCAPE '\\'" for _ in like_terms)
+        like_params = [_like_pattern(t) for t in like_terms]
+
+        if fts_terms:
+            sql = f"""
+                SELECT c.*, s.name AS song_name, s.artist AS artist, bm25(comments_fts) AS score
+                FROM comments_fts
+                JOIN comments c ON c.id = comments_fts.rowid
+                LEFT JOIN songs s ON s.song_id = c.song_id
+                WHERE comments_fts MATCH ?{like_sql}
+                ORDER BY score, c.likes DESC
+                LIMIT ?
+            """
+            params = [" AND ".join(_fts_phrase(t) for t in fts_terms), *like_params, limit]
+        else:
+            # 关键词都太短，无法使用 trigram 索引，退化为全表扫描
+            sql = f"""
+                SELECT c.*, s.name AS song_name, s.artist AS artist, 0.0 AS score
+                FROM comments c
+                LEFT JOIN songs s ON s.song_id = c.song_id
+                WHERE 1{like_sql}
+                ORDER BY c.likes DESC
+                LIMIT ?
+            """
+            params = [*like_params, limit]
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        return [
+            CommentMatch(
+                song_id=row["song_id"],
+                song_name=row["song_name"] or "",
+                artist=row["artist"] or "",
+                comment=Comment(
+                    content=row["content"],
+                    user=row["user"],
+                    likes=row["likes"],
+                    time_ms=row["time_ms"],
+                    comment_id=row["comment_id"],
+                ),
+                score=row["score"],
+            )
+            for row in rows
+        ]
+
+    def search_songs(self, query: str, limit: int = 20) -> List[SongInfo]:
+        """按歌曲名、歌手或专辑搜索缓存的歌曲
+
+        Args:
+            query: 关键词
+            limit: 最多返回的条数
+
+        Returns:
+            List[SongInfo]: 匹配的歌曲
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        if self.fts_enabled and len(query) >= _TRIGRAM_MIN_CHARS:
+            sql = """
+                SELECT s.song_id FROM songs_fts
+                JOIN songs s ON s.id = songs_fts.rowid
+                WHERE songs_fts MATCH ?
+                ORDER BY bm25(songs_fts)
+                LIMIT ?
+            """
+            params = [_fts_phrase(query), limit]
+        else:
+            pattern = _like_pattern(query)
+            sql = """
+                SELECT song_id FROM songs
+                WHERE name LIKE ? ESCAPE '\\' OR artist LIKE ? ESCAPE '\\' OR album LIKE ? ESCAPE '\\'
+                LIMIT ?
+            """
+            params = [pattern, pattern, pattern, limit]
+
+        with self._lock:
+            song_ids = [row[0] for row in self._conn.execute(sql, params).fetchall()]
+
+        return [song for song in map(self.get_song, song_ids) if song]
+
+
+# 全局评论库
+_store: Optional[CommentStore] = None
+_store_lock = threading.Lock()
+
+
+def get_comment_store() -> CommentStore:
+    """获取全局评论库（首次使用时打开）
+
+    Returns:
+        CommentStore: 全局评论库
+    """
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            _store = CommentStore()
+
+    return _store
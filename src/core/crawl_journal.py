@@ -0,0 +1,159 @@
+"""
+批量抓取检查点日志
+
+只追加的 JSONL 文件，每完成一首歌的一个阶段（搜索、详情、评论）追加一行。
+重启时重放日志得到每首歌的进度，已完成的歌曲直接跳过，进行中的歌曲从下一阶段继续；
+各阶段写入本地评论库都是按主键更新，重复执行同一阶段不会产生重复数据
+
+每条记录写出后立即交给操作系统（进程崩溃不丢失），fsync 按批进行
+（每 sync_every 条或每 sync_interval 秒），断电时最多丢失最后一批，这些歌曲重启后重做对应阶段
+"""
+
+import json
+import os
+import threading
+import time
+from collections import Counter
+from enum import IntEnum
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger()
+
+
+class Stage(IntEnum):
+    """单首歌曲的抓取阶段（按完成顺序递增）"""
+    PENDING = 0
+    SEARCHED = 1
+    DETAILED = 2
+    COMMENTED = 3
+
+
+class JournalEntry(NamedTuple):
+    """单首歌曲的进度
+
+    Attributes:
+        stage: 已完成的最后一个阶段
+        song_id: 搜索得到的歌曲ID（搜索完成前为 None）
+    """
+    stage: Stage = Stage.PENDING
+    song_id: Optional[str] = None
+
+
+class CrawlJournal:
+    """批量抓取检查点日志
+
+    多个抓取线程共用一个实例（由锁保护）
+    """
+
+    def __init__(self, path: Path, sync_every: int = 64, sync_interval: float = 1.0):
+        """打开（必要时创建）日志并重放已有记录
+
+        Args:
+            path: 日志文件路径
+            sync_every: 每追加多少条记录 fsync 一次
+            sync_interval: 距上次 fsync 超过多少秒时立即 fsync
+        """
+        self.path = Path(path)
+        self.sync_every = max(1, sync_every)
+        self.sync_interval = sync_interval
+        self._lock = threading.Lock()
+        self._entries: Dict[str, JournalEntry] = {}
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        needs_newline = self._replay()
+        self._file = open(self.path, "a", encoding="utf-8", newline="\n")
+        if needs_newline:
+            # 上次崩溃时最后一行只写了一半，从新行开始追加
+            self._file.write("\n")
+
+    def _replay(self) -> bool:
+        """重放已有记录
+
+        Returns:
+            bool: 文件末尾是否缺少换行（最后一行不完整）
+        """
+        if not self.path.exists():
+            return False
+
+        line = ""
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    key, stage = record["key"], Stage[record["stage"].upper()]
+                except (ValueError, KeyError, AttributeError, TypeError):
+                    logger.warning("跳过无法解析的检查点记录: %s", line[:80])
+                    continue
+                self._apply(key, stage, record.get("song_id"))
+
+        logger.info("检查点日志已载入: %s 首歌曲", len(self._entries))
+        return bool(line) and not line.endswith("\n")
+
+    def _apply(self, key: str, stage: Stage, song_id: Optional[str]) -> None:
+        """更新内存中的进度（阶段只前进不后退）"""
+        entry = self._entries.get(key, JournalEntry())
+        if stage > entry.stage:
+            self._entries[key] = JournalEntry(stage, song_id or entry.song_id)
+
+    def get(self, key: str) -> JournalEntry:
+        """查询歌曲的进度
+
+        Args:
+            key: 歌曲键（歌名和歌手）
+
+        Returns:
+            JournalEntry: 进度，没有记录时为 PENDING
+        """
+        with self._lock:
+            return self._entries.get(key, JournalEntry())
+
+    def record(self, key: str, stage: Stage, song_id: Optional[str] = None) -> None:
+        """追加一条阶段完成记录
+
+        Args:
+            key: 歌曲键
+            stage: 完成的阶段
+            song_id: 歌曲ID（搜索阶段记录）
+        """
+        line = json.dumps({"key": key, "stage": stage.name.lower(), "song_id": song_id}, ensure_ascii=False)
+        with self._lock:
+            self._apply(key, stage, song_id)
+            self._file.write(line + "\n")
+            self._file.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+                self._sync()
+
+    def _sync(self) -> None:
+        """把已写出的记录落盘（持有锁时调用）"""
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self) -> None:
+        """立即把已写出的记录落盘"""
+        with self._lock:
+            if self._unsynced:
+                self._sync()
+
+    def counts(self) -> Counter:
+        """各阶段的歌曲数
+
+        Returns:
+            Counter: 阶段 → 停在该阶段的歌曲数
+        """
+        with self._lock:
+            return Counter(entry.stage for entry in self._entries.values())
+
+    def close(self) -> None:
+        """落盘并关闭日志"""
+        with self._lock:
+            if self._unsynced:
+                self._sync()
+            self._file.close()
@@ -6,9 +6,8 @@
 
 import json
 import base64
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad
-from Crypto.Random import get_random_bytes
+
+from src.utils.metrics import timed
 
 
 class NeteaseCrypto:
@@ -41,6 +40,10 @@ class NeteaseCrypto:
         Returns:
             str: Base64编码的密文
         """
+        # pycryptodome 按需导入，首次发起评论请求时才加载
+        from Crypto.Cipher import AES
+        from Crypto.Util.Padding import pad
+
         cipher = AES.new(
             key.encode('utf-8'),
             AES.MODE_CBC,
@@ -51,6 +54,7 @@ class NeteaseCrypto:
         return base64.b64encode(ciphertext).decode('utf-8')
 
     @classmethod
+    @timed("encrypt_request")
     def encrypt_request(cls, request_data: dict) -> dict:
         """加密请求数据
 
@@ -0,0 +1,180 @@
+"""
+评论近似去重模块
+
+对评论内容计算 64 位 SimHash 指纹，同一首歌内海明距离不超过阈值的评论视为复制粘贴的变体；
+指纹按分段（鸽巢原理）建立倒排索引，查重只需比较与其至少一段完全相同的候选，无需两两比较
+"""
+
+import hashlib
+import re
+from typing import Iterable, List, Optional
+
+from src.config.settings import get_config
+from src.models.comment import Comment
+
+# 指纹位数
+FINGERPRINT_BITS = 64
+
+# 计算指纹前去掉的字符：空白、标点和下划线
+_STRIP_PATTERN = re.compile(r"[\W_]+")
+
+# 字符 n-gram 长度（中文评论没有空格分词，按字符切分）
+_SHINGLE_SIZE = 3
+
+
+def _shingles(text: str) -> List[str]:
+    """把规范化后的文本切分为字符 n-gram
+
+    Args:
+        text: 评论内容
+
+    Returns:
+        List[str]: n-gram 列表（文本过短时为整段文本）
+    """
+    normalized = _STRIP_PATTERN.sub("", text.lower()) or text
+    if len(normalized) <= _SHINGLE_SIZE:
+        return [normalized]
+    return [normalized[i:i + _SHINGLE_SIZE] for i in range(len(normalized) - _SHINGLE_SIZE + 1)]
+
+
+def simhash(text: str) -> int:
+    """计算文本的 64 位 SimHash 指纹
+
+    Args:
+        text: 评论内容
+
+    Returns:
+        int: 指纹
+    """
+    hashes = [
+        int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for shingle in _shingles(text)
+    ]
+
+    # 每一位上超过半数的 n-gram 哈希为 1，则指纹该位为 1
+    half = len(hashes) / 2
+    fingerprint = 0
+    for bit in range(FINGERPRINT_BITS):
+        mask = 1 << bit
+        if sum(1 for h in hashes if h & mask) > half:
+            fingerprint |= mask
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """两个指纹的海明距离
+
+    Args:
+        a: 指纹
+        b: 指纹
+
+    Returns:
+        int: 不同的位数
+    """
+    return (a ^ b).bit_count()
+
+
+class SimHashIndex:
+    """SimHash 近似查重索引
+
+    把 64 位指纹切成 threshold + 1 段：若两个指纹海明距离不超过 threshold，
+    至少有一段完全相同。每段建一张哈希表，查询时只比较同段命中的候选；
+    新指纹增量加入，流式分页时无需重新扫描已有评论
+    """
+
+    def __init__(self, threshold: int = 3):
+        """初始化索引
+
+        Args:
+            threshold: 海明距离阈值（不超过该距离视为重复）
+        """
+        self.threshold = threshold
+        self._fingerprints: List[int] = []
+
+        # 段划分：(位移, 掩码)，余下的位平均分给前几段
+        band_count = min(threshold + 1, FINGERPRINT_BITS)
+        base, extra = divmod(FINGERPRINT_BITS, band_count)
+        self._bands: List[tuple[int, int]] = []
+        shift = 0
+        for i in range(band_count):
+            width = base + (1 if i < extra else 0)
+            self._bands.append((shift, (1 << width) - 1))
+            shift += width
+
+        self._tables: List[dict[int, List[int]]] = [{} for _ in self._bands]
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def find_near(self, fingerprint: int) -> Optional[int]:
+        """查找与指纹相近的已有指纹
+
+        Args:
+            fingerprint: 待查询的指纹
+
+        Returns:
+            Optional[int]: 相近的指纹，没有则返回 None
+        """
+        for (shift, mask), table in zip(self._bands, self._tables):
+            for candidate in table.get((fingerprint >> shift) & mask, ()):
+                if hamming_distance(candidate, fingerprint) <= self.threshold:
+                    return candidate
+        return None
+
+    def add(self, fingerprint: int) -> None:
+        """加入指纹
+
+        Args:
+            fingerprint: 指纹
+        """
+        self._fingerprints.append(fingerprint)
+        for (shift, mask), table in zip(self._bands, self._tables):
+            table.setdefault((fingerprint >> shift) & mask, []).append(fingerprint)
+
+    def add_if_new(self, text: str) -> bool:
+        """文本不是已有内容的近似重复时加入索引
+
+        Args:
+            text: 评论内容
+
+        Returns:
+            bool: 是否为新内容（False 表示应被去重）
+        """
+        fingerprint = simhash(text)
+        if self.find_near(fingerprint) is not None:
+            return False
+        self.add(fingerprint)
+        return True
+
+
+def create_dedup_index() -> Optional[SimHashIndex]:
+    """按配置创建去重索引
+
+    Returns:
+        Optional[SimHashIndex]: 去重索引，配置关闭去重（阈值小于 0）时返回 None
+    """
+    threshold = get_config().dedup_hamming_threshold
+    if threshold < 0:
+        return None
+    return SimHashIndex(threshold)
+
+
+def dedup_comments(
+    comments: Iterable[Comment],
+    index: Optional[SimHashIndex] = None
+) -> List[Comment]:
+    """去掉近似重复的评论（保留先出现的一条）
+
+    Args:
+        comments: 评论（按热度排序，先出现的优先保留）
+        index: 已有的去重索引（流式分页时复用），默认按配置新建
+
+    Returns:
+        List[Comment]: 去重后的评论
+    """
+    if index is None:
+        index = create_dedup_index()
+        if index is None:
+            return list(comments)
+
+    return [comment for comment in comments if index.add_if_new(comment.content)]
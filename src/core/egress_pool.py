@@ -0,0 +1,231 @@
+"""
+出口池
+
+批量预热时把请求分散到多个出口（直连、HTTP/SOCKS 代理或指定本机源地址），
+每个出口有独立的 requests.Session、令牌桶和健康分：
+- 限速按出口计算，总吞吐量随出口数近似线性增长
+- 每次请求从未被剔除的出口中选最早有令牌的一个，同时可用时健康分高的优先
+- 健康分为请求结果的指数滑动平均，连接失败、超时、403/429/5xx 计为失败；
+  低于阈值的出口被剔除一段时间，之后以试用状态恢复，再次失败时剔除时长加倍
+
+出口描述:
+- "direct": 直连
+- "src:192.168.1.10": 直连，绑定本机源地址（多网卡/多 IP 机器）
+- "http://host:port"、"socks5://host:port": 经代理（SOCKS 需要 requests[socks]）
+"""
+
+import threading
+import time
+from typing import Callable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.logger import get_logger
+
+logger = get_logger()
+
+# 健康分的滑动平均系数（越大越看重最近的请求）
+HEALTH_ALPHA = 0.25
+
+# 健康分低于此值时剔除（初始为 1.0，连续失败 3 次后低于 0.5）
+EJECT_HEALTH = 0.5
+
+# 剔除时长最多加倍到基础时长的倍数
+MAX_EJECT_BACKOFF = 8
+
+# 视为出口故障的 HTTP 状态码（被封禁或限流），其他 4xx 是请求本身的问题
+_EGRESS_FAILURE_STATUS = (403, 429)
+
+
+class SourceAddressAdapter(HTTPAdapter):
+    """把连接绑定到指定本机源地址的 HTTPAdapter"""
+
+    def __init__(self, source_address: str, **kwargs):
+        self.source_address = (source_address, 0)
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["source_address"] = self.source_address
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs["source_address"] = self.source_address
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+def create_session(spec: str) -> requests.Session:
+    """按出口描述创建会话
+
+    Args:
+        spec: 出口描述（"direct"、"src:IP" 或代理 URL）
+
+    Returns:
+        requests.Session: 绑定该出口的会话
+    """
+    session = requests.Session()
+    if spec in ("", "direct"):
+        return session
+
+    if spec.startswith("src:"):
+        adapter = SourceAddressAdapter(spec[len("src:"):])
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    # 显式配置的代理不受环境变量中的代理和 NO_PROXY 影响
+    session.trust_env = False
+    session.proxies = {"http": spec, "https": spec}
+    return session
+
+
+def is_egress_failure(error: Optional[BaseException] = None, status: int = 200) -> bool:
+    """判断请求结果是否应计为出口故障
+
+    Args:
+        error: 请求异常（成功时为 None）
+        status: HTTP 状态码
+
+    Returns:
+        bool: 是否为出口故障
+    """
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+    elif isinstance(error, requests.RequestException):
+        return True
+    return status in _EGRESS_FAILURE_STATUS or status >= 500
+
+
+class Egress:
+    """一个出口
+
+    令牌桶按 GCRA 记录理论到达时间：每 1/rate 秒一个名额，最多积攒 burst 个
+
+    Attributes:
+        spec: 出口描述
+        session: 绑定该出口的会话
+        health: 健康分（0~1）
+        ejected_until: 剔除截止时间（monotonic 时钟），0 表示未被剔除
+        requests: 已发出的请求数
+        failures: 计为出口故障的请求数
+    """
+
+    def __init__(self, spec: str, session: Optional[requests.Session] = None):
+        """初始化出口
+
+        Args:
+            spec: 出口描述
+            session: 会话，默认按出口描述创建
+        """
+        self.spec = spec
+        self.session = session or create_session(spec)
+        self.health = 1.0
+        self.ejected_until = 0.0
+        self.ejections = 0
+        self.requests = 0
+        self.failures = 0
+        self._tat = 0.0
+
+    def __repr__(self) -> str:
+        return f"Egress({self.spec!r}, health={self.health:.2f})"
+
+
+class EgressPool:
+    """出口池
+
+    acquire 取得下一个请求的出口（必要时等待该出口的令牌），请求结束后用 report 报告结果
+    """
+
+    def __init__(
+        self,
+        specs: List[str],
+        rate: float = 1.0,
+        burst: int = 1,
+        eject_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """初始化出口池
+
+        Args:
+            specs: 出口描述列表
+            rate: 每个出口每秒的请求数
+            burst: 每个出口允许的突发请求数
+            eject_seconds: 首次剔除时长（秒）
+            clock: 单调时钟（测试时可替换）
+            sleep: 等待函数（测试时可替换）
+
+        Raises:
+            ValueError: 出口列表为空或速率不为正
+        """
+        if not specs:
+            raise ValueError("出口列表为空")
+        if rate <= 0:
+            raise ValueError(f"出口速率必须为正: {rate}")
+
+        self.egresses = [Egress(spec) for spec in specs]
+        self.interval = 1.0 / rate
+        self.tolerance = (max(1, burst) - 1) * self.interval
+        self.eject_seconds = eject_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def _ready_at(self, egress: Egress, now: float) -> float:
+        """出口最早可以发出下一个请求的时间"""
+        return max(now, egress.ejected_until, egress._tat - self.tolerance)
+
+    def acquire(self) -> Egress:
+        """取得下一个请求的出口，等待到它有令牌为止
+
+        全部出口都被剔除时，等待最早恢复的一个
+
+        Returns:
+            Egress: 本次请求使用的出口
+        """
+        with self._lock:
+            now = self._clock()
+            egress = min(self.egresses, key=lambda e: (self._ready_at(e, now), -e.health))
+            send_at = self._ready_at(egress, now)
+            egress._tat = max(egress._tat, send_at) + self.interval
+            egress.requests += 1
+
+        wait = send_at - now
+        if wait > 0:
+            self._sleep(wait)
+        return egress
+
+    def report(self, egress: Egress, ok: bool) -> None:
+        """报告一次请求的结果，更新健康分，必要时剔除出口
+
+        Args:
+            egress: acquire 返回的出口
+            ok: 是否成功（出口故障以外的错误也算成功）
+        """
+        with self._lock:
+            egress.health += HEALTH_ALPHA * ((1.0 if ok else 0.0) - egress.health)
+            if ok:
+                egress.ejections = 0
+                return
+
+            egress.failures += 1
+            if egress.health >= EJECT_HEALTH:
+                return
+
+            # 剔除后以试用状态恢复：健康分停在阈值，再失败一次就再次剔除，时长加倍
+            backoff = min(2 ** egress.ejections, MAX_EJECT_BACKOFF)
+            egress.ejections += 1
+            egress.ejected_until = self._clock() + self.eject_seconds * backoff
+            egress.health = EJECT_HEALTH
+            logger.warning("出口 %s 连续失败，剔除 %.0f 秒", egress.spec, self.eject_seconds * backoff)
+
+    def healthy_count(self) -> int:
+        """当前未被剔除的出口数"""
+        now = self._clock()
+        with self._lock:
+            return sum(1 for egress in self.egresses if egress.ejected_until <= now)
+
+    def close(self) -> None:
+        """关闭所有出口的会话"""
+        for egress in self.egresses:
+            egress.session.close()
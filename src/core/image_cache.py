@@ -0,0 +1,130 @@
+"""
+图片磁盘缓存
+
+按原始地址 + 缩略图尺寸保存下载的图片字节，总大小超过上限时按最近使用时间淘汰；
+命中时更新文件修改时间作为最近使用时间，重启后淘汰顺序依然有效
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from src.config.settings import AppConfig
+from src.utils.logger import get_logger
+
+logger = get_logger()
+
+
+def thumbnail_url(url: str, width: int, height: int) -> str:
+    """网易云图片地址的服务端缩略图版本
+
+    网易云图片服务支持 ?param=宽y高 参数，直接返回缩放后的图片，
+    避免下载和解码原图（专辑封面原图通常超过 1000 像素）
+
+    Args:
+        url: 原图地址
+        width: 缩略图宽度（像素）
+        height: 缩略图高度（像素）
+
+    Returns:
+        str: 缩略图地址
+    """
+    base = url.split("?", 1)[0]
+    return f"{base}?param={width}y{height}"
+
+
+def get_image_cache_dir() -> Path:
+    """获取图片缓存目录（与配置文件同目录）
+
+    Returns:
+        Path: 缓存目录
+    """
+    return AppConfig.get_config_path().parent / "images"
+
+
+class ImageDiskCache:
+    """有大小上限的图片磁盘缓存（线程安全）"""
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = 50 * 1024 * 1024):
+        """打开（必要时创建）缓存目录
+
+        Args:
+            directory: 缓存目录，默认为配置目录下的 images/
+            max_bytes: 总大小上限（字节）
+        """
+        self.directory = directory or get_image_cache_dir()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total = sum(entry.stat().st_size for entry in self._entries())
+
+    def _entries(self) -> list[os.DirEntry]:
+        """缓存目录中的图片文件"""
+        with os.scandir(self.directory) as it:
+            return [entry for entry in it if entry.is_file() and entry.name.endswith(".img")]
+
+    def _path(self, key: str) -> Path:
+        """缓存键对应的文件路径"""
+        return self.directory / (hashlib.sha1(key.encode("utf-8")).hexdigest() + ".img")
+
+    @property
+    def total_bytes(self) -> int:
+        """当前缓存总大小（字节）"""
+        return self._total
+
+    def get(self, key: str) -> Optional[bytes]:
+        """读取缓存的图片
+
+        Args:
+            key: 缓存键（通常为缩略图地址）
+
+        Returns:
+            Optional[bytes]: 图片字节，未缓存返回 None
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """写入图片，超过上限时淘汰最久未使用的文件
+
+        Args:
+            key: 缓存键
+            data: 图片字节
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            old_size = path.stat().st_size if path.exists() else 0
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug("写入图片缓存失败: %s", e)
+            return
+
+        with self._lock:
+            self._total += len(data) - old_size
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """按修改时间从旧到新删除文件，直到总大小降到上限的 90%（持有锁时调用）"""
+        target = self.max_bytes * 0.9
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime)
+        self._total = sum(entry.stat().st_size for entry in entries)
+
+        for entry in entries:
+            if self._total <= target:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                self._total -= size
+            except OSError:
+                continue
@@ -4,13 +4,11 @@
 负责读取网易云音乐窗口标题，解析出当前播放的歌曲信息
 """
 
-import win32gui
-import win32process
-import psutil
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
 from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics
 from src.models.song_info import SongInfo
 
 logger = get_logger()
@@ -39,26 +37,37 @@ class NeteaseWindowMonitor:
     WINDOW_CLASS_NAME = "OrpheusBrowserHost"
 
     def __init__(self):
-        """初始化窗口监控器"""
-        self.netease_pids: list[int] = []
-        self._refresh_netease_pids()
+        """初始化窗口监控器
+
+        进程列表改为首次访问时再扫描，避免启动时执行完整的 psutil 进程遍历
+        """
+        self._netease_pids: Optional[list[int]] = None
+
+    @property
+    def netease_pids(self) -> list[int]:
+        """网易云音乐进程ID列表（首次访问时扫描）"""
+        if self._netease_pids is None:
+            self._refresh_netease_pids()
+        return self._netease_pids
 
     def _refresh_netease_pids(self) -> None:
         """刷新网易云音乐进程ID列表"""
-        self.netease_pids = []
+        import psutil
+
+        self._netease_pids = []
 
         try:
             for proc in psutil.process_iter(['pid', 'name']):
                 if proc.info['name'] and self.PROCESS_NAME in proc.info['name'].lower():
-                    self.netease_pids.append(proc.info['pid'])
+                    self._netease_pids.append(proc.info['pid'])
 
-            if self.netease_pids:
-                logger.debug(f"找到网易云音乐进程: {self.netease_pids}")
+            if self._netease_pids:
+                logger.debug("找到网易云音乐进程: %s", self._netease_pids)
             else:
                 logger.warning("未找到网易云音乐进程")
 
         except Exception as e:
-            logger.error(f"获取进程列表失败: {e}")
+            logger.error("获取进程列表失败: %s", e)
 
     def find_main_window(self) -> Optional[WindowInfo]:
         """查找网易云音乐主窗口
@@ -68,6 +77,9 @@ class NeteaseWindowMonitor:
         """
         # 简化版：直接枚举窗口，不先检查进程ID
         # 这样可以避免 psutil 和 win32process 之间的兼容性问题
+        # Windows API 模块按需导入，避免拖慢启动
+        import win32gui
+        import win32process
 
         def callback(hwnd, windows):
             """枚举窗口的回调函数"""
@@ -80,38 +92,38 @@ class NeteaseWindowMonitor:
 
                 # 检查是否是主窗口类名
                 if class_name == self.WINDOW_CLASS_NAME:
-                    logger.debug(f"找到匹配的窗口类名: {class_name} (hwnd={hwnd})")
+                    logger.debug("找到匹配的窗口类名: %s (hwnd=%s)", class_name, hwnd)
 
                     # 获取窗口标题
                     try:
                         title = win32gui.GetWindowText(hwnd)
-                        logger.debug(f"窗口标题: {title}")
+                        logger.debug("窗口标题: %s", title)
                     except Exception as e:
-                        logger.debug(f"获取窗口标题失败 (hwnd={hwnd}): {e}")
+                        logger.debug("获取窗口标题失败 (hwnd=%s): %s", hwnd, e)
                         return True
 
                     # 检查窗口是否可见
                     try:
                         is_visible = win32gui.IsWindowVisible(hwnd)
-                        logger.debug(f"窗口可见: {is_visible}")
+                        logger.debug("窗口可见: %s", is_visible)
                     except Exception as e:
-                        logger.debug(f"检查窗口可见性失败 (hwnd={hwnd}): {e}")
+                        logger.debug("检查窗口可见性失败 (hwnd=%s): %s", hwnd, e)
                         return True
 
                     # 检查标题是否有效
                     if not title or not is_visible:
-                        logger.debug(f"窗口被跳过: title={bool(title)}, visible={is_visible}")
+                        logger.debug("窗口被跳过: title=%s, visible=%s", bool(title), is_visible)
                         return True
 
                     # 获取进程ID（可选）
                     try:
                         _, pid = win32process.GetWindowThreadProcessId(hwnd)
                     except Exception as e:
-                        logger.debug(f"获取窗口进程ID失败 (hwnd={hwnd}): {e}")
+                        logger.debug("获取窗口进程ID失败 (hwnd=%s): %s", hwnd, e)
                         pid = 0
 
                     # 找到目标窗口
-                    logger.debug(f"成功匹配网易云音乐窗口: {title}")
+                    logger.debug("成功匹配网易云音乐窗口: %s", title)
                     window_info = WindowInfo(
                         hwnd=hwnd,
                         title=title,
@@ -125,7 +137,7 @@ class NeteaseWindowMonitor:
                 return True
 
             except Exception as e:
-                logger.debug(f"枚举窗口时出错 (hwnd={hwnd}): {e}")
+                logger.debug("枚举窗口时出错 (hwnd=%s): %s", hwnd, e)
                 return True
 
         windows: list[WindowInfo] = []
@@ -133,13 +145,13 @@ class NeteaseWindowMonitor:
         try:
             logger.debug("开始枚举所有窗口，查找网易云音乐...")
             win32gui.EnumWindows(callback, windows)
-            logger.debug(f"枚举完成，找到 {len(windows)} 个网易云音乐窗口")
+            logger.debug("枚举完成，找到 %s 个网易云音乐窗口", len(windows))
         except PermissionError as e:
             # 即使 EnumWindows 返回时抛出权限错误，如果已经找到窗口，也继续使用
             if windows:
-                logger.warning(f"EnumWindows 返回时出现权限错误，但已找到窗口，继续使用")
+                logger.warning("EnumWindows 返回时出现权限错误，但已找到窗口，继续使用")
             else:
-                logger.error(f"权限不足，无法枚举窗口: {e}")
+                logger.error("权限不足，无法枚举窗口: %s", e)
                 logger.error("请尝试以管理员身份运行本程序")
                 raise PermissionError(
                     "需要管理员权限才能枚举窗口。"
@@ -149,14 +161,14 @@ class NeteaseWindowMonitor:
             # 即使 EnumWindows 返回时抛出其他错误，如果已经找到窗口，也继续使用
             if windows:
                 # 降级为 DEBUG，因为这类错误很常见且不影响功能
-                logger.debug(f"EnumWindows 返回时出现错误，但已找到窗口，继续使用: {e}")
+                logger.debug("EnumWindows 返回时出现错误，但已找到窗口，继续使用: %s", e)
             else:
-                logger.error(f"枚举窗口时发生未知错误: {e}")
-                logger.error(f"错误类型: {type(e).__name__}")
+                logger.error("枚举窗口时发生未知错误: %s", e)
+                logger.error("错误类型: %s", type(e).__name__)
                 return None
 
         if windows:
-            logger.debug(f"找到网易云音乐主窗口: {windows[0].title}")
+            logger.debug("找到网易云音乐主窗口: %s", windows[0].title)
             return windows[0]
 
         logger.debug("未找到网易云音乐主窗口（目标类名: OrpheusBrowserHost）")
@@ -177,7 +189,7 @@ class NeteaseWindowMonitor:
 
         # 窗口标题格式: "歌曲名 - 歌手名"
         if " - " not in title:
-            logger.warning(f"窗口标题格式不正确: {title}")
+            logger.warning("窗口标题格式不正确: %s", title)
             return None
 
         parts = title.split(" - ", 1)
@@ -185,10 +197,10 @@ class NeteaseWindowMonitor:
         artist_name = parts[1].strip()
 
         if not song_name or not artist_name:
-            logger.warning(f"窗口标题内容为空: {title}")
+            logger.warning("窗口标题内容为空: %s", title)
             return None
 
-        logger.debug(f"解析窗口标题: {title} -> 歌曲: {song_name}, 歌手: {artist_name}")
+        logger.debug("解析窗口标题: %s -> 歌曲: %s, 歌手: %s", title, song_name, artist_name)
         return song_name, artist_name
 
     def get_current_song(self) -> Optional[SongInfo]:
@@ -198,7 +210,8 @@ class NeteaseWindowMonitor:
             Optional[SongInfo]: 当前歌曲信息，如果未找到则返回 None
         """
         # 1. 查找主窗口
-        window_info = self.find_main_window()
+        with get_metrics().stage("title_detection"):
+            window_info = self.find_main_window()
         if not window_info:
             return None
 
@@ -4,18 +4,27 @@
 直接调用网易云 Web API，无需第三方 API 服务
 """
 
+import sqlite3
 import time
-from typing import Optional, List
+from collections import Counter
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Optional, List
 from functools import lru_cache
-from datetime import datetime
 
 import requests
 
 from src.config.settings import get_config
 from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics, timed
 from src.models.song_info import SongInfo
-from src.models.comment import Comment
+from src.models.comment import Comment, CommentPage, CommentRefresh
+from src.models.lyrics import Lyrics
 from src.core.crypto import NeteaseCrypto
+from src.core.dedup import dedup_comments
+from src.core.comment_store import CommentStore, get_comment_store
+from src.core.egress_pool import Egress, EgressPool, is_egress_failure
+from src.core.scheduler import AdmissionGate
+from src.core.shared_cache import SharedCache, SharedTokenBucket, get_shared_cache, get_token_bucket
 
 logger = get_logger()
 
@@ -29,6 +38,9 @@ class NeteaseMusicCrawler:
 
     BASE_URL = "https://music.163.com/api"
 
+    # 评论API地址（weapi 加密接口）
+    COMMENT_URL = "https://music.163.com/weapi/comment/resource/comments/get?csrf_token="
+
     def __init__(self):
         """初始化爬虫客户端"""
         config = get_config()
@@ -38,15 +50,152 @@ class NeteaseMusicCrawler:
         self.last_request_time = 0
         self.min_interval = 1.0  # 最小请求间隔（秒）
 
-    def _rate_limit(self) -> None:
-        """请求频率限制"""
-        now = time.time()
-        elapsed = now - self.last_request_time
+        # 限速入口：多个任务线程同时等待时，按任务优先级决定谁取得下一个请求名额
+        self.admission = AdmissionGate(config.scheduler_aging_seconds)
+
+        # 出口池：配置了多个出口时按出口分别限速，请求分散到各出口的会话
+        self.egress_pool: Optional[EgressPool] = None
+        if config.egresses:
+            self.egress_pool = EgressPool(
+                config.egresses, config.egress_rate, config.egress_burst, config.egress_eject_seconds
+            )
+
+        # 本地评论库（离线全文搜索），获取成功的结果增量写入
+        self.store: Optional[CommentStore] = None
+        if config.comment_store_enabled:
+            try:
+                self.store = get_comment_store()
+            except sqlite3.Error as e:
+                logger.warning("打开本地评论库失败，不保存评论: %s", e)
+
+        # 跨进程共享缓存和令牌桶：同一台机器上的多个实例共用，同一首歌只获取一次
+        self.shared_cache: Optional[SharedCache] = None
+        self.token_bucket: Optional[SharedTokenBucket] = None
+        self.shared_ttl = config.comment_cache_time
+        if config.shared_cache_enabled:
+            try:
+                self.shared_cache = get_shared_cache()
+                self.token_bucket = get_token_bucket(config.rate_limit_burst)
+            except sqlite3.Error as e:
+                logger.warning("打开共享缓存失败，仅使用本实例缓存和限速: %s", e)
+                self.shared_cache = self.token_bucket = None
+
+        # 歌曲详情和热门评论按实例缓存：类上的 lru_cache 以 self 为键，
+        # 会让缓存一直持有已废弃的爬虫实例，且大小无法配置
+        self.get_song_detail = lru_cache(maxsize=config.cache_size)(self.get_song_detail)
+        self.get_hot_comments = lru_cache(maxsize=config.cache_size)(self.get_hot_comments)
+        self.get_lyrics = lru_cache(maxsize=config.cache_size)(self.get_lyrics)
+
+    def _rate_limit(self) -> Optional[Egress]:
+        """请求频率限制
+
+        配置了出口池时取下一个有令牌的出口（按出口限速）；否则启用共享缓存时
+        使用所有实例共享的令牌桶（每 min_interval 秒一个令牌），都没有时只限制本实例的请求间隔。
+        等待在 admission 入口内进行，本实例中等待的请求按优先级依次取得名额
+
+        Returns:
+            Optional[Egress]: 本次请求使用的出口，未配置出口池时为 None（使用 self.session）
+        """
+        with self.admission.admit():
+            if self.egress_pool is not None:
+                return self.egress_pool.acquire()
+
+            if self.token_bucket is not None and self.min_interval > 0:
+                try:
+                    self.token_bucket.acquire(1 / self.min_interval)
+                    return None
+                except sqlite3.Error as e:
+                    logger.warning("共享限速不可用，改用本实例限速: %s", e)
+
+            now = time.time()
+            elapsed = now - self.last_request_time
+
+            if elapsed < self.min_interval:
+                time.sleep(self.min_interval - elapsed)
+
+            self.last_request_time = time.time()
+            return None
+
+    def _send(self, egress: Optional[Egress], method: str, url: str, **kwargs) -> requests.Response:
+        """发出一个请求（配置了出口池时使用分到的出口，并报告结果）
+
+        Args:
+            egress: _rate_limit 分到的出口
+            method: 请求方法
+            url: 请求URL
+            **kwargs: 传给 Session.request 的其他参数
+
+        Returns:
+            requests.Response: 状态码正常的响应
+
+        Raises:
+            requests.RequestException: 网络请求失败或状态码错误
+        """
+        session = egress.session if egress is not None else self.session
+
+        try:
+            response = session.request(method, url, timeout=self.timeout, **kwargs)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            if egress is not None:
+                self.egress_pool.report(egress, not is_egress_failure(e))
+            raise
+
+        if egress is not None:
+            self.egress_pool.report(egress, True)
+        return response
+
+    def _save_to_store(
+        self,
+        song: Optional[SongInfo] = None,
+        comments: Optional[List[Comment]] = None,
+        song_id: str = ""
+    ) -> None:
+        """把获取结果写入本地评论库（写入失败不影响正常显示）
+
+        Args:
+            song: 歌曲信息
+            comments: 评论列表
+            song_id: 评论所属的歌曲ID
+        """
+        if self.store is None:
+            return
+
+        try:
+            with get_metrics().stage("store_write"):
+                if song is not None:
+                    self.store.save_song(song)
+                if comments:
+                    self.store.save_comments(song_id, comments)
+        except sqlite3.Error as e:
+            logger.warning("写入本地评论库失败: %s", e)
+
+    def _shared_fetch(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda value: value
+    ) -> Any:
+        """经共享缓存获取（未启用或共享缓存出错时直接调用 loader）
+
+        Args:
+            key: 共享缓存键
+            loader: 实际获取函数
+            encode: 结果转为可 JSON 序列化的值
+            decode: 缓存值转回结果对象
 
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
+        Returns:
+            Any: 获取结果
+        """
+        if self.shared_cache is None:
+            return loader()
 
-        self.last_request_time = time.time()
+        try:
+            return self.shared_cache.fetch(key, loader, self.shared_ttl, encode, decode)
+        except sqlite3.Error as e:
+            logger.warning("读取共享缓存失败: %s", e)
+            return loader()
 
     def _safe_request(
         self,
@@ -64,41 +213,32 @@ class NeteaseMusicCrawler:
         Returns:
             Optional[dict]: API响应的JSON数据，失败则返回 None
         """
-        self._rate_limit()
-
         for attempt in range(self.max_retries):
             try:
                 if method == "GET":
-                    response = self.session.get(
-                        url,
-                        params=params,
-                        timeout=self.timeout
-                    )
+                    response = self._send(self._rate_limit(), "GET", url, params=params)
                 else:
-                    response = self.session.post(
-                        url,
-                        data=params,
-                        timeout=self.timeout
-                    )
+                    response = self._send(self._rate_limit(), "POST", url, data=params)
 
-                response.raise_for_status()
                 return response.json()
 
             except requests.RequestException as e:
                 logger.warning(
-                    f"API请求失败 (尝试 {attempt + 1}/{self.max_retries}): {e}"
+                    "API请求失败 (尝试 %s/%s): %s", attempt + 1, self.max_retries, e
                 )
 
                 if attempt < self.max_retries - 1:
-                    # 指数退避
-                    sleep_time = 2 ** attempt
-                    time.sleep(sleep_time)
+                    # 指数退避（出口池模式下重试换到其他出口，由出口限速和剔除控制节奏）
+                    if self.egress_pool is None:
+                        sleep_time = 2 ** attempt
+                        time.sleep(sleep_time)
                 else:
-                    logger.error(f"API请求失败，已达最大重试次数")
+                    logger.error("API请求失败，已达最大重试次数")
                     return None
 
         return None
 
+    @timed("search_song")
     def search_song(
         self,
         song_name: str,
@@ -113,6 +253,13 @@ class NeteaseMusicCrawler:
         Returns:
             Optional[str]: 找到的歌曲ID，未找到则返回 None
         """
+        return self._shared_fetch(
+            f"search:{song_name}\t{artist_name}",
+            lambda: self._search_song(song_name, artist_name)
+        )
+
+    def _search_song(self, song_name: str, artist_name: str) -> Optional[str]:
+        """请求搜索接口（search_song 未命中共享缓存时调用）"""
         keywords = f"{song_name} {artist_name}"
         url = f"{self.BASE_URL}/search/get/web"
         params = {
@@ -122,7 +269,7 @@ class NeteaseMusicCrawler:
             "limit": "5"
         }
 
-        logger.debug(f"搜索歌曲: {keywords}")
+        logger.debug("搜索歌曲: %s", keywords)
         response = self._safe_request(url, params)
 
         if not response or response.get("code") != 200:
@@ -131,15 +278,15 @@ class NeteaseMusicCrawler:
 
         songs = response.get("result", {}).get("songs", [])
         if not songs:
-            logger.warning(f"未找到歌曲: {keywords}")
+            logger.warning("未找到歌曲: %s", keywords)
             return None
 
         # 返回第一个结果的ID
         song_id = str(songs[0]["id"])
-        logger.debug(f"找到歌曲ID: {song_id}")
+        logger.debug("找到歌曲ID: %s", song_id)
         return song_id
 
-    @lru_cache(maxsize=50)
+    @timed("get_song_detail")
     def get_song_detail(self, song_id: str) -> Optional[SongInfo]:
         """获取歌曲详情（带缓存）
 
@@ -152,19 +299,28 @@ class NeteaseMusicCrawler:
         Returns:
             Optional[SongInfo]: 歌曲详情对象，失败则返回 None
         """
+        return self._shared_fetch(
+            f"detail:{song_id}",
+            lambda: self._fetch_song_detail(song_id),
+            encode=asdict,
+            decode=lambda data: SongInfo(**data)
+        )
+
+    def _fetch_song_detail(self, song_id: str) -> Optional[SongInfo]:
+        """请求歌曲详情接口（get_song_detail 未命中共享缓存时调用）"""
         url = f"{self.BASE_URL}/song/detail"
         params = {"ids": f'["{song_id}"]'}  # JSON数组格式: ["543965520"]
 
-        logger.debug(f"获取歌曲详情: {song_id}")
+        logger.debug("获取歌曲详情: %s", song_id)
         response = self._safe_request(url, params)
 
         if not response or response.get("code") != 200:
-            logger.error(f"获取歌曲详情失败: {song_id}")
+            logger.error("获取歌曲详情失败: %s", song_id)
             return None
 
         songs = response.get("songs", [])
         if not songs:
-            logger.warning(f"歌曲详情为空: {song_id}")
+            logger.warning("歌曲详情为空: %s", song_id)
             return None
 
         song_data = songs[0]
@@ -172,7 +328,7 @@ class NeteaseMusicCrawler:
         # V2版本：使用专辑类型和子类型作为风格标签的替代
         # 网易云 /api/song/detail 接口不返回 songTag 字段
         # 因此我们使用 album.type 和 album.subType 作为风格标签
-        album_data = song_data.get("album", {})
+        album_data = song_data.get("album") or {}
         genres = []
 
         # 添加专辑类型（Single/Album/EP等）
@@ -197,40 +353,124 @@ class NeteaseMusicCrawler:
         if not genres:
             genres = ["流行"]
 
-        return SongInfo(
+        song = SongInfo(
             song_id=str(song_data.get("id")),
-            name=song_data.get("name", ""),
-            artist=song_data.get("artists", [{}])[0].get("name", ""),
-            album=song_data.get("album", {}).get("name", ""),
+            # 字段可能为 null，驻留字符串前统一转为空字符串
+            name=song_data.get("name") or "",
+            artist=((song_data.get("artists") or [{}])[0] or {}).get("name") or "",
+            album=album_data.get("name") or "",
             genres=genres,
-            duration=song_data.get("duration", 0) // 1000
+            duration=song_data.get("duration", 0) // 1000,
+            cover_url=album_data.get("picUrl") or ""
         )
+        self._save_to_store(song=song)
+        return song
 
-    @lru_cache(maxsize=50)
-    def get_hot_comments(self, song_id: str) -> List[Comment]:
-        """获取热门评论（带缓存）
+    @timed("get_lyrics")
+    def get_lyrics(self, song_id: str) -> Optional[Lyrics]:
+        """获取已解析的歌词（带缓存）
 
-        V2版本：实现了加密算法，可以获取真实评论
+        依次查找本地评论库、共享缓存和歌词接口；原始 LRC 保存在本地评论库中，
+        重复播放时不再请求，解析结果按实例缓存
 
         Args:
             song_id: 歌曲ID
 
         Returns:
-            List[Comment]: 热门评论列表
+            Optional[Lyrics]: 歌词（纯音乐或没有歌词时为空），失败则返回 None
+        """
+        lrc = None
+        if self.store is not None:
+            try:
+                lrc = self.store.get_lyrics(song_id)
+            except sqlite3.Error as e:
+                logger.warning("读取本地歌词失败: %s", e)
+
+        if lrc is None:
+            lrc = self._shared_fetch(f"lyric:{song_id}", lambda: self._fetch_lyrics(song_id))
+            if lrc is None:
+                return None
+
+        return Lyrics.parse(lrc)
+
+    def _fetch_lyrics(self, song_id: str) -> Optional[str]:
+        """请求歌词接口（get_lyrics 未命中缓存时调用）
+
+        Returns:
+            Optional[str]: LRC 文本，没有歌词时为空字符串，失败则返回 None
+        """
+        url = f"{self.BASE_URL}/song/lyric"
+        params = {"id": song_id, "lv": "-1", "tv": "-1"}
+
+        logger.debug("获取歌词: %s", song_id)
+        response = self._safe_request(url, params)
+
+        if not response or response.get("code") != 200:
+            logger.error("获取歌词失败: %s", song_id)
+            return None
+
+        # 纯音乐（nolyric）和未收录歌词（uncollected）的响应中没有 lrc 字段
+        lrc = (response.get("lrc") or {}).get("lyric") or ""
+
+        if self.store is not None:
+            try:
+                self.store.save_lyrics(song_id, lrc)
+            except sqlite3.Error as e:
+                logger.warning("写入本地歌词失败: %s", e)
+        return lrc
+
+    @staticmethod
+    def _parse_comment(item: dict) -> Comment:
+        """把接口返回的单条评论解析为 Comment
+
+        Args:
+            item: 接口返回的评论数据
+
+        Returns:
+            Comment: 评论对象
         """
-        logger.debug(f"获取热门评论: {song_id}")
+        # 注销用户等情况下字段为 null，驻留字符串前统一转为空字符串
+        user = item.get("user") or {}
+        return Comment(
+            content=item.get("content") or "",
+            user=user.get("nickname") or "",
+            likes=item.get("likedCount") or 0,
+            time_ms=item.get("time") or 0,
+            comment_id=item.get("commentId") or 0,
+            avatar_url=user.get("avatarUrl") or ""
+        )
+
+    def _fetch_comment_data(
+        self,
+        song_id: str,
+        page_no: int = 1,
+        cursor: str = "-1",
+        page_size: int = 20,
+        usage: Optional[Counter] = None
+    ) -> Optional[dict]:
+        """请求评论接口（weapi 加密）
+
+        Args:
+            song_id: 歌曲ID
+            page_no: 页码（从1开始）
+            cursor: 分页游标，第一页为 "-1"
+            page_size: 每页条数
+            usage: 累计请求数（requests）和响应字节数（bytes），增量刷新统计节省量时使用
 
-        # 评论API地址
-        url = "https://music.163.com/weapi/comment/resource/comments/get?csrf_token="
+        Returns:
+            Optional[dict]: 响应中的 data 字段，失败则返回 None
 
+        Raises:
+            requests.RequestException: 网络请求失败
+        """
         # 请求参数
         request_data = {
             'csrf_token': '',
-            'cursor': '-1',
+            'cursor': cursor,
             'offset': '0',
             'orderType': '1',  # 1=热门评论
-            'pageNo': '1',
-            'pageSize': '20',
+            'pageNo': str(page_no),
+            'pageSize': str(page_size),
             'rid': f'R_SO_4_{song_id}',
             'threadId': f'R_SO_4_{song_id}'
         }
@@ -238,49 +478,248 @@ class NeteaseMusicCrawler:
         # 加密参数
         encrypted_data = NeteaseCrypto.encrypt_request(request_data)
 
-        # 发送POST请求
-        try:
-            response = self.session.post(
-                url,
-                data=encrypted_data,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
+        # 发送POST请求（评论接口限流最严，同样经过限速入口）
+        egress = self._rate_limit()
+        metrics = get_metrics()
+        with metrics.stage("comment_http"):
+            response = self._send(egress, "POST", self.COMMENT_URL, data=encrypted_data)
+
+        if usage is not None:
+            usage["requests"] += 1
+            usage["bytes"] += len(response.content)
+
+        with metrics.stage("comment_parse"):
             result = response.json()
 
-            if result.get("code") != 200:
-                logger.error(f"获取评论失败: {result.get('message', 'Unknown error')}")
+        if result.get("code") != 200:
+            logger.error("获取评论失败: %s", result.get('message', 'Unknown error'))
+            return None
+
+        return result.get("data", {})
+
+    def get_hot_comments(self, song_id: str) -> List[Comment]:
+        """获取热门评论（带缓存）
+
+        V2版本：实现了加密算法，可以获取真实评论
+
+        Args:
+            song_id: 歌曲ID
+
+        Returns:
+            List[Comment]: 热门评论列表
+        """
+        return self._shared_fetch(
+            f"hot:{song_id}",
+            lambda: self._fetch_hot_comments(song_id),
+            encode=lambda comments: [asdict(comment) for comment in comments],
+            decode=lambda items: [Comment(**item) for item in items]
+        )
+
+    def _fetch_hot_comments(self, song_id: str) -> List[Comment]:
+        """请求热门评论接口（get_hot_comments 未命中共享缓存时调用）
+
+        本地评论库已有该歌曲的评论时（缓存过期后重新获取）改为增量刷新：
+        界面在等待结果，只请求第一页，与直接获取相同的一次请求，顺带更新已缓存评论的点赞数
+        """
+        logger.debug("获取热门评论: %s", song_id)
+
+        known = self._get_known_comments(song_id)
+        if known:
+            result = self._refresh_comments(song_id, known, max_pages=1, page_size=20)
+            if result is None:
+                return []
+            if not result.hot_comments:
+                logger.warning("歌曲 %s 没有热门评论", song_id)
+            return result.hot_comments
+
+        try:
+            data = self._fetch_comment_data(song_id)
+            if data is None:
                 return []
 
             # 解析评论数据
-            hot_comments = result.get("data", {}).get("hotComments", [])
+            hot_comments = data.get("hotComments", [])
             if not hot_comments:
-                logger.warning(f"歌曲 {song_id} 没有热门评论")
+                logger.warning("歌曲 %s 没有热门评论", song_id)
                 return []
 
-            comments = []
-            for item in hot_comments[:20]:  # 最多20条
-                # 解析时间戳
-                timestamp = item.get("time", 0)
-                comment_time = datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d %H:%M')
-
-                comment = Comment(
-                    content=item.get("content", ""),
-                    user=item.get("user", {}).get("nickname", ""),
-                    likes=item.get("likedCount", 0),
-                    time=comment_time
-                )
-                comments.append(comment)
+            with get_metrics().stage("comment_build"):
+                comments = [self._parse_comment(item) for item in hot_comments[:20]]  # 最多20条
 
-            logger.debug(f"成功获取 {len(comments)} 条热门评论")
+            # 去掉复制粘贴的近似重复评论，避免浪费轮播位置
+            with get_metrics().stage("comment_dedup"):
+                comments = dedup_comments(comments)
+
+            self._save_to_store(comments=comments, song_id=song_id)
+
+            logger.debug("成功获取 %s 条热门评论", len(comments))
             return comments
 
         except Exception as e:
-            logger.error(f"获取评论时出错: {e}")
+            logger.error("获取评论时出错: %s", e)
             return []
 
+    def get_comments_page(
+        self,
+        song_id: str,
+        page_no: int = 1,
+        cursor: str = "-1",
+        page_size: int = 20
+    ) -> Optional[CommentPage]:
+        """按游标分页获取评论（用于评论浏览面板）
+
+        Args:
+            song_id: 歌曲ID
+            page_no: 页码（从1开始）
+            cursor: 上一页返回的游标，第一页为 "-1"
+            page_size: 每页条数
+
+        Returns:
+            Optional[CommentPage]: 分页结果，失败则返回 None
+        """
+        logger.debug("获取评论分页: %s 第 %s 页", song_id, page_no)
+
+        try:
+            data = self._fetch_comment_data(song_id, page_no, cursor, page_size)
+            if data is None:
+                return None
+
+            with get_metrics().stage("comment_build"):
+                comments = [self._parse_comment(item) for item in data.get("comments") or []]
+
+            return CommentPage(
+                comments=comments,
+                cursor=str(data.get("cursor", "")),
+                has_more=bool(data.get("hasMore", False)),
+                total=data.get("totalCount", 0)
+            )
+
+        except Exception as e:
+            logger.error("获取评论分页时出错: %s", e)
+            return None
+
+    def _get_known_comments(self, song_id: str) -> Dict[int, int]:
+        """读取本地评论库中该歌曲已缓存评论的点赞数（未启用或读取失败时为空）"""
+        if self.store is None:
+            return {}
+
+        try:
+            return self.store.get_comment_likes(song_id)
+        except sqlite3.Error as e:
+            logger.warning("读取本地评论失败: %s", e)
+            return {}
+
+    @timed("refresh_comments")
+    def refresh_comments(
+        self,
+        song_id: str,
+        max_pages: Optional[int] = None,
+        page_size: int = 20
+    ) -> Optional[CommentRefresh]:
+        """增量刷新歌曲的评论，最新的热门评论写回共享缓存
+
+        Args:
+            song_id: 歌曲ID
+            max_pages: 最多请求的页数，默认为配置中的 comment_refresh_max_pages
+            page_size: 每页条数
+
+        Returns:
+            Optional[CommentRefresh]: 刷新结果，第一页获取失败则返回 None
+        """
+        result = self._refresh_comments(
+            song_id, self._get_known_comments(song_id),
+            max_pages or get_config().comment_refresh_max_pages, page_size
+        )
+        if result is not None and result.hot_comments and self.shared_cache is not None:
+            try:
+                self.shared_cache.put(
+                    f"hot:{song_id}", [asdict(comment) for comment in result.hot_comments], self.shared_ttl
+                )
+            except sqlite3.Error as e:
+                logger.warning("写入共享缓存失败: %s", e)
+        return result
+
+    def _refresh_comments(
+        self,
+        song_id: str,
+        known: Dict[int, int],
+        max_pages: int,
+        page_size: int
+    ) -> Optional[CommentRefresh]:
+        """增量刷新评论
+
+        第一页与直接获取热门评论是同一个请求，带有热门评论；本地已缓存的评论
+        都已出现在获取到的评论中（通常是都在热门评论里）时停止，否则按游标继续请求，
+        直到没有更多或达到 max_pages。后续页与第一页同样按接口的排序返回，
+        不假设按时间排序。获取到的评论按评论ID与本地评论库合并：已有评论更新点赞数，新评论插入
+
+        Args:
+            song_id: 歌曲ID
+            known: 本地已缓存评论的 评论ID → 点赞数
+            max_pages: 最多请求的页数
+            page_size: 每页条数
+
+        Returns:
+            Optional[CommentRefresh]: 刷新结果，第一页获取失败则返回 None
+        """
+        usage = Counter()
+        fetched: dict[int, Comment] = {}
+        hot: List[Comment] = []
+        first_page_bytes = None
+        page_no, cursor = 1, "-1"
+
+        try:
+            while page_no <= max_pages:
+                data = self._fetch_comment_data(song_id, page_no, cursor, page_size, usage)
+                if data is None:
+                    break
+
+                with get_metrics().stage("comment_build"):
+                    if page_no == 1:
+                        first_page_bytes = usage["bytes"]
+                        hot = [self._parse_comment(item) for item in (data.get("hotComments") or [])[:20]]
+                    page = [self._parse_comment(item) for item in data.get("comments") or []]
+
+                for comment in hot + page:
+                    fetched.setdefault(comment.comment_id, comment)
+
+                if not data.get("hasMore") or known.keys() <= fetched.keys():
+                    break
+                page_no, cursor = page_no + 1, str(data.get("cursor", ""))
+
+        except Exception as e:
+            logger.error("增量刷新评论时出错: %s", e)
+
+        if first_page_bytes is None:
+            return None
+
+        # 没有评论ID的评论无法合并
+        fetched.pop(0, None)
+        updated = sum(1 for comment in fetched.values()
+                      if comment.comment_id in known and known[comment.comment_id] != comment.likes)
+        self._save_to_store(comments=list(fetched.values()), song_id=song_id)
+
+        with get_metrics().stage("comment_dedup"):
+            hot = dedup_comments(hot)
+
+        result = CommentRefresh(
+            hot_comments=hot,
+            new=sum(1 for comment_id in fetched if comment_id not in known),
+            updated=updated,
+            requests=usage["requests"],
+            bytes_received=usage["bytes"],
+            extra_requests=usage["requests"] - 1,
+            extra_bytes=usage["bytes"] - first_page_bytes,
+        )
+        logger.debug(
+            "增量刷新 %s: 新增 %s 条，更新 %s 条，请求 %s 次",
+            song_id, result.new, result.updated, result.requests
+        )
+        return result
+
     def clear_cache(self) -> None:
         """清空缓存"""
         self.get_song_detail.cache_clear()
         self.get_hot_comments.cache_clear()
+        self.get_lyrics.cache_clear()
         logger.info("爬虫缓存已清空")
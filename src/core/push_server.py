@@ -0,0 +1,227 @@
+"""
+本地推送接口
+
+可选的内嵌 HTTP 服务（仅监听 127.0.0.1），供直播叠加层、状态栏等外部程序读取当前歌曲和评论：
+- GET /state   当前歌曲、评论列表和轮播位置（JSON）
+- GET /events  Server-Sent Events：连接时先推送一次完整状态，之后只在切歌或轮播时推送
+
+服务运行在后台线程，每个订阅者一个线程阻塞在同一个 Condition 上，空闲时没有轮询开销；
+每个事件只序列化一次，所有订阅者写出同一份字节
+"""
+
+import json
+import threading
+from collections import deque
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from src.models.song_info import SongInfo
+from src.models.comment import Comment
+from src.utils.logger import get_logger
+
+logger = get_logger()
+
+# 订阅者无事件时发送保活注释的间隔（秒），同时用于发现已断开的连接
+KEEPALIVE_SECONDS = 15.0
+
+# 保留的最近事件数：订阅者落后超过这么多事件时直接补发完整状态
+EVENT_HISTORY = 64
+
+
+def _sse_frame(event: str, data: bytes) -> bytes:
+    """编码一条 SSE 消息（data 为单行 JSON）"""
+    return b"event: " + event.encode("ascii") + b"\ndata: " + data + b"\n\n"
+
+
+class Broadcaster:
+    """事件广播器
+
+    发布方（GUI 线程）只做一次编码和 notify_all；订阅方按版本号取走错过的事件
+    """
+
+    def __init__(self, history: int = EVENT_HISTORY):
+        """初始化广播器
+
+        Args:
+            history: 保留的最近事件数
+        """
+        self._cond = threading.Condition()
+        self._version = 0
+        self._events: deque[tuple[int, bytes]] = deque(maxlen=history)
+        self._state = b"{}"
+        self._closed = False
+
+    @property
+    def state(self) -> bytes:
+        """当前完整状态（JSON）"""
+        with self._cond:
+            return self._state
+
+    def publish(self, event: str, data: bytes, state: bytes) -> None:
+        """发布一个事件
+
+        Args:
+            event: 事件名
+            data: 事件数据（JSON）
+            state: 发布后的完整状态（JSON）
+        """
+        frame = _sse_frame(event, data)
+        with self._cond:
+            self._version += 1
+            self._events.append((self._version, frame))
+            self._state = state
+            self._cond.notify_all()
+
+    def snapshot(self) -> tuple[int, bytes]:
+        """当前版本号和完整状态消息（订阅者连接时发送）"""
+        with self._cond:
+            return self._version, _sse_frame("song", self._state)
+
+    def wait(self, after: int, timeout: float) -> Optional[tuple[int, list[bytes]]]:
+        """等待版本号 after 之后的事件
+
+        Args:
+            after: 订阅者已收到的版本号
+            timeout: 最长等待时间（秒）
+
+        Returns:
+            Optional[tuple[int, list[bytes]]]: (最新版本号, 待发送的消息)；超时返回空列表，
+            广播器已关闭返回 None
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._closed or self._version > after, timeout)
+            if self._closed:
+                return None
+            if self._version == after:
+                return after, []
+
+            # 落后太多，中间事件已被丢弃：直接补发完整状态
+            if self._events[0][0] > after + 1:
+                return self._version, [_sse_frame("song", self._state)]
+            return self._version, [frame for version, frame in self._events if version > after]
+
+    def close(self) -> None:
+        """关闭广播器，唤醒所有订阅者"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class PushServer:
+    """本地推送服务"""
+
+    def __init__(self, port: int = 0, host: str = "127.0.0.1"):
+        """初始化推送服务（未启动）
+
+        Args:
+            port: 监听端口，0 表示随机端口
+            host: 监听地址，默认只允许本机访问
+        """
+        self.broadcaster = Broadcaster()
+        self._song: Optional[dict] = None
+        self._comments: list[dict] = []
+        self._index = 0
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """实际监听的端口"""
+        return self._httpd.server_address[1]
+
+    def start(self) -> "PushServer":
+        """在后台线程启动服务"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="push-api", daemon=True)
+        self._thread.start()
+        logger.info("本地推送接口已启动: http://127.0.0.1:%s/events", self.port)
+        return self
+
+    def stop(self) -> None:
+        """停止服务并断开所有订阅者"""
+        self.broadcaster.close()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _state_bytes(self) -> bytes:
+        """编码当前完整状态"""
+        return json.dumps(
+            {"song": self._song, "comments": self._comments, "index": self._index},
+            ensure_ascii=False
+        ).encode("utf-8")
+
+    def publish_song(self, song: SongInfo, comments: list[Comment], index: int) -> None:
+        """推送切歌事件（GUI 线程调用）
+
+        Args:
+            song: 歌曲信息
+            comments: 评论列表
+            index: 当前轮播位置
+        """
+        self._song = asdict(song)
+        self._comments = [asdict(comment) for comment in comments]
+        self._index = index
+        state = self._state_bytes()
+        self.broadcaster.publish("song", state, state)
+
+    def publish_rotation(self, index: int) -> None:
+        """推送轮播事件（GUI 线程调用）
+
+        Args:
+            index: 新的轮播位置
+        """
+        self._index = index
+        data = json.dumps({"index": index}).encode("utf-8")
+        self.broadcaster.publish("rotation", data, self._state_bytes())
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # 事件流以关闭连接结束，不使用分块编码
+            protocol_version = "HTTP/1.0"
+
+            def _send_headers(self, content_type: str, length: Optional[int] = None) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Cache-Control", "no-cache")
+                # 允许浏览器源（如直播软件的网页叠加层）跨域订阅
+                self.send_header("Access-Control-Allow-Origin", "*")
+                if length is not None:
+                    self.send_header("Content-Length", str(length))
+                self.end_headers()
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if path == "/state":
+                    body = server.broadcaster.state
+                    self._send_headers("application/json; charset=utf-8", len(body))
+                    self.wfile.write(body)
+                elif path == "/events":
+                    self._stream_events()
+                else:
+                    self.send_error(404)
+
+            def _stream_events(self) -> None:
+                self._send_headers("text/event-stream; charset=utf-8")
+                version, frame = server.broadcaster.snapshot()
+                try:
+                    self.wfile.write(frame)
+                    self.wfile.flush()
+                    while True:
+                        result = server.broadcaster.wait(version, KEEPALIVE_SECONDS)
+                        if result is None:
+                            return
+                        version, frames = result
+                        self.wfile.write(b"".join(frames) if frames else b": keepalive\n\n")
+                        self.wfile.flush()
+                except ConnectionError:
+                    # 订阅者断开
+                    return
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
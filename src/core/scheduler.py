@@ -0,0 +1,247 @@
+"""
+请求调度器
+
+网络请求分两层按优先级排队：
+- RequestScheduler：任务线程池，按优先级出队（当前歌曲获取、翻页、后台抓取等整个任务）
+- AdmissionGate：爬虫每次发请求前的限速入口，等待中的请求按优先级取得下一个请求名额，
+  后台任务正在执行时到来的前台请求不必等后台任务的剩余请求全部发完
+
+优先级：
+- FOREGROUND：当前播放歌曲的获取，用户正在等待
+- INTERACTIVE：评论浏览面板翻页等用户操作
+- BACKGROUND：预取、批量抓取等后台任务
+
+同一优先级内先到先出；等待时间越长的有效优先级越高（老化），
+低一级优先级每等待 aging_seconds 秒提升一级，不会被前台请求无限期饿死。
+调度器执行任务时记录任务的优先级，任务中发出的请求在入口处沿用该优先级；
+各优先级的任务排队时间和请求入口等待时间记录到延迟统计（queue_wait_<优先级>、admit_wait_<优先级>）
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Iterator, Optional
+
+from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics
+
+logger = get_logger()
+
+
+class Priority(IntEnum):
+    """请求优先级（数值越小越优先）"""
+    FOREGROUND = 0
+    INTERACTIVE = 1
+    BACKGROUND = 2
+
+
+# 调度器工作线程中正在执行的任务优先级
+_current = threading.local()
+
+
+def current_priority() -> Priority:
+    """当前线程正在执行的任务优先级
+
+    Returns:
+        Priority: 调度器任务中返回任务的优先级，其他线程（直接调用）视为前台
+    """
+    return getattr(_current, "priority", Priority.FOREGROUND)
+
+
+class AdmissionGate:
+    """按优先级放行的请求入口
+
+    同一时刻只有一个请求在入口内（执行限速等待）；它离开后，
+    等待中有效优先级最高的请求进入，排序规则与 RequestScheduler 相同
+    """
+
+    def __init__(self, aging_seconds: float = 10.0):
+        """初始化入口
+
+        Args:
+            aging_seconds: 低一级优先级的请求等待多少秒后与高一级同等对待
+        """
+        self.aging_seconds = aging_seconds
+        self._waiting: list[tuple[float, int]] = []
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._busy = False
+
+    @contextmanager
+    def admit(self, priority: Optional[Priority] = None) -> Iterator[None]:
+        """等待轮到本请求，在 with 块内独占入口
+
+        Args:
+            priority: 请求优先级，默认为当前任务的优先级
+        """
+        if priority is None:
+            priority = current_priority()
+
+        now = time.monotonic()
+        ticket = (now + priority * self.aging_seconds, next(self._seq))
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            self._cond.wait_for(lambda: not self._busy and self._waiting[0] == ticket)
+            heapq.heappop(self._waiting)
+            self._busy = True
+
+        get_metrics().record(f"admit_wait_{priority.name.lower()}", (time.monotonic() - now) * 1000)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+
+@dataclass(order=True)
+class _Job:
+    """排队中的任务
+
+    排序键 deadline = 入队时间 + 优先级 × aging_seconds：
+    优先级低一级相当于晚到 aging_seconds 秒，因此等待足够久的低优先级任务会排到前面
+    """
+    deadline: float
+    seq: int
+    priority: Priority = field(compare=False)
+    enqueued: float = field(compare=False)
+    fn: Callable[..., Any] = field(compare=False)
+    args: tuple = field(compare=False)
+    kwargs: dict = field(compare=False)
+    future: Future = field(compare=False)
+
+
+class RequestScheduler:
+    """按优先级执行网络任务的线程池
+
+    接口与 ThreadPoolExecutor 的 submit/shutdown 一致，submit 额外接收优先级
+    """
+
+    def __init__(self, max_workers: int = 1, aging_seconds: float = 10.0, thread_name_prefix: str = "fetch"):
+        """初始化调度器（工作线程在首次提交任务时创建）
+
+        Args:
+            max_workers: 工作线程数；多个线程共用爬虫时由爬虫的 AdmissionGate 串行发出请求
+            aging_seconds: 低一级优先级的任务等待多少秒后与高一级同等对待
+            thread_name_prefix: 工作线程名前缀
+        """
+        self.max_workers = max_workers
+        self.aging_seconds = aging_seconds
+        self.thread_name_prefix = thread_name_prefix
+
+        self._queue: list[_Job] = []
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._threads: list[threading.Thread] = []
+        self._shutdown = False
+
+    def submit(self, priority: Priority, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """提交任务
+
+        Args:
+            priority: 优先级
+            fn: 任务函数
+            *args: 位置参数
+            **kwargs: 关键字参数
+
+        Returns:
+            Future: 任务结果
+
+        Raises:
+            RuntimeError: 调度器已关闭
+        """
+        now = time.monotonic()
+        job = _Job(
+            deadline=now + priority * self.aging_seconds,
+            seq=next(self._seq),
+            priority=priority,
+            enqueued=now,
+            fn=fn,
+            args=args,
+            kwargs=kwargs,
+            future=Future(),
+        )
+
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("调度器已关闭")
+            heapq.heappush(self._queue, job)
+            if len(self._threads) < self.max_workers:
+                self._start_worker()
+            self._cond.notify()
+
+        return job.future
+
+    def pending(self) -> dict[Priority, int]:
+        """各优先级排队中的任务数"""
+        with self._cond:
+            counts = {priority: 0 for priority in Priority}
+            for job in self._queue:
+                counts[job.priority] += 1
+        return counts
+
+    def _start_worker(self) -> None:
+        """创建一个工作线程（持有 _cond 时调用）"""
+        thread = threading.Thread(
+            target=self._worker,
+            name=f"{self.thread_name_prefix}_{len(self._threads)}",
+            daemon=True,
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _next_job(self) -> Optional[_Job]:
+        """取出下一个任务，队列为空且已关闭时返回 None"""
+        with self._cond:
+            self._cond.wait_for(lambda: self._queue or self._shutdown)
+            if not self._queue:
+                return None
+            return heapq.heappop(self._queue)
+
+    def _worker(self) -> None:
+        """工作线程：按优先级取任务执行"""
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+
+            if not job.future.set_running_or_notify_cancel():
+                continue
+
+            wait_ms = (time.monotonic() - job.enqueued) * 1000
+            get_metrics().record(f"queue_wait_{job.priority.name.lower()}", wait_ms)
+
+            _current.priority = job.priority
+            try:
+                result = job.fn(*job.args, **job.kwargs)
+            except BaseException as e:
+                logger.error("调度任务执行出错（%s）: %s", job.priority.name, e)
+                job.future.set_exception(e)
+            else:
+                job.future.set_result(result)
+            finally:
+                del _current.priority
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """关闭调度器
+
+        Args:
+            wait: 是否等待正在执行和排队的任务完成
+            cancel_futures: 是否取消尚未开始的任务
+        """
+        with self._cond:
+            self._shutdown = True
+            if cancel_futures:
+                for job in self._queue:
+                    job.future.cancel()
+                self._queue.clear()
+            self._cond.notify_all()
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
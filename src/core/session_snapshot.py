@@ -0,0 +1,144 @@
+"""
+会话快照模块
+
+保存上次显示的歌曲、评论列表和轮播位置，启动时无需等待网络即可立即显示
+"""
+
+import json
+import os
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Optional, List
+
+from src.config.settings import AppConfig
+from src.utils.logger import get_logger
+from src.models.song_info import SongInfo
+from src.models.comment import Comment
+
+logger = get_logger()
+
+# 快照格式版本，结构变化时递增，旧快照直接丢弃
+SNAPSHOT_VERSION = 2
+
+
+@dataclass
+class SessionSnapshot:
+    """会话快照
+
+    Attributes:
+        title_song: 窗口标题中的歌曲名（用于判断快照是否仍然有效）
+        title_artist: 窗口标题中的歌手名
+        song: 上次显示的歌曲详情
+        comments: 上次显示的评论列表
+        index: 上次的轮播位置
+    """
+    title_song: str
+    title_artist: str
+    song: SongInfo
+    comments: List[Comment] = field(default_factory=list)
+    index: int = 0
+
+    def matches(self, song_name: str, artist_name: str) -> bool:
+        """判断快照是否对应当前窗口标题中的歌曲
+
+        Args:
+            song_name: 当前歌曲名
+            artist_name: 当前歌手名
+
+        Returns:
+            bool: 是否为同一首歌
+        """
+        return self.title_song == song_name and self.title_artist == artist_name
+
+    def to_dict(self) -> dict:
+        """转换为可序列化的字典
+
+        Returns:
+            dict: 快照数据
+        """
+        return {
+            "version": SNAPSHOT_VERSION,
+            "title_song": self.title_song,
+            "title_artist": self.title_artist,
+            "song": asdict(self.song),
+            "comments": [asdict(comment) for comment in self.comments],
+            "index": self.index,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SessionSnapshot":
+        """从字典构建快照
+
+        Args:
+            data: 快照数据
+
+        Returns:
+            SessionSnapshot: 快照对象
+
+        Raises:
+            ValueError: 快照版本不匹配
+        """
+        if data.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"快照版本不匹配: {data.get('version')}")
+
+        return cls(
+            title_song=data["title_song"],
+            title_artist=data["title_artist"],
+            song=SongInfo(**data["song"]),
+            comments=[Comment(**item) for item in data["comments"]],
+            index=data.get("index", 0),
+        )
+
+
+def get_snapshot_path() -> Path:
+    """获取快照文件路径（与配置文件同目录）
+
+    Returns:
+        Path: 快照文件的完整路径
+    """
+    return AppConfig.get_config_path().parent / "last_session.json"
+
+
+def load_session_snapshot(path: Optional[Path] = None) -> Optional[SessionSnapshot]:
+    """读取上次会话快照
+
+    Args:
+        path: 快照文件路径，默认为配置目录下的 last_session.json
+
+    Returns:
+        Optional[SessionSnapshot]: 快照对象，不存在或损坏则返回 None
+    """
+    if path is None:
+        path = get_snapshot_path()
+
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return SessionSnapshot.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"会话快照无效，已忽略: {e}")
+        return None
+
+
+def save_session_snapshot(snapshot: SessionSnapshot, path: Optional[Path] = None) -> None:
+    """保存会话快照
+
+    先写入临时文件再原子替换，避免退出时写到一半导致快照损坏
+
+    Args:
+        snapshot: 快照对象
+        path: 快照文件路径，默认为配置目录下的 last_session.json
+    """
+    if path is None:
+        path = get_snapshot_path()
+
+    tmp_path = path.with_suffix(".tmp")
+
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.error(f"保存会话快照失败: {e}")
@@ -0,0 +1,324 @@
+"""
+跨进程共享缓存与限速
+
+同一台机器上的多个实例（悬浮窗 + 后台实例、每个显示器一个悬浮窗等）共用配置目录下的
+一个 SQLite WAL 文件：
+- 搜索结果、歌曲详情和热门评论写入共享缓存，一个实例获取过的歌曲其他实例直接复用；
+  未命中时先抢占获取租约，同一首歌同一时间只有一个实例访问接口，其余实例等待结果
+- 令牌桶状态保存在同一文件中，所有实例合计的请求速率不超过限速
+
+跨进程互斥依靠 SQLite 的文件锁（BEGIN IMMEDIATE 事务），Windows 和 Linux 行为一致
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from src.config.settings import AppConfig
+from src.utils.logger import get_logger
+
+logger = get_logger()
+
+# 获取租约时长（秒）：持有者崩溃时，其他实例最多等待这么久后接手
+LEASE_SECONDS = 30.0
+
+# 等待其他实例获取结果时的轮询间隔（秒）
+LEASE_POLL_SECONDS = 0.05
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires_at);
+
+CREATE TABLE IF NOT EXISTS leases (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS token_bucket (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def get_shared_cache_path() -> Path:
+    """获取共享缓存文件路径（与配置文件同目录）
+
+    Returns:
+        Path: 数据库文件的完整路径
+    """
+    return AppConfig.get_config_path().parent / "shared_cache.db"
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """打开共享缓存文件
+
+    使用自动提交模式，需要跨进程互斥的操作显式执行 BEGIN IMMEDIATE
+
+    Args:
+        path: 数据库文件路径
+
+    Returns:
+        sqlite3.Connection: 数据库连接
+    """
+    conn = sqlite3.connect(str(path), timeout=10, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+class _ImmediateTransaction:
+    """BEGIN IMMEDIATE 事务：开始时即取得数据库写锁，其他进程的写事务排队等待"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._conn.execute("BEGIN IMMEDIATE")
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+class SharedCache:
+    """跨进程共享缓存
+
+    值以 JSON 保存，带过期时间；单个连接在线程间共享（由锁保护）
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """打开（必要时创建）共享缓存
+
+        Args:
+            path: 数据库文件路径，默认为配置目录下的 shared_cache.db
+        """
+        self.path = path or get_shared_cache_path()
+        self._lock = threading.Lock()
+        self._conn = _connect(self.path)
+        # 租约持有者标识：区分同一进程内的多个实例
+        self._owner = f"{os.getpid()}:{id(self)}"
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+    def get(self, key: str) -> Optional[Any]:
+        """读取未过期的缓存值
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            Optional[Any]: 缓存值，不存在或已过期则返回 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM entries WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, value: Any, ttl: float) -> None:
+        """写入缓存值，同时清理已过期的条目
+
+        Args:
+            key: 缓存键
+            value: 可 JSON 序列化的值
+            ttl: 有效期（秒）
+        """
+        now = time.time()
+        data = json.dumps(value, ensure_ascii=False)
+        with self._lock, _ImmediateTransaction(self._conn) as conn:
+            conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, data, now + ttl)
+            )
+
+    def try_lease(self, key: str, duration: float = LEASE_SECONDS) -> bool:
+        """尝试取得某个键的获取租约
+
+        Args:
+            key: 缓存键
+            duration: 租约时长（秒）
+
+        Returns:
+            bool: 是否取得租约（已被其他实例持有且未过期时返回 False）
+        """
+        now = time.time()
+        with self._lock, _ImmediateTransaction(self._conn) as conn:
+            conn.execute("DELETE FROM leases WHERE key = ? AND expires_at <= ?", (key, now))
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO leases (key, owner, expires_at) VALUES (?, ?, ?)",
+                (key, self._owner, now + duration)
+            )
+            return cursor.rowcount == 1
+
+    def release_lease(self, key: str) -> None:
+        """释放自己持有的租约
+
+        Args:
+            key: 缓存键
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, self._owner))
+
+    def fetch(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: float,
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda value: value
+    ) -> Any:
+        """读取缓存，未命中时在租约保护下调用 loader 获取并写入
+
+        多个实例同时未命中同一个键时只有一个实例调用 loader，其余实例等待其结果；
+        loader 返回空值（失败）时不写入缓存，等待者随后自行获取
+
+        Args:
+            key: 缓存键
+            loader: 获取函数
+            ttl: 有效期（秒）
+            encode: 把 loader 结果转换为可 JSON 序列化的值
+            decode: 把缓存值转换回结果对象
+
+        Returns:
+            Any: 缓存值或 loader 的结果
+        """
+        while True:
+            cached = self.get(key)
+            if cached is not None:
+                return decode(cached)
+
+            if self.try_lease(key):
+                try:
+                    # 取得租约前其他实例可能刚写入
+                    cached = self.get(key)
+                    if cached is not None:
+                        return decode(cached)
+
+                    result = loader()
+                    if result:
+                        self.put(key, encode(result), ttl)
+                    return result
+                finally:
+                    self.release_lease(key)
+
+            time.sleep(LEASE_POLL_SECONDS)
+
+
+class SharedTokenBucket:
+    """跨进程共享的令牌桶
+
+    桶状态保存在共享缓存文件中；每次取令牌是一个 BEGIN IMMEDIATE 事务，
+    令牌不足时预支（令牌数可为负），调用方按返回的时长等待，多个实例按到达顺序排队
+    """
+
+    def __init__(self, path: Optional[Path] = None, burst: int = 1):
+        """打开共享令牌桶
+
+        Args:
+            path: 数据库文件路径，默认为配置目录下的 shared_cache.db
+            burst: 桶容量（允许的突发请求数）
+        """
+        self.path = path or get_shared_cache_path()
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._conn = _connect(self.path)
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+    def reserve(self, rate: float) -> float:
+        """预支一个令牌
+
+        Args:
+            rate: 每秒补充的令牌数
+
+        Returns:
+            float: 需要等待的秒数（0 表示可以立即请求）
+        """
+        now = time.time()
+        with self._lock, _ImmediateTransaction(self._conn) as conn:
+            row = conn.execute("SELECT tokens, updated_at FROM token_bucket WHERE id = 1").fetchone()
+            if row is None:
+                tokens = float(self.burst)
+            else:
+                tokens = min(float(self.burst), row[0] + max(0.0, now - row[1]) * rate)
+
+            tokens -= 1
+            conn.execute(
+                "INSERT OR REPLACE INTO token_bucket (id, tokens, updated_at) VALUES (1, ?, ?)",
+                (tokens, now)
+            )
+
+        return -tokens / rate if tokens < 0 else 0.0
+
+    def acquire(self, rate: float) -> float:
+        """取一个令牌，必要时等待
+
+        Args:
+            rate: 每秒补充的令牌数
+
+        Returns:
+            float: 实际等待的秒数
+        """
+        wait = self.reserve(rate)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+# 全局共享缓存和令牌桶
+_shared_cache: Optional[SharedCache] = None
+_token_bucket: Optional[SharedTokenBucket] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_cache() -> SharedCache:
+    """获取全局共享缓存（首次使用时打开）
+
+    Returns:
+        SharedCache: 全局共享缓存
+    """
+    global _shared_cache
+
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = SharedCache()
+
+    return _shared_cache
+
+
+def get_token_bucket(burst: int = 1) -> SharedTokenBucket:
+    """获取全局共享令牌桶（首次使用时打开）
+
+    Args:
+        burst: 桶容量（仅首次创建时生效）
+
+    Returns:
+        SharedTokenBucket: 全局共享令牌桶
+    """
+    global _token_bucket
+
+    with _shared_lock:
+        if _token_bucket is None:
+            _token_bucket = SharedTokenBucket(burst=burst)
+
+    return _token_bucket
@@ -0,0 +1,347 @@
+"""
+评论浏览面板
+
+基于 Qt model/view 的评论列表，可容纳当前歌曲的成千上万条评论：
+行高固定，只绘制可见行；滚动接近底部时通过 weapi 游标按需加载下一页
+"""
+
+from typing import Optional
+
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QLabel, QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+)
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QRect, QSize, QTimer, pyqtSignal
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter
+
+from src.config.settings import get_config
+from src.utils.logger import get_logger
+from src.models.comment import Comment, CommentPage
+from src.core.dedup import create_dedup_index
+
+logger = get_logger()
+
+
+class CommentListModel(QAbstractListModel):
+    """评论列表模型
+
+    通过 canFetchMore/fetchMore 实现按需分页：视图需要更多数据时发出 page_requested，
+    由外部在后台线程获取后调用 append_page 追加
+    """
+
+    # 请求下一页：歌曲ID、页码、游标
+    page_requested = pyqtSignal(str, int, str)
+
+    # 自定义数据角色：完整的 Comment 对象
+    CommentRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        """初始化评论列表模型
+
+        Args:
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.song_id = ""
+        self.total = 0
+        self._comments: list[Comment] = []
+        self._seen_ids: set[int] = set()
+        self._dedup_index = None
+        self._next_page = 1
+        self._cursor = "-1"
+        self._has_more = False
+        self._loading = False
+
+    @property
+    def loading(self) -> bool:
+        """是否正在加载下一页"""
+        return self._loading
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._comments)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        comment = self._comments[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return comment.content
+        if role == self.CommentRole:
+            return comment
+        return None
+
+    def set_song(self, song_id: str) -> None:
+        """切换歌曲：清空列表，等待视图请求第一页
+
+        Args:
+            song_id: 歌曲ID
+        """
+        if song_id == self.song_id:
+            return
+
+        self.beginResetModel()
+        self.song_id = song_id
+        self.total = 0
+        self._comments = []
+        self._seen_ids = set()
+        # 每首歌一个去重索引，后续分页增量加入，不重新扫描已加载的评论
+        self._dedup_index = create_dedup_index()
+        self._next_page = 1
+        self._cursor = "-1"
+        self._has_more = bool(song_id)
+        self._loading = False
+        self.endResetModel()
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._has_more and not self._loading
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+
+        self._loading = True
+        self.page_requested.emit(self.song_id, self._next_page, self._cursor)
+
+    def append_page(self, song_id: str, page: Optional[CommentPage]) -> None:
+        """追加一页评论
+
+        Args:
+            song_id: 请求时的歌曲ID（已切歌则丢弃）
+            page: 分页结果，获取失败为 None
+        """
+        if song_id != self.song_id:
+            return
+
+        self._loading = False
+
+        if page is None:
+            # 获取失败时停止自动加载，避免滚动时反复请求
+            self._has_more = False
+            return
+
+        self.total = page.total
+        self._has_more = page.has_more
+        self._next_page += 1
+        self._cursor = page.cursor
+
+        # 不同页之间可能有重复评论，按评论ID去重；再去掉内容近似重复的评论
+        new_comments = []
+        for comment in page.comments:
+            if comment.comment_id and comment.comment_id in self._seen_ids:
+                continue
+            self._seen_ids.add(comment.comment_id)
+            if self._dedup_index is not None and not self._dedup_index.add_if_new(comment.content):
+                continue
+            new_comments.append(comment)
+
+        if not new_comments:
+            return
+
+        first = len(self._comments)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_comments) - 1)
+        self._comments.extend(new_comments)
+        self.endInsertRows()
+
+        logger.debug("评论浏览追加 %s 条，已加载 %s/%s", len(new_comments), len(self._comments), self.total)
+
+
+class CommentItemDelegate(QStyledItemDelegate):
+    """评论行绘制代理
+
+    每行固定高度：评论内容最多两行，下方一行显示用户名和点赞数；
+    完整内容通过悬停提示查看
+    """
+
+    # 内边距（像素）
+    PADDING = 8
+    # 评论内容最多显示的行数
+    CONTENT_LINES = 2
+
+    def __init__(self, parent=None):
+        """初始化绘制代理
+
+        Args:
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.content_font = QFont()
+        self.content_font.setPixelSize(14)
+        self.meta_font = QFont()
+        self.meta_font.setPixelSize(12)
+
+        self._content_line_height = QFontMetrics(self.content_font).lineSpacing()
+        self._meta_line_height = QFontMetrics(self.meta_font).height()
+
+    def row_height(self) -> int:
+        """固定行高"""
+        return (
+            2 * self.PADDING
+            + self.CONTENT_LINES * self._content_line_height
+            + self._meta_line_height
+        )
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), self.row_height())
+
+    def paint(self, painter: QPainter, option, index) -> None:
+        comment: Comment = index.data(CommentListModel.CommentRole)
+        if comment is None:
+            return
+
+        painter.save()
+
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            painter.fillRect(option.rect, QColor(255, 255, 255, 20))
+
+        rect = option.rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        painter.setPen(QColor(255, 255, 255))
+
+        # 评论内容：最多两行，超出部分省略
+        content_height = self.CONTENT_LINES * self._content_line_height
+        content_rect = QRect(rect.left(), rect.top(), rect.width(), content_height)
+        painter.setFont(self.content_font)
+        painter.setClipRect(content_rect)
+        painter.drawText(
+            content_rect,
+            int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap),
+            comment.content
+        )
+        painter.setClipping(False)
+
+        # 用户名和点赞数（右对齐）
+        meta_rect = QRect(rect.left(), rect.top() + content_height, rect.width(), self._meta_line_height)
+        painter.setFont(self.meta_font)
+        painter.setPen(QColor(255, 255, 255, 180))
+        painter.drawText(
+            meta_rect,
+            int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter),
+            f"{comment.user} · {comment.get_likes_str()}"
+        )
+
+        painter.restore()
+
+
+class CommentBrowser(QWidget):
+    """评论浏览面板
+
+    置顶的独立小窗口，显示在悬浮窗下方
+    """
+
+    # 距离底部还剩多少行时预取下一页
+    PREFETCH_ROWS = 10
+
+    def __init__(self, parent: QWidget = None):
+        """初始化评论浏览面板
+
+        Args:
+            parent: 父窗口
+        """
+        super().__init__(parent)
+        self.config = get_config()
+
+        self.setWindowFlags(
+            Qt.WindowType.Tool |
+            Qt.WindowType.FramelessWindowHint |
+            Qt.WindowType.WindowStaysOnTopHint
+        )
+        self.setStyleSheet("""
+            QWidget {
+                background-color: rgb(51, 51, 51);
+                color: #FFFFFF;
+            }
+            QListView {
+                border: none;
+            }
+        """)
+
+        self.model = CommentListModel(self)
+        self.model.rowsInserted.connect(self._update_header)
+        self.model.modelReset.connect(self._update_header)
+        self.model.page_requested.connect(self._update_header)
+
+        self._setup_ui()
+
+    def _setup_ui(self) -> None:
+        """设置UI组件"""
+        layout = QVBoxLayout()
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(4)
+
+        self.header_label = QLabel()
+        self.header_label.setStyleSheet("font-size: 12px;")
+        layout.addWidget(self.header_label)
+
+        self.delegate = CommentItemDelegate(self)
+
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setItemDelegate(self.delegate)
+        # 固定行高：视图只需计算可见行，滚动开销与评论总数无关
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.list_view.setMouseTracking(True)
+        self.list_view.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        layout.addWidget(self.list_view)
+
+        self.setLayout(layout)
+        self.resize(self.config.window_width, 400)
+
+    def set_song(self, song_id: str) -> None:
+        """切换到指定歌曲的评论
+
+        Args:
+            song_id: 歌曲ID
+        """
+        self.model.set_song(song_id)
+        if self.isVisible() and self.model.canFetchMore():
+            self.model.fetchMore()
+
+    def append_page(self, song_id: str, page: Optional[CommentPage]) -> None:
+        """追加一页评论（由后台获取完成后调用）
+
+        Args:
+            song_id: 请求时的歌曲ID
+            page: 分页结果
+        """
+        self.model.append_page(song_id, page)
+        self._update_header()
+
+        # 首屏未填满时继续加载（排队到布局更新之后再判断）
+        QTimer.singleShot(0, lambda: self._on_scrolled(self.list_view.verticalScrollBar().value()))
+
+    def _on_scrolled(self, value: int) -> None:
+        """滚动时判断是否接近底部，提前加载下一页
+
+        Args:
+            value: 滚动条当前值
+        """
+        scroll_bar = self.list_view.verticalScrollBar()
+        threshold = self.PREFETCH_ROWS * self.delegate.row_height()
+        if scroll_bar.maximum() - value <= threshold and self.model.canFetchMore():
+            self.model.fetchMore()
+
+    def _update_header(self, *args) -> None:
+        """更新顶部状态文字"""
+        loaded = self.model.rowCount()
+        if not self.model.song_id:
+            text = "暂无歌曲"
+        elif self.model.loading:
+            text = f"已加载 {loaded} 条评论，加载中..."
+        else:
+            text = f"已加载 {loaded} / {self.model.total} 条评论"
+        self.header_label.setText(text)
+
+    def showEvent(self, event) -> None:
+        """显示时如果还没有数据，立即加载第一页"""
+        super().showEvent(event)
+        if self.model.rowCount() == 0 and self.model.canFetchMore():
+            self.model.fetchMore()
+        self._update_header()
@@ -0,0 +1,118 @@
+"""
+评论布局缓存
+
+评论列表到达时按固定宽度和字体一次性测量每条评论的换行高度，
+轮播时直接查表得到窗口几何尺寸，无需布局计算
+"""
+
+from typing import Optional
+
+from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QFont, QFontMetrics
+from PyQt6.QtWidgets import QWidget
+
+from src.models.comment import Comment
+
+# 测量换行高度时使用的最大高度（足够容纳任意评论）
+_MEASURE_MAX_HEIGHT = 100000
+
+
+def measure_wrapped_height(text: str, font: QFont, width: int, device: QWidget) -> int:
+    """测量文本在指定宽度下自动换行后的高度
+
+    Args:
+        text: 文本内容
+        font: 字体
+        width: 可用宽度（像素）
+        device: 绘制设备（决定 DPI）
+
+    Returns:
+        int: 换行后的高度（像素）
+    """
+    metrics = QFontMetrics(font, device)
+    rect = metrics.boundingRect(
+        QRect(0, 0, width, _MEASURE_MAX_HEIGHT),
+        int(Qt.AlignmentFlag.AlignLeft | Qt.TextFlag.TextWordWrap),
+        text
+    )
+    return rect.height()
+
+
+class CommentLayoutCache:
+    """评论换行高度缓存
+
+    缓存与评论列表对象绑定；字体、DPI 或宽度任一变化时整体失效
+    """
+
+    def __init__(self):
+        """初始化缓存"""
+        self._key: Optional[tuple] = None
+        self._comments: Optional[list[Comment]] = None
+        self._heights: list[int] = []
+
+    @staticmethod
+    def make_key(font: QFont, width: int, device: QWidget) -> tuple:
+        """生成缓存键
+
+        Args:
+            font: 评论字体
+            width: 评论可用宽度
+            device: 绘制设备
+
+        Returns:
+            tuple: 由字体、DPI、设备像素比和宽度组成的键
+        """
+        return (font.key(), device.logicalDpiY(), device.devicePixelRatioF(), width)
+
+    def is_valid(self, key: tuple, comments: list[Comment]) -> bool:
+        """缓存是否对应当前评论列表和测量条件
+
+        Args:
+            key: 当前测量条件的缓存键
+            comments: 当前评论列表
+
+        Returns:
+            bool: 缓存是否可直接使用
+        """
+        return self._comments is comments and self._key == key
+
+    def rebuild(
+        self,
+        comments: list[Comment],
+        font: QFont,
+        width: int,
+        device: QWidget,
+        key: tuple
+    ) -> None:
+        """重新测量整组评论
+
+        Args:
+            comments: 评论列表
+            font: 评论字体
+            width: 评论可用宽度
+            device: 绘制设备
+            key: 测量条件的缓存键
+        """
+        self._heights = [
+            measure_wrapped_height(comment.content, font, width, device)
+            for comment in comments
+        ]
+        self._comments = comments
+        self._key = key
+
+    def height_at(self, index: int) -> int:
+        """获取第 index 条评论的换行高度
+
+        Args:
+            index: 评论索引
+
+        Returns:
+            int: 换行高度（像素）
+        """
+        return self._heights[index]
+
+    def invalidate(self) -> None:
+        """使缓存失效"""
+        self._key = None
+        self._comments = None
+        self._heights = []
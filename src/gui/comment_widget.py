@@ -1,19 +1,26 @@
 """
 评论展示组件
 
-显示歌曲信息和评论轮播
+显示歌曲信息、当前歌词行（可选）和评论轮播
 """
 
+import time
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QFrame
 )
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal
-from PyQt6.QtGui import QCursor, QFont
+from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QSize, pyqtSignal
+from PyQt6.QtGui import QCursor, QFont, QFontMetrics, QPixmap
 
 from src.config.settings import get_config
 from src.utils.logger import get_logger
+from src.utils.metrics import timed
+from src.utils.profiler import profiled
 from src.models.song_info import SongInfo
 from src.models.comment import Comment
+from src.models.lyrics import Lyrics
+from src.gui.comment_layout import CommentLayoutCache, measure_wrapped_height
+from src.gui.image_loader import ImageLoader, image_key
 
 logger = get_logger()
 
@@ -27,6 +34,22 @@ class CommentWidget(QWidget):
     # 定义信号：评论更新时发出，用于通知主窗口调整高度
     comment_updated = pyqtSignal()
 
+    # 切歌和轮播时发出（省电模式下同样发出），供本地推送接口转发
+    song_changed = pyqtSignal()
+    rotated = pyqtSignal(int)
+
+    # 几何参数（像素）
+    MARGIN = 16          # 四周边距
+    SONG_SPACING = 12    # 歌曲名（或歌词行）与评论之间的间距
+    LYRIC_SPACING = 4    # 歌曲名与歌词行之间的间距
+    MIN_HEIGHT = 100     # 最小高度
+    MAX_HEIGHT = 600     # 最大高度
+    AVATAR_SIZE = 16     # 头像尺寸（显示在用户名左侧）
+    AVATAR_GAP = 4       # 头像与用户名的间距
+
+    # 没有评论时显示的文本
+    EMPTY_TEXT = "ops,暂无热门评论"
+
     def __init__(self, parent: QWidget = None):
         """初始化评论展示组件
 
@@ -41,28 +64,51 @@ class CommentWidget(QWidget):
         self.comments: list[Comment] = []
         self.current_index: int = 0
 
-        # 定时器
-        self.timer: QTimer = None
+        # 轮播定时器：整个生命周期复用同一个，切歌时只重新计时
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._next_comment)
+
+        # 省电模式：窗口隐藏时暂停轮播和界面更新
+        self.suspended = False
+        self._pending_refresh = False
 
         # UI组件
         self.song_label: QLabel = None
         self.comment_label: QLabel = None
         self.counter_label: QLabel = None
         self.meta_label: QLabel = None
-        self.likes_label: QLabel = None
+
+        # 换行高度缓存（随评论列表一起更新）
+        self.layout_cache = CommentLayoutCache()
+        self._song_height = 0
+        self._footer_height = 0
+
+        # 头像：由主窗口设置图片加载器后启用
+        self.image_loader: ImageLoader = None
+        self._avatar_key = ""
+        self.avatar_label: QLabel = None
+
+        # 歌词：播放位置由锚点（播放位置 0 对应的 monotonic 时间）推算，
+        # 单次定时器只在下一行开始时触发，不按固定频率轮询
+        self.lyrics: Lyrics = None
+        self._lyric_anchor = 0.0
+        self._lyric_height = 0
+        self.lyric_label: QLabel = None
+        self.lyric_timer = QTimer(self)
+        self.lyric_timer.setSingleShot(True)
+        self.lyric_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.lyric_timer.timeout.connect(self._update_lyric)
 
         self._setup_ui()
 
     def _setup_ui(self) -> None:
-        """设置UI组件 - 紧凑设计"""
-        layout = QVBoxLayout()
-        # 紧凑边距：上下16px，左右16px
-        layout.setContentsMargins(16, 16, 16, 16)
-        # 间距缩小
-        layout.setSpacing(0)
+        """设置UI组件 - 紧凑设计
 
+        子组件不放入布局，由 _apply_geometry 根据预先测量的高度直接摆放，
+        轮播时无需布局计算
+        """
         # 标题（歌曲名）：16px，白色，加粗（缩小字体）
-        self.song_label = QLabel()
+        self.song_label = QLabel(self)
         self.song_label.setStyleSheet("""
             QLabel {
                 color: #FFFFFF;
@@ -73,13 +119,9 @@ class CommentWidget(QWidget):
             }
         """)
         self.song_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        layout.addWidget(self.song_label)
-
-        # 添加12px间距
-        layout.addSpacing(12)
 
         # 评论内容：14px，白色（缩小字体）
-        self.comment_label = QLabel()
+        self.comment_label = QLabel(self)
         self.comment_label.setStyleSheet("""
             QLabel {
                 color: #FFFFFF;
@@ -90,22 +132,11 @@ class CommentWidget(QWidget):
                 line-height: 1.4;
             }
         """)
-        self.comment_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        self.comment_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
         self.comment_label.setWordWrap(True)
-        # 不设置最大高度，允许根据内容动态调整
-        layout.addWidget(self.comment_label)
-
-        # 添加弹性空间，把用户名和点赞数推到底部
-        layout.addStretch()
-
-        # 互动区：计数器和用户名（底部）
-        from PyQt6.QtWidgets import QHBoxLayout
-        h_layout = QHBoxLayout()
-        h_layout.setContentsMargins(0, 0, 0, 0)
-        h_layout.setSpacing(0)
 
         # 计数器标签：12px，白色，左下角
-        self.counter_label = QLabel()
+        self.counter_label = QLabel(self)
         self.counter_label.setStyleSheet("""
             QLabel {
                 color: #FFFFFF;
@@ -116,13 +147,9 @@ class CommentWidget(QWidget):
             }
         """)
         self.counter_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        h_layout.addWidget(self.counter_label)
-
-        # 添加弹簧，推用户名到右边
-        h_layout.addStretch()
 
-        # 用户名：12px，白色（改为白色，缩小字体）
-        self.meta_label = QLabel()
+        # 用户名和点赞数：12px，白色，右下角
+        self.meta_label = QLabel(self)
         self.meta_label.setStyleSheet("""
             QLabel {
                 color: #FFFFFF;
@@ -132,40 +159,169 @@ class CommentWidget(QWidget):
                 padding: 0px;
             }
         """)
-        h_layout.addWidget(self.meta_label)
+        self.meta_label.setAlignment(Qt.AlignmentFlag.AlignRight)
 
-        # 点赞数：12px，白色（缩小字体）
-        from PyQt6.QtWidgets import QLabel as QLabel2
-        self.likes_label = QLabel2()
-        self.likes_label.setStyleSheet("""
+        # 头像：圆形小图，加载完成前隐藏
+        self.avatar_label = QLabel(self)
+        self.avatar_label.setStyleSheet("background-color: transparent;")
+        self.avatar_label.hide()
+
+        # 歌词行：13px，半透明白色，单行，没有歌词时隐藏
+        self.lyric_label = QLabel(self)
+        self.lyric_label.setStyleSheet("""
             QLabel {
-                color: #FFFFFF;
-                font-size: 12px;
+                color: rgba(255, 255, 255, 180);
+                font-size: 13px;
                 font-weight: 400;
                 background-color: transparent;
                 padding: 0px;
             }
         """)
-        h_layout.addWidget(self.likes_label)
+        self.lyric_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        self.lyric_label.hide()
+
+        # 样式表中的字体在 polish 后才生效，测量前先完成 polish
+        for label in (self.song_label, self.lyric_label, self.comment_label, self.counter_label, self.meta_label):
+            label.ensurePolished()
+
+    def _song_font(self) -> QFont:
+        """歌曲名字体"""
+        return self.song_label.font()
+
+    def _lyric_font(self) -> QFont:
+        """歌词行字体"""
+        return self.lyric_label.font()
+
+    def _comment_font(self) -> QFont:
+        """评论内容字体"""
+        return self.comment_label.font()
+
+    def _footer_fonts(self) -> tuple[QFont, QFont]:
+        """底部信息栏字体（计数器, 用户名）"""
+        return self.counter_label.font(), self.meta_label.font()
+
+    def _content_width(self) -> int:
+        """评论区可用宽度（固定窗口宽度减去左右边距）"""
+        return self.config.window_width - 2 * self.MARGIN
+
+    def _layout_key(self) -> tuple:
+        """当前测量条件（字体、DPI、宽度）对应的缓存键"""
+        return CommentLayoutCache.make_key(self._comment_font(), self._content_width(), self)
+
+    def _ensure_layout_cache(self) -> None:
+        """确保换行高度缓存与当前评论列表、字体、DPI 和宽度一致"""
+        key = self._layout_key()
+
+        if not self.layout_cache.is_valid(key, self.comments):
+            self.layout_cache.rebuild(
+                self.comments, self._comment_font(), self._content_width(), self, key
+            )
 
-        layout.addLayout(h_layout)
+            # 歌曲名、歌词行和底部信息栏都是单行，高度只依赖字体
+            self._song_height = QFontMetrics(self._song_font(), self).height()
+            self._lyric_height = QFontMetrics(self._lyric_font(), self).height()
+            self._footer_height = max(
+                QFontMetrics(footer_font, self).height() for footer_font in self._footer_fonts()
+            )
 
-        self.setLayout(layout)
+    def _current_comment_height(self) -> int:
+        """当前显示的评论的换行高度"""
+        self._ensure_layout_cache()
 
+        if not self.comments or self.current_index >= len(self.comments):
+            return measure_wrapped_height(
+                self.EMPTY_TEXT, self._comment_font(), self._content_width(), self
+            )
+        return self.layout_cache.height_at(self.current_index)
+
+    def _lyric_top(self) -> int:
+        """歌词行顶部位置"""
+        return self.MARGIN + self._song_height + self.LYRIC_SPACING
+
+    def _comment_top(self) -> int:
+        """评论内容顶部位置（有歌词时位于歌词行下方）"""
+        top = self.MARGIN + self._song_height + self.SONG_SPACING
+        if self.lyrics:
+            top += self.LYRIC_SPACING + self._lyric_height
+        return top
+
+    def preferred_height(self) -> int:
+        """当前评论对应的组件高度（已限制在 MIN_HEIGHT ~ MAX_HEIGHT 之间）
+
+        Returns:
+            int: 高度（像素）
+        """
+        comment_height = self._current_comment_height()
+        content_height = self._comment_top() + comment_height + self._footer_height + self.MARGIN
+        return max(self.MIN_HEIGHT, min(content_height, self.MAX_HEIGHT))
+
+    def sizeHint(self) -> QSize:
+        """尺寸建议：固定宽度，高度取预先测量的结果"""
+        return QSize(self.config.window_width, self.preferred_height())
+
+    def _apply_geometry(self) -> None:
+        """按已知尺寸直接摆放子组件"""
+        width = self._content_width()
+        height = self.height()
+        comment_height = self._current_comment_height()
+
+        self.song_label.setGeometry(self.MARGIN, self.MARGIN, width, self._song_height)
+
+        self.lyric_label.setGeometry(self.MARGIN, self._lyric_top(), width, self._lyric_height)
+        self.lyric_label.setVisible(bool(self.lyrics))
+
+        comment_top = self._comment_top()
+        footer_top = height - self.MARGIN - self._footer_height
+        # 超出最大高度时截断评论显示区域
+        visible_height = max(0, min(comment_height, footer_top - comment_top))
+        self.comment_label.setGeometry(self.MARGIN, comment_top, width, visible_height)
+
+        # 底部信息栏：计数器在左，用户名在右
+        self.counter_label.setGeometry(self.MARGIN, footer_top, width, self._footer_height)
+        self.meta_label.setGeometry(self.MARGIN, footer_top, width, self._footer_height)
+
+        # 头像紧贴在用户名左侧，与底部信息栏垂直居中
+        meta_width = QFontMetrics(self.meta_label.font(), self).horizontalAdvance(self.meta_label.text())
+        self.avatar_label.setGeometry(
+            self.MARGIN + width - meta_width - self.AVATAR_GAP - self.AVATAR_SIZE,
+            footer_top + (self._footer_height - self.AVATAR_SIZE) // 2,
+            self.AVATAR_SIZE, self.AVATAR_SIZE
+        )
+
+    def resizeEvent(self, event) -> None:
+        """尺寸变化时重新摆放子组件"""
+        self._apply_geometry()
+        super().resizeEvent(event)
+
+    @timed("widget_update_song")
     def update_song(
         self,
         song: SongInfo,
-        comments: list[Comment]
+        comments: list[Comment],
+        start_index: int = 0
     ) -> None:
         """更新歌曲和评论
 
         Args:
             song: 歌曲信息
             comments: 评论列表
+            start_index: 起始轮播位置（用于恢复上次会话）
         """
+        # 换歌时清除上一首的歌词，新歌词获取后通过 set_lyrics 设置
+        if self.current_song is None or song.song_id != self.current_song.song_id:
+            self.lyrics = None
+            self.lyric_timer.stop()
+
         self.current_song = song
         self.comments = comments
-        self.current_index = 0
+        self.current_index = start_index if 0 <= start_index < len(comments) else 0
+        self.song_changed.emit()
+
+        # 省电模式下只保存数据，恢复显示时再一次性更新界面
+        if self.suspended:
+            self._pending_refresh = True
+            logger.debug("省电模式，延迟更新歌曲: %s - %s", song.name, song.artist)
+            return
 
         # 更新歌曲信息
         self._update_song_info()
@@ -177,8 +333,8 @@ class CommentWidget(QWidget):
         self._start_rotation()
 
         logger.debug(
-            f"更新歌曲: {song.name} - {song.artist}, "
-            f"评论数: {len(comments)}"
+            "更新歌曲: %s - %s, 评论数: %s",
+            song.name, song.artist, len(comments)
         )
 
     def _update_song_info(self) -> None:
@@ -187,50 +343,174 @@ class CommentWidget(QWidget):
             return
 
         # 歌曲名（不加emoji）
-        self.song_label.setText(f"{self.current_song.name} - {self.current_song.artist}")
+        self._show_song_text(f"{self.current_song.name} - {self.current_song.artist}")
+
+    def _show_song_text(self, text: str) -> None:
+        """显示歌曲名文本
+
+        Args:
+            text: 歌曲名文本
+        """
+        self.song_label.setText(text)
+
+    def _show_comment_texts(self, content: str, counter: str, meta: str) -> None:
+        """显示评论相关文本
+
+        Args:
+            content: 评论内容
+            counter: 计数器文本
+            meta: 用户名和点赞数文本
+        """
+        self.comment_label.setText(content)
+        self.counter_label.setText(counter)
+        self.meta_label.setText(meta)
 
     def _update_comment(self) -> None:
         """更新评论显示"""
         if not self.comments or self.current_index >= len(self.comments):
-            self.comment_label.setText("ops,暂无热门评论")
-            self.counter_label.setText("0/0")
-            self.meta_label.setText("")
-            if hasattr(self, 'likes_label'):
-                self.likes_label.setText("")
-            # 发出信号，通知窗口调整高度
-            self.comment_updated.emit()
+            self._show_comment_texts(self.EMPTY_TEXT, "0/0", "")
+        else:
+            comment = self.comments[self.current_index]
+
+            # 评论内容（不加引号）；计数器显示：当前索引+1/总评论数；
+            # 用户名和点赞数在右下角显示
+            self._show_comment_texts(
+                comment.content,
+                f"{self.current_index + 1}/{len(self.comments)}",
+                f"{comment.user} · {comment.get_likes_str()}"
+            )
+
+        self._update_avatar()
+        self._apply_geometry()
+
+        # 发出信号，通知窗口调整高度
+        self.comment_updated.emit()
+
+    def set_image_loader(self, loader: ImageLoader) -> None:
+        """设置图片加载器，启用评论头像
+
+        Args:
+            loader: 图片加载器
+        """
+        self.image_loader = loader
+        loader.image_ready.connect(self._on_image_ready)
+
+    def _current_avatar_url(self) -> str:
+        """当前评论的头像地址"""
+        if not self.comments or self.current_index >= len(self.comments):
+            return ""
+        return self.comments[self.current_index].avatar_url
+
+    def _update_avatar(self) -> None:
+        """显示当前评论的头像（未加载时先隐藏），并预取接下来几条评论的头像"""
+        if self.image_loader is None:
             return
 
-        comment = self.comments[self.current_index]
+        url = self._current_avatar_url()
+        self._avatar_key = image_key(url, self.AVATAR_SIZE, round_crop=True) if url else ""
+        self._show_avatar(self.image_loader.get(url, self.AVATAR_SIZE, round_crop=True))
 
-        # 评论内容（不加引号）
-        self.comment_label.setText(comment.content)
+        count = len(self.comments)
+        for offset in range(1, min(self.config.image_prefetch_count, count - 1) + 1):
+            comment = self.comments[(self.current_index + offset) % count]
+            self.image_loader.prefetch(comment.avatar_url, self.AVATAR_SIZE, round_crop=True)
 
-        # 计数器显示：当前索引+1/总评论数
-        self.counter_label.setText(f"{self.current_index + 1}/{len(self.comments)}")
+    def _on_image_ready(self, key: str) -> None:
+        """图片加载完成：如果是当前评论的头像则显示
 
-        # 用户名和点赞数在右下角显示
-        self.meta_label.setText(f"{comment.user} · {comment.get_likes_str()}")
+        Args:
+            key: 图片缓存键
+        """
+        if key != self._avatar_key or self.suspended:
+            return
+        self._show_avatar(self.image_loader.get(self._current_avatar_url(), self.AVATAR_SIZE, round_crop=True))
 
-        if hasattr(self, 'likes_label'):
-            self.likes_label.setText("")  # 不再单独显示点赞数
+    def _show_avatar(self, pixmap: QPixmap) -> None:
+        """显示头像
 
-        # 发出信号，通知窗口调整高度
+        Args:
+            pixmap: 头像，None 表示没有头像或尚未加载
+        """
+        if pixmap is None:
+            self.avatar_label.hide()
+            return
+        self.avatar_label.setPixmap(pixmap)
+        self.avatar_label.show()
+
+    def set_lyrics(self, lyrics: Lyrics, position_ms: int) -> None:
+        """设置当前歌曲的歌词并同步到播放位置
+
+        Args:
+            lyrics: 歌词，None 或空歌词表示不显示歌词行
+            position_ms: 当前播放位置（毫秒）
+        """
+        self.lyrics = lyrics if lyrics else None
+        self.lyric_timer.stop()
+
+        # 省电模式下只保存数据；恢复显示时 resume 按锚点重新同步
+        if self.suspended:
+            if self.lyrics:
+                self._lyric_anchor = time.monotonic() - position_ms / 1000
+            self._pending_refresh = True
+            return
+
+        if self.lyrics:
+            self.sync(position_ms)
+        else:
+            self._show_lyric_text("")
+
+        # 歌词行出现或消失会改变组件高度
+        self._apply_geometry()
         self.comment_updated.emit()
 
+    def sync(self, position_ms: int) -> None:
+        """重新同步歌词播放位置（切歌、拖动进度后调用）
+
+        Args:
+            position_ms: 当前播放位置（毫秒）
+        """
+        self._lyric_anchor = time.monotonic() - position_ms / 1000
+        self._update_lyric()
+
+    def _lyric_position(self) -> int:
+        """按锚点推算的当前播放位置（毫秒）"""
+        return int((time.monotonic() - self._lyric_anchor) * 1000)
+
+    def _update_lyric(self) -> None:
+        """显示当前歌词行，并把单次定时器设到下一行开始时"""
+        if not self.lyrics or self.suspended:
+            return
+
+        position = self._lyric_position()
+        line = self.lyrics.line_at(position)
+        self._show_lyric_text(
+            QFontMetrics(self._lyric_font(), self).elidedText(
+                line, Qt.TextElideMode.ElideRight, self._content_width()
+            )
+        )
+
+        next_time = self.lyrics.next_time(position)
+        if next_time is not None:
+            self.lyric_timer.start(max(0, next_time - position))
+        else:
+            self.lyric_timer.stop()
+
+    def _show_lyric_text(self, text: str) -> None:
+        """显示歌词行文本
+
+        Args:
+            text: 歌词文本（已按宽度省略）
+        """
+        self.lyric_label.setText(text)
+
     def _start_rotation(self) -> None:
         """开始评论轮播"""
-        # 停止旧定时器
-        if self.timer:
-            self.timer.stop()
-
-        # 创建新定时器
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._next_comment)
+        # start() 会先停止正在运行的计时再重新开始
         self.timer.start(self.config.rotation_interval)
 
-        logger.debug(f"启动评论轮播，间隔: {self.config.rotation_interval}ms")
+        logger.debug("启动评论轮播，间隔: %sms", self.config.rotation_interval)
 
+    @profiled
     def _next_comment(self) -> None:
         """切换到下一条评论"""
         if not self.comments:
@@ -238,11 +518,42 @@ class CommentWidget(QWidget):
 
         self.current_index = (self.current_index + 1) % len(self.comments)
         self._update_comment()
+        self.rotated.emit(self.current_index)
+
+        logger.debug("切换到第 %s 条评论", self.current_index + 1)
+
+    def suspend(self) -> None:
+        """进入省电模式：停止轮播，后续更新只保存数据不刷新界面"""
+        if self.suspended:
+            return
+
+        self.suspended = True
+        self.stop_rotation()
+        self.lyric_timer.stop()
+        logger.debug("评论组件进入省电模式")
+
+    def resume(self) -> None:
+        """退出省电模式：用最新数据一次性刷新界面并恢复轮播"""
+        if not self.suspended:
+            return
+
+        self.suspended = False
+
+        if self._pending_refresh:
+            self._pending_refresh = False
+            self._update_song_info()
+            self._update_comment()
+
+        if self.comments:
+            self._start_rotation()
+
+        # 隐藏期间歌词定时器已停止，按锚点同步到当前位置
+        self._update_lyric()
 
-        logger.debug(f"切换到第 {self.current_index + 1} 条评论")
+        logger.debug("评论组件退出省电模式")
 
     def stop_rotation(self) -> None:
         """停止评论轮播"""
-        if self.timer:
+        if self.timer.isActive():
             self.timer.stop()
             logger.debug("停止评论轮播")
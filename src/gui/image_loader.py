@@ -0,0 +1,215 @@
+"""
+异步图片加载
+
+评论头像和专辑封面背景的加载流水线：
+1. 内存：已解码的 QPixmap 按 LRU 保留最近使用的若干张，命中时 GUI 线程直接使用
+2. 磁盘：ImageDiskCache 保存下载过的缩略图字节
+3. 网络：按显示尺寸请求服务端缩略图（?param=宽y高），不下载原图
+
+下载、解码、缩放、圆形裁剪和模糊都在后台线程中对 QImage 完成，GUI 线程只做
+QPixmap.fromImage；可见图片与预取共用后台线程，按优先级出队，预取不会挡住当前图片
+"""
+
+from collections import OrderedDict
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QRectF, Qt, pyqtSignal
+from PyQt6.QtGui import QGuiApplication, QImage, QPainter, QPainterPath, QPixmap
+
+from src.config.settings import get_config
+from src.core.image_cache import ImageDiskCache, thumbnail_url
+from src.core.scheduler import Priority, RequestScheduler
+from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics
+
+logger = get_logger()
+
+# 模糊背景先缩小到这么宽再放大，缩放插值本身即相当于一次大半径模糊
+BLUR_WIDTH = 12
+
+
+def image_key(url: str, size: int, round_crop: bool = False, blur: bool = False) -> str:
+    """图片在内存缓存中的键
+
+    Args:
+        url: 原图地址
+        size: 显示尺寸（逻辑像素，正方形）
+        round_crop: 是否裁剪为圆形
+        blur: 是否模糊
+
+    Returns:
+        str: 缓存键
+    """
+    return f"{url}|{size}|{int(round_crop)}{int(blur)}"
+
+
+def _round_crop(image: QImage) -> QImage:
+    """把图片裁剪为圆形（透明背景）"""
+    result = QImage(image.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    result.fill(Qt.GlobalColor.transparent)
+
+    path = QPainterPath()
+    path.addEllipse(QRectF(0, 0, image.width(), image.height()))
+
+    painter = QPainter(result)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setClipPath(path)
+    painter.drawImage(0, 0, image)
+    painter.end()
+    return result
+
+
+def _blur(image: QImage, size: int) -> QImage:
+    """缩小再平滑放大到 size，得到大半径模糊"""
+    small = image.scaledToWidth(BLUR_WIDTH, Qt.TransformationMode.SmoothTransformation)
+    return small.scaled(
+        size, size,
+        Qt.AspectRatioMode.IgnoreAspectRatio,
+        Qt.TransformationMode.SmoothTransformation
+    )
+
+
+class ImageLoader(QObject):
+    """异步图片加载器
+
+    用法::
+
+        pixmap = loader.get(url, 20, round_crop=True)
+        if pixmap is None:
+            # 加载完成后发出 image_ready(image_key(url, 20, True))
+            ...
+    """
+
+    # 图片加载完成（内存缓存键）
+    image_ready = pyqtSignal(str)
+
+    # 后台线程解码完成，回到 GUI 线程转换为 QPixmap
+    _decoded = pyqtSignal(str, QImage)
+
+    def __init__(self, parent: QObject = None, disk_cache: Optional[ImageDiskCache] = None):
+        """初始化加载器
+
+        Args:
+            parent: 父对象
+            disk_cache: 磁盘缓存，默认为配置目录下的 images/
+        """
+        # requests 导入较慢，加载器在首次显示歌曲时才创建
+        import requests
+
+        super().__init__(parent)
+        config = get_config()
+        self.timeout = config.api_timeout
+
+        self._pixmaps: OrderedDict[str, QPixmap] = OrderedDict()
+        self._max_pixmaps = config.image_memory_cache_size
+        self._pending: set[str] = set()
+
+        self._disk = disk_cache or ImageDiskCache(max_bytes=config.image_disk_cache_mb * 1024 * 1024)
+        self._session = requests.Session()
+        self._scheduler = RequestScheduler(max_workers=2, thread_name_prefix="image")
+
+        # 按主屏幕的设备像素比解码，高分屏上不发虚
+        screen = QGuiApplication.primaryScreen()
+        self._dpr = screen.devicePixelRatio() if screen else 1.0
+
+        self._decoded.connect(self._on_decoded)
+
+    def get(
+        self,
+        url: str,
+        size: int,
+        round_crop: bool = False,
+        blur: bool = False,
+        priority: Priority = Priority.INTERACTIVE
+    ) -> Optional[QPixmap]:
+        """获取图片；内存中没有时在后台加载，完成后发出 image_ready
+
+        Args:
+            url: 原图地址
+            size: 显示尺寸（逻辑像素，正方形）
+            round_crop: 是否裁剪为圆形
+            blur: 是否模糊
+            priority: 加载优先级
+
+        Returns:
+            Optional[QPixmap]: 内存中已有的图片，否则返回 None
+        """
+        if not url:
+            return None
+
+        key = image_key(url, size, round_crop, blur)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            return pixmap
+
+        if key not in self._pending:
+            self._pending.add(key)
+            self._scheduler.submit(priority, self._load, key, url, size, round_crop, blur)
+        return None
+
+    def prefetch(self, url: str, size: int, round_crop: bool = False, blur: bool = False) -> None:
+        """以后台优先级预取图片（不返回结果）
+
+        Args:
+            url: 原图地址
+            size: 显示尺寸（逻辑像素，正方形）
+            round_crop: 是否裁剪为圆形
+            blur: 是否模糊
+        """
+        self.get(url, size, round_crop, blur, Priority.BACKGROUND)
+
+    def _load(self, key: str, url: str, size: int, round_crop: bool, blur: bool) -> None:
+        """后台线程：读取磁盘缓存或下载缩略图，解码并处理成显示尺寸"""
+        import requests
+
+        # 模糊背景只需要很小的缩略图
+        fetch_size = BLUR_WIDTH * 4 if blur else round(size * self._dpr)
+        thumb = thumbnail_url(url, fetch_size, fetch_size)
+
+        data = self._disk.get(thumb)
+        if data is None:
+            try:
+                with get_metrics().stage("image_download"):
+                    response = self._session.get(thumb, timeout=self.timeout)
+                    response.raise_for_status()
+                data = response.content
+            except requests.RequestException as e:
+                logger.debug("下载图片失败 %s: %s", thumb, e)
+                self._decoded.emit(key, QImage())
+                return
+            self._disk.put(thumb, data)
+
+        with get_metrics().stage("image_decode"):
+            image = QImage.fromData(data)
+            if not image.isNull():
+                pixel_size = round(size * self._dpr)
+                if blur:
+                    image = _blur(image, pixel_size)
+                else:
+                    image = image.scaled(
+                        pixel_size, pixel_size,
+                        Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                        Qt.TransformationMode.SmoothTransformation
+                    )
+                if round_crop:
+                    image = _round_crop(image)
+                image.setDevicePixelRatio(self._dpr)
+
+        self._decoded.emit(key, image)
+
+    def _on_decoded(self, key: str, image: QImage) -> None:
+        """GUI 线程：放入内存缓存并通知使用方"""
+        self._pending.discard(key)
+        if image.isNull():
+            return
+
+        self._pixmaps[key] = QPixmap.fromImage(image)
+        while len(self._pixmaps) > self._max_pixmaps:
+            self._pixmaps.popitem(last=False)
+
+        self.image_ready.emit(key)
+
+    def shutdown(self) -> None:
+        """停止后台线程（丢弃未开始的加载）"""
+        self._scheduler.shutdown(wait=False, cancel_futures=True)
@@ -4,14 +4,19 @@
 创建透明悬浮的主窗口，包含评论展示组件
 """
 
+import html
+
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QMenu, QMessageBox, QSystemTrayIcon, QApplication
-from PyQt6.QtCore import Qt, QPoint, QSize, QEvent, QObject, QTimer
-from PyQt6.QtGui import QCursor, QIcon, QPainter, QColor, QBrush, QAction, QImage, QPixmap
-import keyboard
+from PyQt6.QtCore import Qt, QPoint, QRectF, QSize, QEvent, QObject, QTimer, pyqtSignal
+from PyQt6.QtGui import QCursor, QIcon, QPainter, QPainterPath, QColor, QBrush, QAction, QImage, QPixmap
 
 from src.config.settings import get_config
 from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics, timed
+from src.utils.profiler import get_profiler
 from src.gui.comment_widget import CommentWidget
+from src.gui.painted_comment_widget import create_comment_widget
+from src.gui.image_loader import ImageLoader, image_key
 
 logger = get_logger()
 
@@ -61,24 +66,100 @@ def create_tray_icon() -> QIcon:
 class BackgroundContainer(QWidget):
     """半透明背景容器
 
-    使用自定义绘制实现真正的半透明背景效果
+    使用自定义绘制实现真正的半透明背景效果；
+    圆角背景按尺寸预先绘制到缓存 pixmap 中，重绘时直接贴图
     """
 
+    # 圆角半径
+    CORNER_RADIUS = 12
+
+    # 专辑封面模糊背景的不透明度（其上再叠加半透明背景色）
+    BACKDROP_OPACITY = 0.6
+
     def __init__(self, parent=None):
         super().__init__(parent)
         # 背景颜色：深灰色，60%不透明度
         self.bg_color = QColor(51, 51, 51, 153)  # 153 = 60% of 255
 
-    def paintEvent(self, event):
-        """绘制事件 - 绘制半透明背景"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # 专辑封面模糊背景（None 表示不绘制）
+        self.backdrop: QPixmap = None
+
+        # 背景缓存：尺寸、设备像素比或颜色变化时重新生成
+        self._bg_pixmap: QPixmap = None
+        self._bg_key: tuple = None
+
+    def set_background_color(self, color: QColor) -> None:
+        """设置背景颜色
+
+        Args:
+            color: 背景颜色（含 alpha 通道）
+        """
+        if color == self.bg_color:
+            return
+
+        self.bg_color = color
+        # 旧颜色的缓存不会再用到，立即释放，下次绘制时按新颜色重新生成
+        self._bg_pixmap = None
+        self._bg_key = None
+        self.update()
+
+    def set_backdrop(self, pixmap: QPixmap) -> None:
+        """设置专辑封面模糊背景
 
-        # 绘制圆角矩形背景
-        painter.setBrush(QBrush(self.bg_color))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(self.rect(), 12, 12)
+        Args:
+            pixmap: 已模糊的封面，None 表示不绘制
+        """
+        if pixmap is self.backdrop:
+            return
+
+        self.backdrop = pixmap
+        self.update()
+
+    def _background_pixmap(self) -> QPixmap:
+        """获取当前尺寸的背景 pixmap（必要时重新绘制）
+
+        Returns:
+            QPixmap: 按设备像素比绘制的圆角背景
+        """
+        dpr = self.devicePixelRatioF()
+        backdrop_key = self.backdrop.cacheKey() if self.backdrop is not None else 0
+        key = (self.width(), self.height(), dpr, self.bg_color.rgba(), backdrop_key)
+
+        if key != self._bg_key:
+            pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+            # 模糊封面铺满圆角区域（模糊后拉伸变形不可见）
+            if self.backdrop is not None:
+                clip = QPainterPath()
+                clip.addRoundedRect(QRectF(self.rect()), self.CORNER_RADIUS, self.CORNER_RADIUS)
+                painter.save()
+                painter.setClipPath(clip)
+                painter.setOpacity(self.BACKDROP_OPACITY)
+                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+                painter.drawPixmap(self.rect(), self.backdrop)
+                painter.restore()
+
+            # 绘制圆角矩形背景
+            painter.setBrush(QBrush(self.bg_color))
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(self.rect(), self.CORNER_RADIUS, self.CORNER_RADIUS)
+            painter.end()
+
+            self._bg_pixmap = pixmap
+            self._bg_key = key
+
+        return self._bg_pixmap
 
+    def paintEvent(self, event):
+        """绘制事件 - 贴上缓存的半透明背景"""
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background_pixmap())
+        painter.end()
 
 
 class TransparentWindow(QWidget):
@@ -87,6 +168,12 @@ class TransparentWindow(QWidget):
     无边框、置顶、透明背景的悬浮窗口，用于显示评论
     """
 
+    # 窗口显示/隐藏时发出（True=显示），用于切换省电模式
+    visibility_changed = pyqtSignal(bool)
+
+    # 评论浏览面板请求下一页：歌曲ID、页码、游标
+    comment_page_requested = pyqtSignal(str, int, str)
+
     def __init__(self):
         """初始化主窗口"""
         super().__init__()
@@ -103,10 +190,18 @@ class TransparentWindow(QWidget):
         # 系统托盘
         self.tray_icon: QSystemTrayIcon = None
 
+        # 评论浏览面板（首次打开时创建）
+        self.comment_browser = None
+
+        # 头像和封面图片加载器（首次显示歌曲时创建）
+        self.image_loader: ImageLoader = None
+        self._backdrop_key = ""
+
         self._setup_window()
         self._setup_ui()
         self._setup_tray()  # 设置系统托盘
-        self._setup_global_hotkey()  # 设置全局快捷键
+        # 全局快捷键延迟到事件循环启动后注册，避免 keyboard 模块拖慢首帧
+        QTimer.singleShot(0, self._setup_global_hotkey)
 
     def _setup_window(self) -> None:
         """配置窗口属性"""
@@ -156,7 +251,9 @@ class TransparentWindow(QWidget):
         container_layout.setSpacing(0)
 
         # 创建评论展示组件
-        self.comment_widget = CommentWidget(self.background_container)
+        self.comment_widget = create_comment_widget(
+            self.config.comment_renderer, self.background_container
+        )
         # 连接评论更新信号到窗口高度调整槽
         self.comment_widget.comment_updated.connect(self._adjust_window_height)
         container_layout.addWidget(self.comment_widget)
@@ -250,6 +347,26 @@ class TransparentWindow(QWidget):
         hide_action.triggered.connect(self._hide_to_tray)
         tray_menu.addAction(hide_action)
 
+        # 评论浏览
+        browser_action = QAction("评论浏览", self)
+        browser_action.triggered.connect(self._toggle_comment_browser)
+        tray_menu.addAction(browser_action)
+
+        tray_menu.addSeparator()
+
+        # 性能统计
+        stats_action = QAction("性能统计", self)
+        stats_action.triggered.connect(self._show_latency_stats)
+        tray_menu.addAction(stats_action)
+
+        dump_stats_action = QAction("导出性能统计", self)
+        dump_stats_action.triggered.connect(self._dump_latency_stats)
+        tray_menu.addAction(dump_stats_action)
+
+        # 性能分析开关（分析可能自动结束，每次弹出菜单前同步勾选状态）
+        self._tray_profiler_actions = self._add_profiler_actions(tray_menu)
+        tray_menu.aboutToShow.connect(self._sync_tray_profiler_actions)
+
         tray_menu.addSeparator()
 
         # 退出
@@ -271,9 +388,108 @@ class TransparentWindow(QWidget):
 
         logger.info("系统托盘初始化完成")
 
+    def _show_latency_stats(self) -> None:
+        """显示各阶段延迟统计"""
+        box = QMessageBox()
+        box.setWindowTitle("性能统计")
+        box.setTextFormat(Qt.TextFormat.RichText)
+        box.setText(f"<pre>{html.escape(get_metrics().format_table())}</pre>")
+        box.exec()
+
+    def _dump_latency_stats(self) -> None:
+        """导出各阶段延迟统计到 JSON 文件"""
+        try:
+            path = get_metrics().dump_json()
+            logger.info(f"性能统计已导出: {path}")
+            self.tray_icon.showMessage("性能统计", f"已导出到 {path}")
+        except OSError as e:
+            logger.error(f"导出性能统计失败: {e}")
+
+    def _add_profiler_actions(self, menu: QMenu) -> tuple[QAction, QAction]:
+        """向菜单添加性能分析开关
+
+        Args:
+            menu: 目标菜单
+
+        Returns:
+            tuple[QAction, QAction]: (CPU 分析开关, 内存分析开关)
+        """
+        profiler = get_profiler()
+
+        cpu_action = menu.addAction(f"CPU 分析（{self.config.profile_window_seconds} 秒）")
+        cpu_action.setCheckable(True)
+        cpu_action.setChecked(profiler.cprofile_active)
+        cpu_action.triggered.connect(self._toggle_cpu_profile)
+
+        memory_action = menu.addAction("内存分析")
+        memory_action.setCheckable(True)
+        memory_action.setChecked(profiler.tracemalloc_active)
+        memory_action.triggered.connect(self._toggle_memory_profile)
+
+        return cpu_action, memory_action
+
+    def _sync_tray_profiler_actions(self) -> None:
+        """同步托盘菜单中性能分析开关的勾选状态"""
+        profiler = get_profiler()
+        cpu_action, memory_action = self._tray_profiler_actions
+        cpu_action.setChecked(profiler.cprofile_active)
+        memory_action.setChecked(profiler.tracemalloc_active)
+
+    def _toggle_cpu_profile(self, checked: bool) -> None:
+        """开启/结束 CPU 分析
+
+        Args:
+            checked: 是否开启
+        """
+        if checked:
+            get_profiler().start_cprofile(self.config.profile_window_seconds)
+        else:
+            get_profiler().stop_cprofile()
+
+    def _toggle_memory_profile(self, checked: bool) -> None:
+        """开启/结束内存分析
+
+        Args:
+            checked: 是否开启
+        """
+        if checked:
+            get_profiler().start_tracemalloc()
+        else:
+            get_profiler().stop_tracemalloc()
+
+    def _toggle_comment_browser(self) -> None:
+        """打开/关闭评论浏览面板（显示在悬浮窗下方）"""
+        if self.comment_browser is None:
+            from src.gui.comment_browser import CommentBrowser
+
+            self.comment_browser = CommentBrowser()
+            self.comment_browser.model.page_requested.connect(self.comment_page_requested)
+            song = self.comment_widget.current_song
+            self.comment_browser.set_song(song.song_id if song else "")
+
+        if self.comment_browser.isVisible():
+            self.comment_browser.hide()
+            return
+
+        self.comment_browser.move(self.x(), self.y() + self.height() + 8)
+        self.comment_browser.show()
+        self.comment_browser.raise_()
+
+    def append_comment_page(self, song_id: str, page) -> None:
+        """把后台获取的评论分页交给评论浏览面板
+
+        Args:
+            song_id: 请求时的歌曲ID
+            page: 分页结果（CommentPage），失败为 None
+        """
+        if self.comment_browser is not None:
+            self.comment_browser.append_page(song_id, page)
+
     def _setup_global_hotkey(self) -> None:
         """设置全局快捷键"""
         try:
+            import keyboard
+
             # 注册 Ctrl+Alt+; 快捷键来切换窗口显示/隐藏
             keyboard.add_hotkey('ctrl+alt+;', self._toggle_window)
             logger.info("全局快捷键已注册: Ctrl+Alt+; (切换窗口显示/隐藏)")
@@ -388,6 +604,14 @@ class TransparentWindow(QWidget):
             show_action = menu.addAction("显示窗口")
             show_action.triggered.connect(self._show_window)
 
+        browser_action = menu.addAction("评论浏览")
+        browser_action.triggered.connect(self._toggle_comment_browser)
+
+        menu.addSeparator()
+
+        # 性能分析开关
+        self._add_profiler_actions(menu)
+
         menu.addSeparator()
 
         # 退出
@@ -413,32 +637,96 @@ class TransparentWindow(QWidget):
 
         super().changeEvent(event)
 
-    def update_song(self, song_info, comments: list) -> None:
+    def showEvent(self, event) -> None:
+        """窗口显示事件：退出省电模式
+
+        Args:
+            event: 显示事件
+        """
+        super().showEvent(event)
+        self.comment_widget.resume()
+        self.visibility_changed.emit(True)
+
+    def hideEvent(self, event) -> None:
+        """窗口隐藏事件：进入省电模式，停止轮播和布局计算
+
+        Args:
+            event: 隐藏事件
+        """
+        super().hideEvent(event)
+        self.comment_widget.suspend()
+        self.visibility_changed.emit(False)
+
+    def update_song(self, song_info, comments: list, start_index: int = 0) -> None:
         """更新歌曲和评论
 
         Args:
             song_info: 歌曲信息
             comments: 评论列表
+            start_index: 起始轮播位置
         """
-        self.comment_widget.update_song(song_info, comments)
+        # 评论更新后会发出 comment_updated 信号，由 _adjust_window_height 调整高度
+        if self.config.images_enabled:
+            self._ensure_image_loader()
+        self.comment_widget.update_song(song_info, comments, start_index)
+        self._update_backdrop(song_info)
 
-        # 更新后调整窗口高度以适应内容
-        self._adjust_window_height()
+        if self.comment_browser is not None:
+            self.comment_browser.set_song(song_info.song_id)
 
-    def _adjust_window_height(self) -> None:
-        """根据内容调整窗口高度，保持窗口位置不变"""
-        # 保存当前窗口位置
-        current_pos = self.pos()
+    def _ensure_image_loader(self) -> None:
+        """创建图片加载器并交给评论组件（只创建一次）"""
+        if self.image_loader is not None:
+            return
+
+        self.image_loader = ImageLoader(self)
+        self.image_loader.image_ready.connect(self._on_image_ready)
+        self.comment_widget.set_image_loader(self.image_loader)
+
+    def _update_backdrop(self, song_info) -> None:
+        """切换专辑封面模糊背景（未加载完成前不绘制）
+
+        Args:
+            song_info: 歌曲信息
+        """
+        if self.image_loader is None or not song_info.cover_url:
+            self._backdrop_key = ""
+            self.background_container.set_backdrop(None)
+            return
+
+        width = self.config.window_width
+        self._backdrop_key = image_key(song_info.cover_url, width, blur=True)
+        self.background_container.set_backdrop(
+            self.image_loader.get(song_info.cover_url, width, blur=True)
+        )
 
-        # 强制布局更新
-        self.background_container.layout().activate()
-        self.comment_widget.layout().activate()
+    def _on_image_ready(self, key: str) -> None:
+        """图片加载完成：如果是当前歌曲的封面则显示为背景
 
-        # 获取内容需要的实际高度
-        content_height = self.background_container.sizeHint().height()
+        Args:
+            key: 图片缓存键
+        """
+        if key != self._backdrop_key:
+            return
+
+        song = self.comment_widget.current_song
+        self.background_container.set_backdrop(
+            self.image_loader.get(song.cover_url, self.config.window_width, blur=True)
+        )
+
+    @timed("adjust_window_height")
+    def _adjust_window_height(self) -> None:
+        """根据内容调整窗口高度，保持窗口位置不变
 
-        # 确保高度在合理范围内（最小100，最大600）
-        new_height = max(100, min(content_height, 600))
+        高度直接取评论组件预先测量的结果，不触发布局计算；
+        高度未变化时不做任何几何操作
+        """
+        new_height = self.comment_widget.preferred_height()
+        if new_height == self.height():
+            return
+
+        # 保存当前窗口位置
+        current_pos = self.pos()
 
         # 调整窗口大小
         self.resize(self.config.window_width, new_height)
@@ -455,11 +743,16 @@ class TransparentWindow(QWidget):
             event: 关闭事件
         """
         try:
+            import keyboard
+
             # 移除所有快捷键
             keyboard.unhook_all_hotkeys()
             logger.info("全局快捷键已注销")
         except Exception as e:
             logger.error(f"注销快捷键失败: {e}")
 
+        if self.image_loader is not None:
+            self.image_loader.shutdown()
+
         # 接受关闭事件
         event.accept()
@@ -0,0 +1,209 @@
+"""
+自绘评论展示组件
+
+不使用 QLabel，直接用预先排版并缓存的 QStaticText 绘制歌曲名、歌词行、评论、计数器和用户信息，
+轮播时不需要重新解析样式表或重新排版文本
+"""
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QPointF, QRect
+from PyQt6.QtGui import QColor, QFont, QPainter, QPixmap, QStaticText, QTransform
+
+from src.gui.comment_widget import CommentWidget
+
+
+class PaintedCommentWidget(CommentWidget):
+    """自绘评论展示组件
+
+    外观与 CommentWidget 一致（白色文字，16/14/12px 字号），
+    通过配置项 comment_renderer = "painted" 启用
+    """
+
+    # 文字颜色
+    TEXT_COLOR = QColor(255, 255, 255)
+    LYRIC_COLOR = QColor(255, 255, 255, 180)
+
+    def _setup_ui(self) -> None:
+        """初始化字体和文本缓存（不创建子组件）"""
+        base_font = self.font()
+
+        # 标题（歌曲名）：16px，加粗
+        self._song_font_obj = QFont(base_font)
+        self._song_font_obj.setPixelSize(16)
+        self._song_font_obj.setWeight(QFont.Weight.Bold)
+
+        # 歌词行：13px
+        self._lyric_font_obj = QFont(base_font)
+        self._lyric_font_obj.setPixelSize(13)
+
+        # 评论内容：14px
+        self._comment_font_obj = QFont(base_font)
+        self._comment_font_obj.setPixelSize(14)
+
+        # 计数器和用户名：12px
+        self._footer_font_obj = QFont(base_font)
+        self._footer_font_obj.setPixelSize(12)
+
+        # 当前显示的文本
+        self._song_static = QStaticText()
+        self._lyric_static = QStaticText()
+        self._comment_static = QStaticText()
+        self._counter_static = QStaticText()
+        self._meta_static = QStaticText()
+
+        # 已排版文本缓存：(文本, 字体类别) -> QStaticText，换歌或字体/宽度变化时清空
+        self._static_cache: dict[tuple[str, str], QStaticText] = {}
+        self._static_key = None
+
+        # 当前头像（None 表示不绘制）
+        self._avatar_pixmap: QPixmap = None
+
+    def _song_font(self) -> QFont:
+        """歌曲名字体"""
+        return self._song_font_obj
+
+    def _lyric_font(self) -> QFont:
+        """歌词行字体"""
+        return self._lyric_font_obj
+
+    def _comment_font(self) -> QFont:
+        """评论内容字体"""
+        return self._comment_font_obj
+
+    def _footer_fonts(self) -> tuple[QFont, QFont]:
+        """底部信息栏字体（计数器, 用户名）"""
+        return self._footer_font_obj, self._footer_font_obj
+
+    def _ensure_layout_cache(self) -> None:
+        """确保高度缓存有效；测量条件变化时同时清空已排版文本"""
+        super()._ensure_layout_cache()
+
+        key = self._layout_key()
+        if key != self._static_key:
+            self._static_cache.clear()
+            self._static_key = key
+
+    def _static_text(self, text: str, kind: str) -> QStaticText:
+        """获取（必要时排版）文本对应的 QStaticText
+
+        Args:
+            text: 文本内容
+            kind: 字体类别（"song"、"lyric"、"comment"、"footer"）
+
+        Returns:
+            QStaticText: 已排版的静态文本
+        """
+        cache_key = (text, kind)
+        static = self._static_cache.get(cache_key)
+        if static is not None:
+            return static
+
+        fonts = {
+            "song": self._song_font_obj,
+            "lyric": self._lyric_font_obj,
+            "comment": self._comment_font_obj,
+            "footer": self._footer_font_obj,
+        }
+        static = QStaticText(text)
+        static.setTextFormat(Qt.TextFormat.PlainText)
+        static.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+        if kind == "comment":
+            # 评论按固定宽度自动换行
+            static.setTextWidth(self._content_width())
+        static.prepare(QTransform(), fonts[kind])
+
+        self._static_cache[cache_key] = static
+        return static
+
+    def update_song(self, song, comments, start_index: int = 0) -> None:
+        """更新歌曲和评论（换歌时清空文本缓存）"""
+        if comments is not self.comments:
+            self._static_cache.clear()
+        super().update_song(song, comments, start_index)
+
+    def _show_song_text(self, text: str) -> None:
+        """显示歌曲名文本"""
+        self._ensure_layout_cache()
+        self._song_static = self._static_text(text, "song")
+
+    def _show_lyric_text(self, text: str) -> None:
+        """显示歌词行文本"""
+        self._ensure_layout_cache()
+        self._lyric_static = self._static_text(text, "lyric")
+        self.update()
+
+    def _show_comment_texts(self, content: str, counter: str, meta: str) -> None:
+        """显示评论相关文本"""
+        self._ensure_layout_cache()
+        self._comment_static = self._static_text(content, "comment")
+        self._counter_static = self._static_text(counter, "footer")
+        self._meta_static = self._static_text(meta, "footer")
+
+    def _show_avatar(self, pixmap: QPixmap) -> None:
+        """记录头像，绘制时贴图"""
+        self._avatar_pixmap = pixmap
+        self.update()
+
+    def _apply_geometry(self) -> None:
+        """没有子组件需要摆放，只需重绘"""
+        self.update()
+
+    def paintEvent(self, event) -> None:
+        """绘制歌曲名、歌词行、评论和底部信息栏"""
+        self._ensure_layout_cache()
+
+        width = self._content_width()
+        comment_top = self._comment_top()
+        footer_top = self.height() - self.MARGIN - self._footer_height
+
+        painter = QPainter(self)
+        painter.setPen(self.TEXT_COLOR)
+
+        # 歌曲名
+        painter.setFont(self._song_font_obj)
+        painter.drawStaticText(QPointF(self.MARGIN, self.MARGIN), self._song_static)
+
+        # 歌词行
+        if self.lyrics:
+            painter.setPen(self.LYRIC_COLOR)
+            painter.setFont(self._lyric_font_obj)
+            painter.drawStaticText(QPointF(self.MARGIN, self._lyric_top()), self._lyric_static)
+            painter.setPen(self.TEXT_COLOR)
+
+        # 评论内容（超出最大高度时截断）
+        painter.save()
+        painter.setClipRect(QRect(self.MARGIN, comment_top, width, max(0, footer_top - comment_top)))
+        painter.setFont(self._comment_font_obj)
+        painter.drawStaticText(QPointF(self.MARGIN, comment_top), self._comment_static)
+        painter.restore()
+
+        # 底部信息栏：计数器在左，用户名在右
+        painter.setFont(self._footer_font_obj)
+        painter.drawStaticText(QPointF(self.MARGIN, footer_top), self._counter_static)
+        meta_x = self.MARGIN + width - self._meta_static.size().width()
+        painter.drawStaticText(QPointF(meta_x, footer_top), self._meta_static)
+
+        # 头像紧贴在用户名左侧
+        if self._avatar_pixmap is not None:
+            painter.drawPixmap(
+                round(meta_x) - self.AVATAR_GAP - self.AVATAR_SIZE,
+                footer_top + (self._footer_height - self.AVATAR_SIZE) // 2,
+                self._avatar_pixmap
+            )
+
+        painter.end()
+
+
+def create_comment_widget(renderer: str, parent: QWidget = None) -> CommentWidget:
+    """根据配置创建评论展示组件
+
+    Args:
+        renderer: 渲染方式，"label"（QLabel 组合）或 "painted"（自绘）
+        parent: 父窗口
+
+    Returns:
+        CommentWidget: 评论展示组件
+    """
+    if renderer == "painted":
+        return PaintedCommentWidget(parent)
+    return CommentWidget(parent)
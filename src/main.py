@@ -5,13 +5,30 @@
 """
 
 import sys
+import time
+from typing import Optional
+
+# 进程启动基准时间（尽量早地记录，用于计算首帧耗时）
+_START_TIME = time.perf_counter()
+
+from src.utils.startup_profile import StartupProfiler
+
+# 必须在导入 PyQt6 等重量级模块之前创建，才能统计到它们的导入耗时
+startup_profiler = StartupProfiler.from_argv(sys.argv, _START_TIME)
+
 from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import QTimer, qInstallMessageHandler, QtMsgType
+from PyQt6.QtCore import QTimer, QObject, QEvent, pyqtSignal, qInstallMessageHandler, QtMsgType
 
 from src.gui.main_window import TransparentWindow
 from src.core.monitor import NeteaseWindowMonitor
-from src.core.netease_crawler import NeteaseMusicCrawler
+from src.core.scheduler import Priority, RequestScheduler
+from src.core.session_snapshot import (
+    SessionSnapshot, load_session_snapshot, save_session_snapshot
+)
 from src.utils.logger import get_logger, setup_logger
+from src.utils.profiler import get_profiler, profiled
+from src.utils.metrics import WakeupCounter
+from src.config.settings import get_config
 
 logger = get_logger()
 
@@ -43,28 +60,134 @@ def qt_message_handler(msg_type: QtMsgType, context, message: str):
     pass
 
 
+class FirstPaintWatcher(QObject):
+    """首帧绘制监听器
+
+    监听目标组件的第一次绘制事件，绘制完成后回调一次并自动卸载
+    """
+
+    def __init__(self, target: QObject, callback):
+        """初始化首帧绘制监听器
+
+        Args:
+            target: 被监听的组件
+            callback: 首帧绘制后的回调函数
+        """
+        super().__init__(target)
+        self.callback = callback
+        target.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            obj.removeEventFilter(self)
+            # 排队到当前绘制完成之后再执行回调
+            QTimer.singleShot(0, self.callback)
+        return False
+
+
+class FetchSignals(QObject):
+    """后台获取结果信号
+
+    工作线程通过该信号把结果投递回主线程（跨线程自动排队）
+    """
+
+    # 参数：歌曲名、歌手名、歌曲详情、评论列表（获取失败时后两者为 None）
+    song_data_ready = pyqtSignal(str, str, object, object)
+
+    # 参数：歌曲ID、评论分页（获取失败时为 None）
+    comment_page_ready = pyqtSignal(str, object)
+
+    # 参数：歌曲ID、歌词（获取失败时为 None）
+    lyrics_ready = pyqtSignal(str, object)
+
+
 class MusicCommentApp:
     """应用主类"""
 
     # 检测间隔（毫秒）
     CHECK_INTERVAL = 3000  # 每3秒检测一次
 
-    def __init__(self):
-        """初始化应用"""
+    def __init__(self, profiler: StartupProfiler = None):
+        """初始化应用
+
+        Args:
+            profiler: 启动耗时分析器（仅在 --startup-profile 时传入）
+        """
+        self.profiler = profiler
         self.app = QApplication(sys.argv)
+        self._mark("QApplication 创建完成")
+
         self.window = TransparentWindow()
+        self._mark("主窗口创建完成")
+
+        self.config = get_config()
         self.monitor = NeteaseWindowMonitor()
-        self.crawler = NeteaseMusicCrawler()
+        # 爬虫（requests 等）延迟到首帧绘制后再创建
+        self._crawler = None
 
         # 当前歌曲信息（用于检测变化）
         self.current_song_name = ""
         self.current_artist_name = ""
 
+        # 当前显示内容对应的窗口标题（用于保存会话快照）
+        self._displayed_key: tuple[str, str] = ("", "")
+
+        # 网络请求放到后台线程执行，避免阻塞界面；任务按优先级出队，任务中的每个请求
+        # 再经爬虫的限速入口按优先级取得名额，当前歌曲的获取不会排在翻页、预取等任务后面
+        self._scheduler = RequestScheduler(
+            max_workers=self.config.scheduler_workers,
+            aging_seconds=self.config.scheduler_aging_seconds
+        )
+        self._signals = FetchSignals()
+        self._signals.song_data_ready.connect(self._on_song_data_ready)
+        self._signals.comment_page_ready.connect(self.window.append_comment_page)
+        self._signals.lyrics_ready.connect(self._on_lyrics_ready)
+
+        # 评论浏览面板的分页请求同样交给后台线程
+        self.window.comment_page_requested.connect(self.request_comment_page)
+
+        # 本地推送接口（可选）：切歌和轮播时推送给外部订阅者
+        self.push_server = None
+        if self.config.push_api_enabled:
+            self._start_push_server()
+
+        # 当前歌曲开始播放的估计时间（monotonic，用于同步歌词）；
+        # 启动时已在播放的歌曲无法得知开始时间，为 None
+        self._song_started: Optional[float] = None
+
+        # 合并请求：同一时间只有一个获取任务，期间的切歌只保留最新一首
+        self._fetch_in_flight = False
+        self._queued_request: Optional[tuple[str, str]] = None
+
+        # 省电模式：窗口隐藏时降低检测频率并统计唤醒次数
+        self._hidden_wakeups = WakeupCounter()
+        self.window.visibility_changed.connect(self._on_visibility_changed)
+
+        # 退出时保存会话快照
+        self.app.aboutToQuit.connect(self._on_about_to_quit)
+
         # 创建定时器
         self.timer = QTimer()
         self.timer.timeout.connect(self.check_and_update)
         self.timer.setInterval(self.CHECK_INTERVAL)
 
+    @property
+    def crawler(self):
+        """爬虫客户端（首次使用时创建）"""
+        if self._crawler is None:
+            from src.core.netease_crawler import NeteaseMusicCrawler
+            self._crawler = NeteaseMusicCrawler()
+        return self._crawler
+
+    def _mark(self, label: str) -> None:
+        """记录启动时间点（未启用启动分析时不做任何事）
+
+        Args:
+            label: 时间点名称
+        """
+        if self.profiler:
+            self.profiler.mark(label)
+
     def check_netease_running(self) -> bool:
         """检查网易云音乐是否运行
 
@@ -81,43 +204,234 @@ class MusicCommentApp:
             logger.error(f"检查网易云音乐状态时出错: {e}")
             return False
 
+    @profiled
     def fetch_song_data(self, song_name: str, artist_name: str):
-        """获取歌曲数据
+        """获取歌曲数据（在后台线程中执行）
 
         Args:
             song_name: 歌曲名称
             artist_name: 歌手名称
+
+        Returns:
+            Optional[tuple]: (歌曲详情, 评论列表)，失败则返回 None
         """
         try:
             # 1. 搜索获取 song_id
             song_id = self.crawler.search_song(song_name, artist_name)
             if not song_id:
                 logger.warning(f"未找到歌曲: {song_name} - {artist_name}")
-                return
+                return None
 
             # 2. 获取歌曲详情
             song_detail = self.crawler.get_song_detail(song_id)
             if not song_detail:
                 logger.warning(f"获取歌曲详情失败: {song_id}")
-                return
+                return None
 
             # 3. 获取热门评论
             comments = self.crawler.get_hot_comments(song_id)
             if not comments:
                 logger.warning(f"获取评论失败: {song_id}")
-                return
+                return None
 
-            # 4. 更新UI
-            self.window.update_song(song_detail, comments)
+            return song_detail, comments
 
         except Exception as e:
             logger.error(f"获取歌曲数据时出错: {e}")
+            return None
+
+    def request_song_data(self, song_name: str, artist_name: str) -> None:
+        """提交后台获取任务，完成后通过信号回到主线程更新界面
+
+        Args:
+            song_name: 歌曲名称
+            artist_name: 歌手名称
+        """
+        if self._fetch_in_flight:
+            # 正在获取时不排队多个任务，只记住最新的歌曲（快速切歌时避免多余请求）
+            self._queued_request = (song_name, artist_name)
+            return
+
+        def task():
+            # 任务出错也要发出信号，否则 _fetch_in_flight 不会清除，之后的切歌只排队不获取
+            result = None
+            try:
+                result = self.fetch_song_data(song_name, artist_name)
+            finally:
+                self._signals.song_data_ready.emit(song_name, artist_name, *(result or (None, None)))
+
+        self._fetch_in_flight = True
+        self._scheduler.submit(Priority.FOREGROUND, task)
+
+    def request_comment_page(self, song_id: str, page_no: int, cursor: str) -> None:
+        """提交评论分页获取任务（评论浏览面板滚动到底部时触发）
+
+        Args:
+            song_id: 歌曲ID
+            page_no: 页码
+            cursor: 分页游标
+        """
+        def task():
+            page = self.crawler.get_comments_page(song_id, page_no, cursor)
+            self._signals.comment_page_ready.emit(song_id, page)
+
+        self._scheduler.submit(Priority.INTERACTIVE, task)
+
+    def request_lyrics(self, song_id: str) -> None:
+        """提交歌词获取任务（评论显示之后，不阻塞当前歌曲的获取）
+
+        Args:
+            song_id: 歌曲ID
+        """
+        def task():
+            lyrics = self.crawler.get_lyrics(song_id)
+            self._signals.lyrics_ready.emit(song_id, lyrics)
+
+        self._scheduler.submit(Priority.INTERACTIVE, task)
+
+    def _on_lyrics_ready(self, song_id: str, lyrics) -> None:
+        """歌词获取完成（主线程）：仍是当前歌曲时按估计的播放位置显示
+
+        Args:
+            song_id: 歌曲ID
+            lyrics: 歌词
+        """
+        widget = self.window.comment_widget
+        if widget.current_song is None or widget.current_song.song_id != song_id:
+            return
+        if self._song_started is None:
+            return
+
+        position_ms = int((time.monotonic() - self._song_started) * 1000)
+        widget.set_lyrics(lyrics, position_ms)
+
+    def _on_song_data_ready(self, song_name: str, artist_name: str, song_detail, comments) -> None:
+        """后台获取完成（主线程）
+
+        Args:
+            song_name: 请求时的歌曲名
+            artist_name: 请求时的歌手名
+            song_detail: 歌曲详情
+            comments: 评论列表
+        """
+        self._fetch_in_flight = False
+
+        # 获取期间有新的切歌请求，立即开始获取最新歌曲
+        if self._queued_request:
+            queued, self._queued_request = self._queued_request, None
+            if queued != (song_name, artist_name):
+                self.request_song_data(*queued)
 
+        if song_detail is None:
+            return
+
+        # 获取期间歌曲已切换，丢弃过期结果
+        if (song_name, artist_name) != (self.current_song_name, self.current_artist_name):
+            logger.debug("丢弃过期的获取结果: %s - %s", song_name, artist_name)
+            return
+
+        widget = self.window.comment_widget
+        start_index = 0
+
+        # 同一首歌的后台校验：内容未变则不打断轮播，否则保留轮播位置
+        if self._displayed_key == (song_name, artist_name) and widget.current_song:
+            if widget.current_song == song_detail and widget.comments == comments:
+                logger.debug("会话快照校验通过，无需更新")
+                return
+            start_index = widget.current_index
+
+        self.window.update_song(song_detail, comments, start_index)
+        self._displayed_key = (song_name, artist_name)
+        self._save_snapshot()
+
+        if self.config.lyrics_enabled and self._song_started is not None:
+            self.request_lyrics(song_detail.song_id)
+
+    def _restore_snapshot(self, song_name: str, artist_name: str) -> bool:
+        """尝试用上次会话快照立即渲染当前歌曲
+
+        Args:
+            song_name: 当前歌曲名
+            artist_name: 当前歌手名
+
+        Returns:
+            bool: 是否恢复成功
+        """
+        snapshot = load_session_snapshot()
+        if not snapshot or not snapshot.matches(song_name, artist_name):
+            return False
+
+        self.window.update_song(snapshot.song, snapshot.comments, snapshot.index)
+        self._displayed_key = (song_name, artist_name)
+        logger.info(f"已从会话快照恢复: {snapshot.song}")
+        return True
+
+    def _save_snapshot(self) -> None:
+        """保存当前显示内容的会话快照"""
+        widget = self.window.comment_widget
+        if not widget.current_song or not widget.comments:
+            return
+
+        song_name, artist_name = self._displayed_key
+        save_session_snapshot(SessionSnapshot(
+            title_song=song_name,
+            title_artist=artist_name,
+            song=widget.current_song,
+            comments=widget.comments,
+            index=widget.current_index,
+        ))
+
+    def _on_visibility_changed(self, visible: bool) -> None:
+        """窗口显示/隐藏时切换省电模式
+
+        隐藏时降低歌曲检测频率（界面更新已由评论组件暂停），
+        显示时恢复检测频率并报告隐藏期间的唤醒次数
+
+        Args:
+            visible: 窗口是否可见
+        """
+        if not visible:
+            self.timer.setInterval(self.config.hidden_check_interval)
+            self._hidden_wakeups.start()
+            return
+
+        self.timer.setInterval(self.CHECK_INTERVAL)
+        if self._hidden_wakeups.active:
+            count, duration, per_hour = self._hidden_wakeups.stop()
+            logger.info("隐藏期间 %.0f 秒共唤醒 %s 次（约 %.0f 次/小时）", duration, count, per_hour)
+
+    def _start_push_server(self) -> None:
+        """启动本地推送接口并连接评论组件的切歌/轮播信号"""
+        from src.core.push_server import PushServer
+
+        try:
+            self.push_server = PushServer(self.config.push_api_port).start()
+        except OSError as e:
+            logger.warning("本地推送接口启动失败（端口 %s）: %s", self.config.push_api_port, e)
+            return
+
+        widget = self.window.comment_widget
+        widget.song_changed.connect(
+            lambda: self.push_server.publish_song(widget.current_song, widget.comments, widget.current_index)
+        )
+        widget.rotated.connect(self.push_server.publish_rotation)
+
+    def _on_about_to_quit(self) -> None:
+        """应用退出前：保存快照、写出性能分析结果并停止后台线程"""
+        self._save_snapshot()
+        get_profiler().shutdown()
+        if self.push_server is not None:
+            self.push_server.stop()
+        self._scheduler.shutdown(wait=False, cancel_futures=True)
+
+    @profiled
     def check_and_update(self):
         """定时检测歌曲变化并更新
 
         每3秒检测一次当前播放的歌曲，如果发生变化则重新获取数据
         """
+        self._hidden_wakeups.tick()
+
         try:
             # 获取当前歌曲
             song = self.monitor.get_current_song()
@@ -128,25 +442,44 @@ class MusicCommentApp:
             if (song.name != self.current_song_name or
                 song.artist != self.current_artist_name):
 
-                logger.info(f"检测到歌曲切换: {self.current_song_name} - {self.current_artist_name} "
-                           f"-> {song.name} - {song.artist}")
+                logger.info("检测到歌曲切换: %s - %s -> %s - %s",
+                            self.current_song_name, self.current_artist_name,
+                            song.name, song.artist)
 
                 # 更新当前歌曲信息
                 self.current_song_name = song.name
                 self.current_artist_name = song.artist
 
+                # 切歌发生在上次检测之后的某个时刻，取检测间隔的中点作为开始播放时间
+                self._song_started = time.monotonic() - self.timer.interval() / 2000
+
                 # 重新获取数据
-                self.fetch_song_data(song.name, song.artist)
+                self.request_song_data(song.name, song.artist)
 
         except Exception as e:
-            logger.error(f"检测歌曲变化时出错: {e}")
+            logger.error("检测歌曲变化时出错: %s", e)
 
     def run(self) -> int:
         """运行应用
 
+        先显示窗口完成首帧绘制，再检测网易云、获取数据，保证窗口尽快出现
+
         Returns:
             int: 退出码
         """
+        FirstPaintWatcher(self.window.background_container, self._on_first_paint)
+
+        # 显示窗口
+        self.window.show()
+
+        return self.app.exec()
+
+    def _on_first_paint(self) -> None:
+        """首帧绘制完成后的启动流程"""
+        first_paint_ms = (time.perf_counter() - _START_TIME) * 1000
+        logger.info(f"首帧绘制完成，耗时 {first_paint_ms:.0f} ms")
+        self._mark("首帧绘制完成")
+
         try:
             # 检查网易云音乐是否运行
             if not self.check_netease_running():
@@ -155,7 +488,8 @@ class MusicCommentApp:
                     "网易云音乐未运行",
                     "请先启动网易云音乐，然后再运行本应用"
                 )
-                return 1
+                self.app.exit(1)
+                return
 
             # 获取当前歌曲
             song = self.monitor.get_current_song()
@@ -164,18 +498,15 @@ class MusicCommentApp:
                 self.current_song_name = song.name
                 self.current_artist_name = song.artist
 
-                # 获取歌曲数据
-                self.fetch_song_data(song.name, song.artist)
-
-            # 显示窗口
-            self.window.show()
+                # 先用上次会话快照立即显示，再在后台重新获取校验
+                if self._restore_snapshot(song.name, song.artist):
+                    self._mark("会话快照恢复完成")
+                self.request_song_data(song.name, song.artist)
 
             # 启动定时器，持续监控歌曲变化
             logger.info(f"启动定时监控，每 {self.CHECK_INTERVAL/1000} 秒检测一次")
             self.timer.start()
 
-            return self.app.exec()
-
         except PermissionError as e:
             QMessageBox.critical(
                 None,
@@ -187,7 +518,12 @@ class MusicCommentApp:
                 f"3. 再运行本程序\n\n"
                 f"错误详情：{e}"
             )
-            return 1
+            self.app.exit(1)
+
+        finally:
+            if self.profiler:
+                self.profiler.uninstall()
+                logger.info("\n" + self.profiler.format_report())
 
 
 def main():
@@ -202,8 +538,11 @@ def main():
     logger.info("网易云音乐评论桌面应用启动")
     logger.info("=" * 60)
 
+    # 环境变量开启的运行时性能分析
+    get_profiler().start_from_env(get_config().profile_window_seconds)
+
     try:
-        app = MusicCommentApp()
+        app = MusicCommentApp(startup_profiler)
         exit_code = app.run()
         sys.exit(exit_code)
     except Exception as e:
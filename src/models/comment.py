@@ -4,25 +4,48 @@
 包含网易云音乐评论的信息，如评论内容、用户、点赞数等
 """
 
-from dataclasses import dataclass
+import sys
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, Iterator, List
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
     """评论信息模型
 
-    用于存储从网易云音乐API获取的热门评论信息
+    用于存储从网易云音乐API获取的热门评论信息；
+    使用 __slots__ 并只保存原始时间戳，大量缓存评论时占用更少内存
 
     Attributes:
         content: 评论内容
-        user: 用户昵称
+        user: 用户昵称（驻留，不同歌曲下的同一用户共享字符串）
         likes: 点赞数
-        time: 评论时间戳（字符串格式）
+        time_ms: 评论时间（毫秒时间戳，显示时再格式化）
+        comment_id: 网易云评论ID（用于分页去重）
+        avatar_url: 用户头像原图地址（显示时按缩略图尺寸请求）
     """
     content: str
     user: str
     likes: int
-    time: str = ""
+    time_ms: int = 0
+    comment_id: int = 0
+    avatar_url: str = ""
+
+    def __post_init__(self):
+        self.user = sys.intern(self.user)
+
+    @property
+    def time(self) -> str:
+        """格式化后的评论时间
+
+        Returns:
+            str: 如 "2017-03-10 22:02"，没有时间戳时返回空字符串
+        """
+        if not self.time_ms:
+            return ""
+        return datetime.fromtimestamp(self.time_ms / 1000).strftime('%Y-%m-%d %H:%M')
 
     def get_likes_str(self) -> str:
         """获取格式化的点赞数字符串
@@ -44,3 +67,122 @@ class Comment:
         if len(self.content) > 30:
             content_preview += "..."
         return f"{self.user}: {content_preview}"
+
+
+class CommentBatch:
+    """按列存储的评论集合
+
+    数值字段存放在 array 中，评论内容以 UTF-8 拼接到一个 bytearray 并记录偏移，
+    用户昵称驻留后按列表保存；适合批量缓存、导出等不需要逐条对象的场景，
+    按下标访问时才构造 Comment
+    """
+
+    __slots__ = ("_content", "_offsets", "_users", "_likes", "_time_ms", "_comment_ids", "_avatar_urls")
+
+    def __init__(self, comments: Iterable[Comment] = ()):
+        """初始化评论集合
+
+        Args:
+            comments: 初始评论
+        """
+        self._content = bytearray()
+        self._offsets = array("q", [0])
+        self._users: list[str] = []
+        self._likes = array("q")
+        self._time_ms = array("q")
+        self._comment_ids = array("q")
+        self._avatar_urls: list[str] = []
+
+        self.extend(comments)
+
+    def append(self, comment: Comment) -> None:
+        """追加一条评论
+
+        Args:
+            comment: 评论
+        """
+        self._content += comment.content.encode("utf-8")
+        self._offsets.append(len(self._content))
+        self._users.append(sys.intern(comment.user))
+        self._likes.append(comment.likes)
+        self._time_ms.append(comment.time_ms)
+        self._comment_ids.append(comment.comment_id)
+        self._avatar_urls.append(comment.avatar_url)
+
+    def extend(self, comments: Iterable[Comment]) -> None:
+        """追加多条评论
+
+        Args:
+            comments: 评论
+        """
+        for comment in comments:
+            self.append(comment)
+
+    def __len__(self) -> int:
+        return len(self._likes)
+
+    def __getitem__(self, index: int) -> Comment:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CommentBatch index out of range")
+
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return Comment(
+            content=self._content[start:end].decode("utf-8"),
+            user=self._users[index],
+            likes=self._likes[index],
+            time_ms=self._time_ms[index],
+            comment_id=self._comment_ids[index],
+            avatar_url=self._avatar_urls[index],
+        )
+
+    def __iter__(self) -> Iterator[Comment]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_list(self) -> List[Comment]:
+        """转换为 Comment 列表
+
+        Returns:
+            List[Comment]: 评论列表
+        """
+        return list(self)
+
+
+@dataclass(slots=True)
+class CommentPage:
+    """评论分页结果
+
+    Attributes:
+        comments: 本页评论
+        cursor: 下一页的游标（由接口返回）
+        has_more: 是否还有下一页
+        total: 评论总数
+    """
+    comments: List[Comment] = field(default_factory=list)
+    cursor: str = ""
+    has_more: bool = False
+    total: int = 0
+
+
+@dataclass(slots=True)
+class CommentRefresh:
+    """增量刷新结果
+
+    Attributes:
+        hot_comments: 最新的热门评论
+        new: 新增的评论数
+        updated: 点赞数有变化的已缓存评论数
+        requests: 实际发出的请求数
+        bytes_received: 实际收到的响应字节数
+        extra_requests: 相比直接重新获取热门评论（一次请求）多发出的请求数
+        extra_bytes: 相比直接重新获取热门评论多收到的字节数（第一页之后各页的字节数）
+    """
+    hot_comments: List[Comment] = field(default_factory=list)
+    new: int = 0
+    updated: int = 0
+    requests: int = 0
+    bytes_received: int = 0
+    extra_requests: int = 0
+    extra_bytes: int = 0
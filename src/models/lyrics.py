@@ -0,0 +1,121 @@
+"""
+歌词数据模型
+
+LRC 歌词只解析一次，按时间排序存为两个平行数组（时间戳、歌词行），
+查找当前行和下一次换行时间都是对时间数组的二分查找
+"""
+
+import re
+from bisect import bisect_right
+from typing import Optional
+
+# 时间标签 [mm:ss]、[mm:ss.xx] 或 [mm:ss:xx]；一行歌词前可以有多个时间标签
+_TIME_TAG = re.compile(r"\[(\d+):(\d+)(?:[.:](\d+))?\]")
+
+# 整体偏移标签 [offset:+/-毫秒]，正值表示歌词提前显示
+_OFFSET_TAG = re.compile(r"\[offset:\s*([+-]?\d+)\s*\]", re.IGNORECASE)
+
+
+class Lyrics:
+    """已解析的同步歌词
+
+    Attributes:
+        times_ms: 每行开始时间（毫秒，升序）
+        lines: 与 times_ms 一一对应的歌词文本
+    """
+
+    __slots__ = ("times_ms", "lines")
+
+    def __init__(self, times_ms: Optional[list[int]] = None, lines: Optional[list[str]] = None):
+        """初始化歌词
+
+        Args:
+            times_ms: 每行开始时间（毫秒，须已升序）
+            lines: 歌词文本
+        """
+        self.times_ms = times_ms or []
+        self.lines = lines or []
+
+    @classmethod
+    def parse(cls, text: str) -> "Lyrics":
+        """解析 LRC 文本
+
+        没有时间标签的行（作者信息、网易云的 JSON 制作人员行等）被忽略；
+        同一时间的多行保持原顺序，显示最后一行
+
+        Args:
+            text: LRC 文本
+
+        Returns:
+            Lyrics: 歌词（没有可同步的行时为空）
+        """
+        offset = 0
+        match = _OFFSET_TAG.search(text or "")
+        if match:
+            offset = int(match.group(1))
+
+        entries: list[tuple[int, str]] = []
+        for raw_line in (text or "").splitlines():
+            tags = []
+            pos = 0
+            while True:
+                tag = _TIME_TAG.match(raw_line, pos)
+                if not tag:
+                    break
+                tags.append(tag)
+                pos = tag.end()
+            if not tags:
+                continue
+
+            content = raw_line[pos:].strip()
+            for tag in tags:
+                minutes, seconds, fraction = tag.groups()
+                # 小数部分按位数换算：.5 = 500ms、.50 = 500ms、.500 = 500ms
+                fraction_ms = int(fraction.ljust(3, "0")[:3]) if fraction else 0
+                time_ms = (int(minutes) * 60 + int(seconds)) * 1000 + fraction_ms - offset
+                entries.append((max(0, time_ms), content))
+
+        # 稳定排序：同一时间的行保持原顺序
+        entries.sort(key=lambda entry: entry[0])
+        return cls([time_ms for time_ms, _ in entries], [line for _, line in entries])
+
+    def __len__(self) -> int:
+        return len(self.times_ms)
+
+    def __bool__(self) -> bool:
+        return bool(self.times_ms)
+
+    def index_at(self, position_ms: int) -> int:
+        """播放位置对应的歌词行
+
+        Args:
+            position_ms: 播放位置（毫秒）
+
+        Returns:
+            int: 行下标，第一行开始之前为 -1
+        """
+        return bisect_right(self.times_ms, position_ms) - 1
+
+    def line_at(self, position_ms: int) -> str:
+        """播放位置对应的歌词文本
+
+        Args:
+            position_ms: 播放位置（毫秒）
+
+        Returns:
+            str: 歌词文本，第一行开始之前为空字符串
+        """
+        index = self.index_at(position_ms)
+        return self.lines[index] if index >= 0 else ""
+
+    def next_time(self, position_ms: int) -> Optional[int]:
+        """播放位置之后下一次换行的时间
+
+        Args:
+            position_ms: 播放位置（毫秒）
+
+        Returns:
+            Optional[int]: 下一行开始时间（毫秒），已是最后一行则返回 None
+        """
+        index = bisect_right(self.times_ms, position_ms)
+        return self.times_ms[index] if index < len(self.times_ms) else None
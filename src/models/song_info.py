@@ -4,11 +4,12 @@
 包含歌曲的基本信息，如歌曲ID、名称、歌手、专辑、风格标签等
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class SongInfo:
     """歌曲信息模型
 
@@ -21,6 +22,7 @@ class SongInfo:
         album: 专辑名称
         genres: 音乐风格标签列表（从songTag字段获取）
         duration: 时长（秒）
+        cover_url: 专辑封面原图地址（显示时按缩略图尺寸请求）
     """
     song_id: str
     name: str
@@ -28,6 +30,13 @@ class SongInfo:
     album: str = ""
     genres: List[str] = field(default_factory=list)
     duration: int = 0
+    cover_url: str = ""
+
+    def __post_init__(self):
+        # 歌手、专辑和风格标签在大量歌曲间重复，驻留后共享同一字符串
+        self.artist = sys.intern(self.artist)
+        self.album = sys.intern(self.album)
+        self.genres = [sys.intern(genre) for genre in self.genres]
 
     def get_genres_str(self) -> str:
         """获取风格字符串（最多显示3个标签）
@@ -0,0 +1,241 @@
+"""
+批量抓取命令行工具
+
+按歌曲列表预热本地评论库：对每首歌依次搜索、获取详情和热门评论，结果写入本地评论库。
+进度记录在检查点日志中，进程中断后用同样的命令重新运行，已完成的歌曲直接跳过，
+进行中的歌曲从下一阶段继续。某个阶段失败（未找到、请求失败、没有热门评论）的歌曲
+停在已完成的阶段，下次运行时重试
+
+加上 --refresh 时已完成的歌曲不再跳过，而是增量刷新评论：第一页（与直接获取热门评论相同的请求）
+没有覆盖本地已缓存的评论时才继续翻页，结果与本地评论库合并，报告相比直接重新获取热门评论多出的请求数和字节数
+
+抓取任务以后台优先级提交到请求调度器；配置了出口池时请求分散到各出口
+
+歌曲列表每行一首，格式为 "歌曲名 - 歌手名" 或 "歌曲名<Tab>歌手名"，空行和 # 开头的行被忽略
+
+运行方式:
+    python -m src.tools.bulk_crawl songs.txt [--journal songs.txt.journal] [--workers 4] [--refresh]
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from src.config.settings import get_config
+from src.core.crawl_journal import CrawlJournal, Stage
+from src.core.netease_crawler import NeteaseMusicCrawler
+from src.core.scheduler import Priority, RequestScheduler
+from src.models.comment import CommentRefresh
+
+# 进度输出间隔（首）
+PROGRESS_EVERY = 50
+
+
+def song_key(name: str, artist: str) -> str:
+    """检查点日志中的歌曲键"""
+    return f"{name}\t{artist}"
+
+
+def read_song_list(path: Path) -> List[Tuple[str, str]]:
+    """读取歌曲列表
+
+    Args:
+        path: 歌曲列表文件
+
+    Returns:
+        List[Tuple[str, str]]: (歌曲名, 歌手名)，去掉重复的歌曲
+    """
+    songs = []
+    seen = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if "\t" in line:
+                name, _, artist = line.partition("\t")
+            else:
+                name, _, artist = line.partition(" - ")
+            song = (name.strip(), artist.strip())
+            if song[0] and song not in seen:
+                seen.add(song)
+                songs.append(song)
+    return songs
+
+
+def crawl_song(crawler: NeteaseMusicCrawler, journal: CrawlJournal, name: str, artist: str) -> bool:
+    """从日志记录的阶段继续抓取一首歌，每完成一个阶段追加一条记录
+
+    Args:
+        crawler: 爬虫
+        journal: 检查点日志
+        name: 歌曲名
+        artist: 歌手名
+
+    Returns:
+        bool: 是否已完成全部阶段
+    """
+    key = song_key(name, artist)
+    entry = journal.get(key)
+    song_id = entry.song_id
+
+    if entry.stage < Stage.SEARCHED:
+        song_id = crawler.search_song(name, artist)
+        if song_id is None:
+            return False
+        journal.record(key, Stage.SEARCHED, song_id)
+
+    if entry.stage < Stage.DETAILED:
+        if crawler.get_song_detail(song_id) is None:
+            return False
+        journal.record(key, Stage.DETAILED, song_id)
+
+    if entry.stage < Stage.COMMENTED:
+        # 获取失败和没有热门评论都返回空列表，无法区分，留到下次重试
+        if not crawler.get_hot_comments(song_id):
+            return False
+        journal.record(key, Stage.COMMENTED, song_id)
+
+    return True
+
+
+def refresh_song(crawler: NeteaseMusicCrawler, journal: CrawlJournal, name: str, artist: str) -> Optional[CommentRefresh]:
+    """增量刷新已完成歌曲的评论
+
+    Args:
+        crawler: 爬虫
+        journal: 检查点日志
+        name: 歌曲名
+        artist: 歌手名
+
+    Returns:
+        Optional[CommentRefresh]: 刷新结果，失败则返回 None
+    """
+    return crawler.refresh_comments(journal.get(song_key(name, artist)).song_id)
+
+
+def run_bulk_crawl(
+    crawler: NeteaseMusicCrawler,
+    journal: CrawlJournal,
+    songs: Iterable[Tuple[str, str]],
+    workers: int = 2,
+    progress: bool = False,
+    refresh: bool = False,
+) -> dict:
+    """批量抓取，跳过（或增量刷新）日志中已完成的歌曲
+
+    Args:
+        crawler: 爬虫
+        journal: 检查点日志
+        songs: (歌曲名, 歌手名) 列表
+        workers: 调度器工作线程数
+        progress: 是否定期向 stderr 输出进度
+        refresh: 是否增量刷新已完成的歌曲
+
+    Returns:
+        dict: total、skipped（已完成而跳过）、completed、failed、seconds；
+        refresh 时另有 refreshed（刷新成功的歌曲数）和 refresh（各项刷新统计之和）
+    """
+    songs = list(songs)
+    pending, finished = [], []
+    for song in songs:
+        (finished if journal.get(song_key(*song)).stage == Stage.COMMENTED else pending).append(song)
+    to_refresh = finished if refresh else []
+
+    scheduler = RequestScheduler(
+        max_workers=workers,
+        aging_seconds=get_config().scheduler_aging_seconds,
+        thread_name_prefix="bulk",
+    )
+    start = time.perf_counter()
+    completed = failed = refreshed = 0
+    totals = Counter()
+    try:
+        futures = [
+            scheduler.submit(Priority.BACKGROUND, crawl_song, crawler, journal, name, artist)
+            for name, artist in pending
+        ] + [
+            scheduler.submit(Priority.BACKGROUND, refresh_song, crawler, journal, name, artist)
+            for name, artist in to_refresh
+        ]
+        for done, future in enumerate(futures, 1):
+            try:
+                result = future.result()
+            except Exception:
+                result = None
+
+            if isinstance(result, CommentRefresh):
+                refreshed += 1
+                totals.update(
+                    new=result.new, updated=result.updated, requests=result.requests,
+                    bytes=result.bytes_received, extra_requests=result.extra_requests,
+                    extra_bytes=result.extra_bytes,
+                )
+            elif result:
+                completed += 1
+            else:
+                failed += 1
+
+            if progress and done % PROGRESS_EVERY == 0:
+                elapsed = time.perf_counter() - start
+                print(f"  {done}/{len(futures)} 首，{done / elapsed:.2f} 首/秒", file=sys.stderr)
+    finally:
+        scheduler.shutdown(cancel_futures=True)
+        journal.sync()
+
+    return {
+        "total": len(songs),
+        "skipped": len(finished) - len(to_refresh),
+        "completed": completed,
+        "failed": failed,
+        "refreshed": refreshed,
+        "refresh": totals,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="按歌曲列表批量预热本地评论库（可中断后继续）")
+    parser.add_argument("songs", type=Path, help="歌曲列表文件（每行 \"歌曲名 - 歌手名\"）")
+    parser.add_argument("--journal", type=Path, default=None, help="检查点日志路径，默认为歌曲列表路径加 .journal")
+    parser.add_argument("--workers", type=int, default=2, help="抓取线程数（配置了多个出口时可适当增加）")
+    parser.add_argument("--refresh", action="store_true", help="增量刷新已完成歌曲的评论，而不是跳过")
+    args = parser.parse_args(argv)
+
+    if not args.songs.exists():
+        print(f"歌曲列表不存在: {args.songs}", file=sys.stderr)
+        return 1
+
+    songs = read_song_list(args.songs)
+    journal = CrawlJournal(args.journal or args.songs.with_name(args.songs.name + ".journal"))
+    crawler = NeteaseMusicCrawler()
+    if crawler.store is None:
+        print("本地评论库未启用（comment_store_enabled = false），抓取结果不会保存", file=sys.stderr)
+
+    try:
+        result = run_bulk_crawl(crawler, journal, songs, args.workers, progress=True, refresh=args.refresh)
+    except KeyboardInterrupt:
+        print("已中断，进度已保存，重新运行同样的命令即可继续", file=sys.stderr)
+        return 130
+    finally:
+        journal.close()
+
+    print(
+        f"共 {result['total']} 首：跳过已完成 {result['skipped']}，完成 {result['completed']}，"
+        f"未完成 {result['failed']}（下次运行时重试），耗时 {result['seconds']:.1f} 秒"
+    )
+    if args.refresh:
+        totals = result["refresh"]
+        print(
+            f"增量刷新 {result['refreshed']} 首：新增 {totals['new']} 条，更新点赞 {totals['updated']} 条，"
+            f"请求 {totals['requests']} 次 / {totals['bytes'] / 1024:.0f} KiB，"
+            f"相比直接重新获取热门评论多请求 {totals['extra_requests']} 次 / {totals['extra_bytes'] / 1024:.0f} KiB"
+        )
+    return 0 if result["failed"] == 0 else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
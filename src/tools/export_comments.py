@@ -0,0 +1,213 @@
+"""
+评论库导出命令行工具
+
+把本地评论库中的评论（附带歌曲名、歌手、专辑）流式导出为 JSONL 或 Parquet，
+供离线分析使用。按行号分块读取、逐块写出，内存占用只取决于块大小，
+数百万条评论的库也可以在小内存机器上导出
+
+增量导出: 每次导出后把最大行号（水位）写入状态文件，下次只导出之后新增的评论；
+已导出评论的点赞数变化不会再次导出
+
+Parquet 需要可选依赖 pyarrow（pip install pyarrow），每块写为一个 row group
+
+运行方式:
+    python -m src.tools.export_comments comments.jsonl [--since ROWID | --state export.state] [--db PATH]
+    python -m src.tools.export_comments comments.parquet [--chunk-size 50000]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from src.core.comment_store import CommentStore, get_store_path
+
+# 导出的列（与 CommentStore.iter_comment_chunks 的列一致）
+COLUMNS = ("rowid", "song_id", "song_name", "artist", "album",
+           "comment_id", "user", "content", "likes", "time_ms")
+
+# 进度输出间隔（秒）
+PROGRESS_INTERVAL = 2.0
+
+
+class JsonlWriter:
+    """JSONL 输出，每条评论一行"""
+
+    def __init__(self, path: Path):
+        self._file = open(path, "w", encoding="utf-8", newline="\n")
+
+    def write_chunk(self, rows: List) -> None:
+        self._file.writelines(
+            json.dumps(dict(zip(COLUMNS, (row[column] for column in COLUMNS))), ensure_ascii=False) + "\n"
+            for row in rows
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter:
+    """Parquet 输出，每块写为一个 row group"""
+
+    def __init__(self, path: Path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema([
+            ("rowid", pa.int64()),
+            ("song_id", pa.string()),
+            ("song_name", pa.string()),
+            ("artist", pa.string()),
+            ("album", pa.string()),
+            ("comment_id", pa.int64()),
+            ("user", pa.string()),
+            ("content", pa.string()),
+            ("likes", pa.int64()),
+            ("time_ms", pa.int64()),
+        ])
+        self._writer = pq.ParquetWriter(str(path), self._schema, compression="zstd")
+
+    def write_chunk(self, rows: List) -> None:
+        columns = {column: [row[column] for row in rows] for column in COLUMNS}
+        self._writer.write_table(self._pa.Table.from_pydict(columns, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def read_watermark(state_path: Path) -> int:
+    """读取状态文件中的水位（文件不存在时为 0，即全量导出）
+
+    Args:
+        state_path: 状态文件路径
+
+    Returns:
+        int: 上次导出的最大行号
+    """
+    if not state_path.exists():
+        return 0
+    with open(state_path, "r", encoding="utf-8") as f:
+        return int(json.load(f).get("watermark", 0))
+
+
+def write_watermark(state_path: Path, watermark: int) -> None:
+    """写入水位（先写临时文件再替换，中断时不会留下损坏的状态文件）
+
+    Args:
+        state_path: 状态文件路径
+        watermark: 本次导出的最大行号
+    """
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"watermark": watermark, "exported_at": time.time()}, f)
+    tmp_path.replace(state_path)
+
+
+def export_comments(
+    store: CommentStore,
+    output: Path,
+    fmt: str = "jsonl",
+    since_rowid: int = 0,
+    chunk_size: int = 5000,
+    progress: bool = False,
+) -> dict:
+    """把行号大于 since_rowid 的评论流式导出到文件
+
+    Args:
+        store: 评论库
+        output: 输出文件路径
+        fmt: "jsonl" 或 "parquet"
+        since_rowid: 水位，只导出行号大于此值的评论
+        chunk_size: 每块的行数
+        progress: 是否定期向 stderr 输出进度
+
+    Returns:
+        dict: rows（导出条数）、watermark（新水位）、seconds（耗时）、rows_per_second
+    """
+    writer = ParquetWriter(output) if fmt == "parquet" else JsonlWriter(output)
+    total = store.count_comments(since_rowid) if progress else 0
+
+    rows_written = 0
+    watermark = since_rowid
+    start = last_report = time.perf_counter()
+    try:
+        for rows in store.iter_comment_chunks(since_rowid, chunk_size):
+            writer.write_chunk(rows)
+            rows_written += len(rows)
+            watermark = rows[-1]["rowid"]
+
+            now = time.perf_counter()
+            if progress and now - last_report >= PROGRESS_INTERVAL:
+                last_report = now
+                print(f"  {rows_written}/{total} 条，{rows_written / (now - start):.0f} 条/秒", file=sys.stderr)
+    finally:
+        writer.close()
+
+    seconds = time.perf_counter() - start
+    return {
+        "rows": rows_written,
+        "watermark": watermark,
+        "seconds": seconds,
+        "rows_per_second": rows_written / seconds if seconds > 0 else 0.0,
+    }
+
+
+def _detect_format(output: Path, fmt: Optional[str]) -> str:
+    """未指定格式时按扩展名判断"""
+    if fmt:
+        return fmt
+    return "parquet" if output.suffix.lower() in (".parquet", ".pq") else "jsonl"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="把本地缓存的网易云评论导出为 JSONL 或 Parquet")
+    parser.add_argument("output", type=Path, help="输出文件（.jsonl 或 .parquet）")
+    parser.add_argument("--format", choices=("jsonl", "parquet"), default=None, help="输出格式，默认按扩展名判断")
+    parser.add_argument("--since", type=int, default=None, help="只导出行号大于此水位的评论")
+    parser.add_argument("--state", type=Path, default=None,
+                        help="水位状态文件：读取上次的水位，导出成功后写入新水位")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="每块读取和写出的行数")
+    parser.add_argument("--db", type=Path, default=None, help="评论库路径，默认为配置目录下的 comments.db")
+    args = parser.parse_args(argv)
+
+    path = args.db or get_store_path()
+    if not path.exists():
+        print(f"评论库不存在: {path}", file=sys.stderr)
+        return 1
+
+    fmt = _detect_format(args.output, args.format)
+    if fmt == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("导出 Parquet 需要安装 pyarrow: pip install pyarrow", file=sys.stderr)
+            return 1
+
+    if args.since is not None:
+        since_rowid = args.since
+    elif args.state:
+        since_rowid = read_watermark(args.state)
+    else:
+        since_rowid = 0
+
+    store = CommentStore(path)
+    try:
+        result = export_comments(store, args.output, fmt, since_rowid, args.chunk_size, progress=True)
+    finally:
+        store.close()
+
+    if args.state:
+        write_watermark(args.state, result["watermark"])
+
+    print(
+        f"导出 {result['rows']} 条评论到 {args.output}（{fmt}），耗时 {result['seconds']:.1f} 秒，"
+        f"{result['rows_per_second']:.0f} 条/秒，水位 {since_rowid} → {result['watermark']}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
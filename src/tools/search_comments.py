@@ -0,0 +1,55 @@
+"""
+离线评论搜索命令行工具
+
+在本地评论库中按关键词搜索缓存过的评论，不访问网络
+
+运行方式:
+    python -m src.tools.search_comments 下雨的夜晚 [--limit 20] [--songs] [--db PATH]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from src.core.comment_store import CommentStore, get_store_path
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="离线搜索本地缓存的网易云评论")
+    parser.add_argument("query", help="关键词（多个关键词用空格分隔，需同时出现）")
+    parser.add_argument("--limit", type=int, default=20, help="最多显示的条数")
+    parser.add_argument("--songs", action="store_true", help="搜索歌曲名/歌手/专辑而不是评论内容")
+    parser.add_argument("--db", type=Path, default=None, help="评论库路径，默认为配置目录下的 comments.db")
+    args = parser.parse_args(argv)
+
+    path = args.db or get_store_path()
+    if not path.exists():
+        print(f"评论库不存在: {path}", file=sys.stderr)
+        return 1
+
+    store = CommentStore(path)
+    try:
+        start = time.perf_counter()
+        if args.songs:
+            songs = store.search_songs(args.query, args.limit)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            for song in songs:
+                print(f"{song.song_id}\t{song}\t{song.album}")
+            print(f"共 {len(songs)} 首歌曲，耗时 {elapsed_ms:.1f} ms")
+        else:
+            matches = store.search_comments(args.query, args.limit)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            for match in matches:
+                title = f"{match.song_name} - {match.artist}" if match.song_name else match.song_id
+                print(f"[{title}] {match.comment.user} · {match.comment.get_likes_str()}")
+                print(f"    {match.comment.content}")
+            print(f"共 {len(matches)} 条评论，耗时 {elapsed_ms:.1f} ms")
+    finally:
+        store.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
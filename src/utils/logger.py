@@ -4,28 +4,74 @@
 提供统一的日志记录功能，输出到控制台和文件
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
 
+# 可以放心推迟到后台线程格式化的参数类型（不可变）
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """尽量不在调用线程格式化消息的 QueueHandler
+
+    标准 QueueHandler.prepare 会在调用线程中完成消息格式化；
+    这里的队列只在进程内使用，参数都是不可变标量时直接把原始记录交给后台线程格式化。
+    含列表、字典等可变参数时在调用线程先格式化，避免后台线程看到之后被修改的内容
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if args and not (isinstance(args, tuple) and all(isinstance(arg, _IMMUTABLE_ARG_TYPES) for arg in args)):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+# 后台写日志的监听器（进程内唯一）
+_listener: Optional[logging.handlers.QueueListener] = None
+_atexit_registered = False
+
+
+def _stop_listener() -> None:
+    """停止后台监听器，写完队列中剩余的日志"""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def setup_logger(
     name: str = "music-comment",
     level: int = logging.INFO,
-    log_dir: Optional[Path] = None
+    log_dir: Optional[Path] = None,
+    max_bytes: int = 5 * 1024 * 1024,
+    backup_count: int = 5
 ) -> logging.Logger:
     """设置日志记录器
 
+    调用线程只负责把日志记录放入队列，格式化和磁盘/控制台写入
+    都由后台 QueueListener 线程完成，不阻塞界面事件循环
+
     Args:
         name: 日志记录器名称
         level: 日志级别
         log_dir: 日志文件目录，默认为 logs/
+        max_bytes: 单个日志文件的最大字节数，超过后轮转
+        backup_count: 保留的轮转文件数
 
     Returns:
         logging.Logger: 配置好的日志记录器
     """
+    global _listener, _atexit_registered
+
     if log_dir is None:
         log_dir = Path("logs")
 
@@ -49,14 +95,33 @@ def setup_logger(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
-    # 文件处理器（每天一个文件）
+    # 文件处理器（每天一个文件，超过大小后轮转）
     log_file = log_dir / f"music-comment-{datetime.now().strftime('%Y-%m-%d')}.log"
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=max_bytes,
+        backupCount=backup_count,
+        encoding="utf-8"
+    )
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # 记录器只挂队列处理器，实际输出在后台线程完成
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+
+    _stop_listener()
+    _listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+    if not _atexit_registered:
+        atexit.register(_stop_listener)
+        _atexit_registered = True
 
     return logger
 
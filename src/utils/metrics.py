@@ -0,0 +1,281 @@
+"""
+延迟统计工具
+
+为歌曲切换流程的各个阶段记录单调时钟耗时，维护滚动 p50/p95/max 统计
+"""
+
+import json
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Optional
+
+
+class LatencyHistogram:
+    """滚动延迟统计
+
+    只保留最近 window 个样本，统计值基于这些样本计算；
+    记录一次的开销只是一次 deque.append
+    """
+
+    def __init__(self, window: int = 512):
+        """初始化延迟统计
+
+        Args:
+            window: 保留的最近样本数
+        """
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, elapsed_ms: float) -> None:
+        """记录一次耗时
+
+        Args:
+            elapsed_ms: 耗时（毫秒）
+        """
+        self._samples.append(elapsed_ms)
+        self.count += 1
+
+    @staticmethod
+    def _percentile(ordered: list[float], percent: float) -> float:
+        """最近秩法计算百分位数
+
+        Args:
+            ordered: 已排序的样本
+            percent: 百分位（0-100）
+
+        Returns:
+            float: 百分位数值
+        """
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self) -> dict:
+        """计算统计摘要
+
+        Returns:
+            dict: 包含 count、p50、p95、max、last 的字典（单位毫秒）
+        """
+        samples = list(self._samples)
+        if not samples:
+            return {"count": self.count, "p50": 0.0, "p95": 0.0, "max": 0.0, "last": 0.0}
+
+        ordered = sorted(samples)
+        return {
+            "count": self.count,
+            "p50": round(self._percentile(ordered, 50), 3),
+            "p95": round(self._percentile(ordered, 95), 3),
+            "max": round(ordered[-1], 3),
+            "last": round(samples[-1], 3),
+        }
+
+
+class _StageTimer:
+    """阶段计时上下文管理器"""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: LatencyHistogram):
+        self._histogram = histogram
+        self._start = 0
+
+    def __enter__(self) -> "_StageTimer":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._histogram.record((time.perf_counter_ns() - self._start) / 1_000_000)
+
+
+class MetricsRegistry:
+    """阶段耗时注册表
+
+    按阶段名称管理 LatencyHistogram，可在任意线程中记录
+    """
+
+    def __init__(self, window: int = 512):
+        """初始化注册表
+
+        Args:
+            window: 每个阶段保留的最近样本数
+        """
+        self.window = window
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """获取（必要时创建）指定阶段的统计
+
+        Args:
+            name: 阶段名称
+
+        Returns:
+            LatencyHistogram: 阶段统计
+        """
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, LatencyHistogram(self.window))
+        return histogram
+
+    def stage(self, name: str) -> _StageTimer:
+        """返回阶段计时上下文管理器
+
+        用法::
+
+            with get_metrics().stage("search_song"):
+                ...
+
+        Args:
+            name: 阶段名称
+
+        Returns:
+            _StageTimer: 计时上下文
+        """
+        return _StageTimer(self.histogram(name))
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        """直接记录一次耗时
+
+        Args:
+            name: 阶段名称
+            elapsed_ms: 耗时（毫秒）
+        """
+        self.histogram(name).record(elapsed_ms)
+
+    def summary(self) -> dict[str, dict]:
+        """所有阶段的统计摘要
+
+        Returns:
+            dict[str, dict]: 阶段名称到统计摘要的映射
+        """
+        with self._lock:
+            items = list(self._histograms.items())
+        return {name: histogram.summary() for name, histogram in items}
+
+    def format_table(self) -> str:
+        """格式化为文本表格
+
+        Returns:
+            str: 多行文本表格
+        """
+        lines = [f"{'stage':<24}{'count':>7}{'p50(ms)':>10}{'p95(ms)':>10}{'max(ms)':>10}"]
+        for name, stats in self.summary().items():
+            lines.append(
+                f"{name:<24}{stats['count']:>7}"
+                f"{stats['p50']:>10.1f}{stats['p95']:>10.1f}{stats['max']:>10.1f}"
+            )
+        return "\n".join(lines)
+
+    def dump_json(self, path: Optional[Path] = None) -> Path:
+        """把统计摘要导出为 JSON 文件
+
+        Args:
+            path: 导出路径，默认为 logs/latency-时间戳.json
+
+        Returns:
+            Path: 实际写入的文件路径
+        """
+        if path is None:
+            log_dir = Path("logs")
+            log_dir.mkdir(parents=True, exist_ok=True)
+            path = log_dir / f"latency-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+
+        data = {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "unit": "ms",
+            "stages": self.summary(),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+        return path
+
+    def reset(self) -> None:
+        """清空所有统计"""
+        with self._lock:
+            self._histograms.clear()
+
+
+class WakeupCounter:
+    """唤醒次数计数器
+
+    统计一段时间内（如窗口隐藏期间）定时器唤醒进程的次数
+    """
+
+    def __init__(self):
+        """初始化计数器"""
+        self.count = 0
+        self._since: Optional[float] = None
+
+    @property
+    def active(self) -> bool:
+        """是否正在计数"""
+        return self._since is not None
+
+    def start(self) -> None:
+        """开始计数"""
+        self.count = 0
+        self._since = time.monotonic()
+
+    def tick(self) -> None:
+        """记录一次唤醒（未在计数时忽略）"""
+        if self._since is not None:
+            self.count += 1
+
+    def stop(self) -> tuple[int, float, float]:
+        """结束计数
+
+        Returns:
+            tuple[int, float, float]: (唤醒次数, 持续秒数, 每小时唤醒次数)
+        """
+        if self._since is None:
+            return 0, 0.0, 0.0
+
+        duration = time.monotonic() - self._since
+        self._since = None
+        per_hour = self.count / duration * 3600 if duration > 0 else 0.0
+        return self.count, duration, per_hour
+
+
+def timed(name: str):
+    """阶段计时装饰器
+
+    Args:
+        name: 阶段名称
+
+    Returns:
+        装饰器函数
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                get_metrics().record(name, (time.perf_counter_ns() - start) / 1_000_000)
+        return wrapper
+    return decorator
+
+
+# 全局统计注册表
+_metrics: Optional[MetricsRegistry] = None
+
+
+def get_metrics() -> MetricsRegistry:
+    """获取全局统计注册表
+
+    Returns:
+        MetricsRegistry: 全局统计注册表
+    """
+    global _metrics
+
+    if _metrics is None:
+        _metrics = MetricsRegistry()
+
+    return _metrics
@@ -0,0 +1,314 @@
+"""
+运行时性能分析工具
+
+支持在运行时开关 cProfile（限定时长）和 tracemalloc（快照对比），
+结果写入 logs/ 目录；未开启时被包装函数只多一次布尔判断
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger()
+
+# 启动时自动开启分析的环境变量，取值如 "cprofile"、"tracemalloc" 或 "cprofile,tracemalloc"
+PROFILE_ENV_VAR = "MUSIC_COMMENT_PROFILE"
+
+# Python 3.12 起 cProfile 基于进程级的 sys.monitoring：同一时刻只能启用一个 Profile，
+# 启用后记录所有线程的调用，因此改为全进程共用一个 Profile
+PROCESS_WIDE_PROFILE = sys.version_info >= (3, 12)
+
+
+class RuntimeProfiler:
+    """运行时性能分析器
+
+    Python 3.11 及以下 cProfile 只对当前线程生效，因此每个线程使用独立的 Profile 对象，
+    结束时再合并为一个 .prof 文件；3.12 起所有线程共用一个 Profile，
+    有被分析的调用在执行时启用，全部结束后停用
+    """
+
+    def __init__(self, log_dir: Optional[Path] = None, top_n: int = 30, stop_timeout: float = 2.0):
+        """初始化性能分析器
+
+        Args:
+            log_dir: 结果输出目录，默认为 logs/
+            top_n: 内存分析报告中显示的条目数
+            stop_timeout: 结束 CPU 分析时等待正在执行的被分析调用的最长时间（秒）
+        """
+        self.log_dir = log_dir or Path("logs")
+        self.top_n = top_n
+        self.stop_timeout = stop_timeout
+
+        # cProfile 状态
+        self.cprofile_active = False
+        self._profiles: dict[int, tuple[cProfile.Profile, threading.Lock]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shared: Optional[cProfile.Profile] = None
+        self._shared_users = 0
+        self._shared_idle = threading.Condition(self._lock)
+        self._stop_timer: Optional[threading.Timer] = None
+
+        # tracemalloc 状态
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._started_tracemalloc = False
+
+    @property
+    def tracemalloc_active(self) -> bool:
+        """内存分析是否正在进行"""
+        return self._baseline is not None
+
+    def _output_path(self, prefix: str, suffix: str) -> Path:
+        """生成带时间戳的输出文件路径"""
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        return self.log_dir / f"{prefix}-{datetime.now().strftime('%Y%m%d-%H%M%S')}{suffix}"
+
+    def start_cprofile(self, duration: float = 60) -> None:
+        """开始 CPU 分析，duration 秒后自动结束并写入 .prof 文件
+
+        Args:
+            duration: 分析时长（秒）
+        """
+        with self._lock:
+            if self.cprofile_active:
+                return
+            self._profiles = {}
+            self._shared = cProfile.Profile() if PROCESS_WIDE_PROFILE else None
+            self.cprofile_active = True
+            self._stop_timer = threading.Timer(duration, self.stop_cprofile)
+            self._stop_timer.daemon = True
+            self._stop_timer.start()
+
+        logger.info(f"CPU 分析已开启，{duration:.0f} 秒后自动结束")
+
+    def stop_cprofile(self) -> Optional[Path]:
+        """结束 CPU 分析并写入 .prof 文件
+
+        可能在 GUI 线程调用，等待正在执行的被分析调用最多 stop_timeout 秒：
+        超时后共用 Profile 直接停用并写入已采集的部分，各线程独立的 Profile 则跳过
+
+        Returns:
+            Optional[Path]: 结果文件路径，未采集到数据则返回 None
+        """
+        with self._lock:
+            if not self.cprofile_active:
+                return None
+            self.cprofile_active = False
+            if self._stop_timer:
+                self._stop_timer.cancel()
+                self._stop_timer = None
+            profiles = list(self._profiles.values())
+            self._profiles = {}
+            deadline = time.monotonic() + self.stop_timeout
+
+            # 等待共用 Profile 上正在执行的调用结束；超时则由下面的 pstats.Stats 停用它
+            if self._shared is not None:
+                if not self._shared_idle.wait_for(lambda: self._shared_users == 0, timeout=self.stop_timeout):
+                    logger.warning("CPU 分析结束时仍有被分析的调用在执行，只写入已采集的部分")
+                profiles.append((self._shared, threading.Lock()))
+                self._shared = None
+
+        stats = None
+        for profile, lock in profiles:
+            # 等待该线程中正在执行的调用结束；其他线程的 Profile 无法从这里停用，超时则跳过
+            if not lock.acquire(timeout=max(0.0, deadline - time.monotonic())):
+                logger.warning("CPU 分析结束时有线程的被分析调用仍在执行，跳过该线程的数据")
+                continue
+            try:
+                profile_stats = pstats.Stats(profile)
+            except TypeError:
+                # 该 Profile 从未成功启用（没有数据）
+                continue
+            finally:
+                lock.release()
+            if stats is None:
+                stats = profile_stats
+            else:
+                stats.add(profile_stats)
+
+        if stats is None:
+            logger.info("CPU 分析结束，期间没有被分析的调用")
+            return None
+
+        path = self._output_path("profile", ".prof")
+        stats.dump_stats(str(path))
+        logger.info(f"CPU 分析结果已写入: {path}")
+        return path
+
+    def _run_profiled(self, func, args, kwargs):
+        """在当前线程的 Profile 中执行函数"""
+        # 嵌套调用时外层已在分析中，直接执行
+        if getattr(self._local, "depth", 0):
+            return func(*args, **kwargs)
+
+        if PROCESS_WIDE_PROFILE:
+            return self._run_shared(func, args, kwargs)
+
+        thread_id = threading.get_ident()
+        with self._lock:
+            if not self.cprofile_active:
+                entry = None
+            else:
+                entry = self._profiles.get(thread_id)
+                if entry is None:
+                    entry = self._profiles[thread_id] = (cProfile.Profile(), threading.Lock())
+
+        if entry is None:
+            return func(*args, **kwargs)
+
+        profile, lock = entry
+        self._local.depth = 1
+        try:
+            with lock:
+                try:
+                    profile.enable()
+                except ValueError as e:
+                    # 其他分析工具（调试器、覆盖率统计等）已占用
+                    logger.debug("无法启用 CPU 分析，本次调用不分析: %s", e)
+                    return func(*args, **kwargs)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    profile.disable()
+        finally:
+            self._local.depth = 0
+
+    def _run_shared(self, func, args, kwargs):
+        """在全进程共用的 Profile 中执行函数（Python 3.12+）"""
+        with self._lock:
+            profile = self._shared if self.cprofile_active else None
+            if profile is not None and self._shared_users == 0:
+                try:
+                    profile.enable()
+                except ValueError as e:
+                    logger.debug("无法启用 CPU 分析，本次调用不分析: %s", e)
+                    profile = None
+            if profile is not None:
+                self._shared_users += 1
+
+        if profile is None:
+            return func(*args, **kwargs)
+
+        self._local.depth = 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._local.depth = 0
+            with self._lock:
+                self._shared_users -= 1
+                if self._shared_users == 0:
+                    profile.disable()
+                    self._shared_idle.notify_all()
+
+    def start_tracemalloc(self, frames: int = 10) -> None:
+        """开始内存分析，记录基线快照
+
+        Args:
+            frames: 每次分配记录的调用栈深度
+        """
+        if self.tracemalloc_active:
+            return
+
+        # 已由其他代码（如 PYTHONTRACEMALLOC）开启时沿用，结束时也不停止
+        self._started_tracemalloc = not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start(frames)
+        self._baseline = tracemalloc.take_snapshot()
+        logger.info("内存分析已开启")
+
+    def stop_tracemalloc(self) -> Optional[Path]:
+        """结束内存分析，把与基线的差异写入报告
+
+        Returns:
+            Optional[Path]: 报告文件路径，未开启则返回 None
+        """
+        if not self.tracemalloc_active:
+            return None
+
+        snapshot = tracemalloc.take_snapshot()
+        baseline, self._baseline = self._baseline, None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+        # 过滤掉分析工具自身的分配
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ]
+        diff = snapshot.filter_traces(filters).compare_to(baseline.filter_traces(filters), "lineno")
+
+        path = self._output_path("tracemalloc", ".txt")
+        total_kib = sum(stat.size_diff for stat in diff) / 1024
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"内存分配差异 Top {self.top_n}（总变化 {total_kib:+.1f} KiB）\n")
+            for stat in diff[:self.top_n]:
+                f.write(f"{stat}\n")
+
+        logger.info(f"内存分析报告已写入: {path}")
+        return path
+
+    def start_from_env(self, duration: float) -> None:
+        """根据环境变量开启分析
+
+        Args:
+            duration: CPU 分析时长（秒）
+        """
+        kinds = {kind.strip().lower() for kind in os.environ.get(PROFILE_ENV_VAR, "").split(",")}
+        if "cprofile" in kinds:
+            self.start_cprofile(duration)
+        if "tracemalloc" in kinds:
+            self.start_tracemalloc()
+
+    def shutdown(self) -> None:
+        """退出前结束所有分析并写入结果"""
+        self.stop_cprofile()
+        self.stop_tracemalloc()
+
+
+# 全局性能分析器
+_profiler: Optional[RuntimeProfiler] = None
+
+
+def get_profiler() -> RuntimeProfiler:
+    """获取全局性能分析器
+
+    Returns:
+        RuntimeProfiler: 全局性能分析器
+    """
+    global _profiler
+
+    if _profiler is None:
+        _profiler = RuntimeProfiler()
+
+    return _profiler
+
+
+def profiled(func):
+    """CPU 分析挂钩装饰器
+
+    未开启 CPU 分析时只做一次布尔判断后直接调用原函数
+
+    Args:
+        func: 被包装的函数
+
+    Returns:
+        包装后的函数
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = _profiler
+        if profiler is None or not profiler.cprofile_active:
+            return func(*args, **kwargs)
+        return profiler._run_profiled(func, args, kwargs)
+    return wrapper
@@ -0,0 +1,148 @@
+"""
+启动耗时分析工具
+
+通过 --startup-profile 参数启用，统计每个模块的导入耗时以及首帧绘制耗时
+"""
+
+import builtins
+import sys
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+# 启动分析开关参数
+STARTUP_PROFILE_FLAG = "--startup-profile"
+
+
+@dataclass
+class ImportRecord:
+    """单个模块的导入耗时记录
+
+    Attributes:
+        name: 模块名
+        cumulative_ms: 累计耗时（包含其导入的子模块）
+        self_ms: 自身耗时（不含子模块）
+    """
+    name: str
+    cumulative_ms: float
+    self_ms: float
+
+
+class StartupProfiler:
+    """启动耗时分析器
+
+    通过包装 builtins.__import__ 记录首次导入每个模块的耗时，
+    并记录启动过程中的关键时间点（如首帧绘制）
+    """
+
+    def __init__(self, start_time: float):
+        """初始化启动耗时分析器
+
+        Args:
+            start_time: 进程启动基准时间（time.perf_counter()）
+        """
+        self.start_time = start_time
+        self.imports: list[ImportRecord] = []
+        self.marks: list[tuple[str, float]] = []
+        self._original_import = None
+        # 导入栈：记录每层嵌套导入中子模块的累计耗时
+        self._stack: list[float] = []
+
+    @classmethod
+    def from_argv(cls, argv: list[str], start_time: float) -> Optional["StartupProfiler"]:
+        """根据命令行参数创建分析器
+
+        如果命令行中包含 --startup-profile，则创建分析器并立即开始记录导入耗时，
+        同时从 argv 中移除该参数，避免传递给 Qt
+
+        Args:
+            argv: 命令行参数列表
+            start_time: 进程启动基准时间
+
+        Returns:
+            Optional[StartupProfiler]: 启用时返回分析器，否则返回 None
+        """
+        if STARTUP_PROFILE_FLAG not in argv:
+            return None
+
+        argv.remove(STARTUP_PROFILE_FLAG)
+        profiler = cls(start_time)
+        profiler.install()
+        return profiler
+
+    def install(self) -> None:
+        """开始记录模块导入耗时"""
+        if self._original_import is not None:
+            return
+
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self) -> None:
+        """停止记录模块导入耗时"""
+        if self._original_import is None:
+            return
+
+        builtins.__import__ = self._original_import
+        self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """带计时的 __import__ 替代函数"""
+        # 已导入的模块直接返回，只统计首次导入
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+
+            self.imports.append(ImportRecord(
+                name=name,
+                cumulative_ms=elapsed * 1000,
+                self_ms=(elapsed - children) * 1000
+            ))
+
+    def mark(self, label: str) -> float:
+        """记录一个启动时间点
+
+        Args:
+            label: 时间点名称
+
+        Returns:
+            float: 距进程启动的毫秒数
+        """
+        elapsed_ms = (time.perf_counter() - self.start_time) * 1000
+        self.marks.append((label, elapsed_ms))
+        return elapsed_ms
+
+    def format_report(self, top_n: int = 20) -> str:
+        """生成启动耗时报告
+
+        Args:
+            top_n: 显示累计耗时最高的前 N 个模块
+
+        Returns:
+            str: 多行文本报告
+        """
+        lines = ["启动耗时分析报告", "-" * 60]
+
+        # 顶层导入的累计耗时之和即为总导入耗时
+        total_self_ms = sum(record.self_ms for record in self.imports)
+        lines.append(f"模块导入总耗时: {total_self_ms:.1f} ms（共 {len(self.imports)} 个模块）")
+        lines.append(f"{'累计(ms)':>10} {'自身(ms)':>10}  模块")
+
+        slowest = sorted(self.imports, key=lambda r: r.cumulative_ms, reverse=True)[:top_n]
+        for record in slowest:
+            lines.append(f"{record.cumulative_ms:>10.1f} {record.self_ms:>10.1f}  {record.name}")
+
+        lines.append("-" * 60)
+        for label, elapsed_ms in self.marks:
+            lines.append(f"{elapsed_ms:>10.1f} ms  {label}")
+
+        return "\n".join(lines)
@@ -0,0 +1,69 @@
+"""
+测试公共夹具
+
+每个测试都把 HOME 指向临时目录并使用一份新的默认配置，不会读写真实的 ~/.music-comment；
+测试中对配置的修改、打开的全局评论库和共享缓存在测试结束后自动丢弃
+"""
+
+import sys
+import os
+
+import pytest
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config import settings
+from src.core import comment_store, shared_cache
+from src.core.comment_store import CommentStore
+from src.core.netease_crawler import NeteaseMusicCrawler
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    """隔离配置目录和全局单例
+
+    本地评论库和共享缓存默认关闭，需要的测试显式使用临时目录中的实例
+
+    Returns:
+        AppConfig: 本测试使用的全局配置
+    """
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    monkeypatch.setattr(settings, "_global_config", None)
+    monkeypatch.setattr(comment_store, "_store", None)
+    monkeypatch.setattr(shared_cache, "_shared_cache", None)
+    monkeypatch.setattr(shared_cache, "_token_bucket", None)
+
+    config = settings.get_config()
+    config.comment_store_enabled = False
+    config.shared_cache_enabled = False
+    return config
+
+
+@pytest.fixture
+def make_crawler(tmp_path):
+    """连接替身服务的爬虫工厂
+
+    工厂参数:
+        server: 替身服务
+        min_interval: 最小请求间隔（秒）
+        store: 是否使用临时目录中的本地评论库（同一测试中的爬虫共用一个文件）
+    """
+    stores = []
+
+    def make(server, min_interval: float = 0, store: bool = False) -> NeteaseMusicCrawler:
+        crawler = NeteaseMusicCrawler()
+        crawler.min_interval = min_interval
+        if store:
+            crawler.store = CommentStore(tmp_path / "comments.db")
+            stores.append(crawler.store)
+        server.apply_to(crawler)
+        return crawler
+
+    yield make
+
+    for store in stores:
+        store.close()
@@ -0,0 +1,103 @@
+"""
+批量抓取测试
+
+测试检查点日志的重放（含崩溃时写了一半的最后一行）、中断后继续抓取和增量刷新
+"""
+
+import sys
+import os
+import time
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.stub_server import StubNeteaseServer
+from src.core.crawl_journal import CrawlJournal, JournalEntry, Stage
+from src.tools.bulk_crawl import read_song_list, run_bulk_crawl, song_key
+
+
+def test_journal_replay_tolerates_torn_tail(tmp_path):
+    """重放时阶段只前进不后退；崩溃时写了一半的最后一行被忽略，之后的追加从新行开始"""
+    path = tmp_path / "crawl.journal"
+    journal = CrawlJournal(path)
+    journal.record("a", Stage.SEARCHED, "1")
+    journal.record("a", Stage.DETAILED, "1")
+    journal.record("b", Stage.SEARCHED, "2")
+    journal.record("a", Stage.SEARCHED, "1")
+    journal.close()
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"key": "b", "stage": "deta')
+
+    journal = CrawlJournal(path)
+    assert journal.get("a") == JournalEntry(Stage.DETAILED, "1")
+    assert journal.get("b") == JournalEntry(Stage.SEARCHED, "2")
+    assert journal.get("c") == JournalEntry()
+    journal.record("b", Stage.COMMENTED, "2")
+    journal.close()
+
+    journal = CrawlJournal(path)
+    assert journal.get("b").stage == Stage.COMMENTED
+    assert journal.counts() == {Stage.DETAILED: 1, Stage.COMMENTED: 1}
+    journal.close()
+
+
+def test_journal_overhead_is_small(tmp_path):
+    """批量 fsync：每首歌三条记录的开销远小于一次请求"""
+    journal = CrawlJournal(tmp_path / "crawl.journal", sync_every=64)
+    songs = 1000
+    start = time.perf_counter()
+    for i in range(songs):
+        for stage in (Stage.SEARCHED, Stage.DETAILED, Stage.COMMENTED):
+            journal.record(f"歌曲{i}\t歌手", stage, str(i))
+    per_song_ms = (time.perf_counter() - start) * 1000 / songs
+    journal.close()
+
+    assert per_song_ms < 2
+
+
+def test_resume_skips_completed_work(tmp_path, make_crawler):
+    """中断后重新运行：已完成的歌曲不再请求，进行中的歌曲从下一阶段继续"""
+    song_list = tmp_path / "songs.txt"
+    song_list.write_text(
+        "# 预热列表\n" + "".join(f"歌曲{i} - 歌手{i}\n" for i in range(6)) + "歌曲0\t歌手0\n\n",
+        encoding="utf-8",
+    )
+    songs = read_song_list(song_list)
+    assert len(songs) == 6
+
+    path = tmp_path / "songs.journal"
+    with StubNeteaseServer() as server:
+        crawler = make_crawler(server, store=True)
+
+        # 第一次运行：后三首歌获取详情失败（模拟中途中断），停在搜索阶段
+        get_song_detail = crawler.get_song_detail
+        failing = {crawler.search_song(*song) for song in songs[3:]}
+        crawler.get_song_detail = lambda song_id: None if song_id in failing else get_song_detail(song_id)
+        server.reset_counters()
+
+        journal = CrawlJournal(path)
+        result = run_bulk_crawl(crawler, journal, songs, workers=2)
+        journal.close()
+        assert (result["completed"], result["failed"]) == (3, 3)
+        assert server.request_counts["search"] == 6
+
+        # 第二次运行：新的爬虫实例（没有内存缓存），只补做后三首的详情和评论
+        crawler = make_crawler(server, store=True)
+        server.reset_counters()
+
+        journal = CrawlJournal(path)
+        result = run_bulk_crawl(crawler, journal, songs, workers=2)
+        assert (result["skipped"], result["completed"], result["failed"]) == (3, 3, 0)
+        assert server.request_counts == {"detail": 3, "comments": 3}
+        assert all(journal.get(song_key(*song)).stage == Stage.COMMENTED for song in songs)
+
+        # 第三次运行：增量刷新已完成的歌曲；评论库中只有热门评论，第一页即已覆盖，每首一次请求
+        server.reset_counters()
+        result = run_bulk_crawl(crawler, journal, songs, workers=2, refresh=True)
+        assert (result["skipped"], result["refreshed"], result["failed"]) == (0, 6, 0)
+        assert result["refresh"]["requests"] == server.request_counts["comments"] == 6
+        assert result["refresh"]["extra_requests"] == result["refresh"]["extra_bytes"] == 0
+        journal.close()
+
+    assert crawler.store.count_comments() >= 6 * 20
@@ -0,0 +1,35 @@
+"""
+评论模型测试
+
+测试按列存储的 CommentBatch 与 Comment 之间的转换
+"""
+
+import sys
+import os
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.comment import Comment, CommentBatch
+
+
+def test_batch_round_trip():
+    """CommentBatch 按下标取出的评论与原评论一致"""
+    comments = [
+        Comment(content="好听", user="用户", likes=1200, time_ms=1489154520000, comment_id=1),
+        Comment(content="", user="用户", likes=0),
+        Comment(content="循环了一整晚 🎧", user="另一个用户", likes=3, comment_id=3),
+    ]
+    batch = CommentBatch(comments)
+
+    assert len(batch) == 3
+    assert batch.to_list() == comments
+    assert batch[-1] == comments[-1]
+    # 相同昵称共享同一字符串
+    assert batch[0].user is batch[1].user
+
+
+def test_time_is_formatted_lazily():
+    """只保存时间戳，没有时间戳时显示为空"""
+    assert Comment(content="a", user="u", likes=0).time == ""
+    assert len(Comment(content="a", user="u", likes=0, time_ms=1489154520000).time) == 16
@@ -0,0 +1,101 @@
+"""
+评论浏览面板模型测试
+
+测试按需分页的请求时机、切歌后过期分页的丢弃和跨页去重
+"""
+
+import sys
+import os
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.gui.comment_browser import CommentListModel
+from src.models.comment import Comment, CommentPage
+
+ORIGINAL = "第一次听这首歌是在高三的晚自习，后来再也没有那样的夏天了"
+
+
+def _model() -> tuple[CommentListModel, list[tuple]]:
+    """创建模型，并记录它发出的分页请求"""
+    model = CommentListModel()
+    requests = []
+    model.page_requested.connect(lambda *args: requests.append(args))
+    return model, requests
+
+
+def _page(comments: list[Comment], cursor: str, has_more: bool = True) -> CommentPage:
+    return CommentPage(comments=comments, cursor=cursor, has_more=has_more, total=100)
+
+
+def test_fetch_more_is_gated_while_loading():
+    """加载中不重复请求；上一页到达后按游标请求下一页，没有更多时停止"""
+    model, requests = _model()
+    assert not model.canFetchMore()
+
+    model.set_song("1")
+    assert model.canFetchMore()
+    model.fetchMore()
+    model.fetchMore()
+    assert requests == [("1", 1, "-1")]
+    assert model.loading and not model.canFetchMore()
+
+    model.append_page("1", _page([Comment(content="a", user="u", likes=0, comment_id=1)], cursor="c1"))
+    assert model.canFetchMore()
+    model.fetchMore()
+    assert requests[-1] == ("1", 2, "c1")
+
+    model.append_page("1", _page([Comment(content="b", user="u", likes=0, comment_id=2)], cursor="c2", has_more=False))
+    assert not model.canFetchMore()
+    assert model.rowCount() == 2
+
+
+def test_stale_page_is_dropped():
+    """切歌后到达的旧歌曲分页被丢弃，不影响新歌曲的加载状态"""
+    model, requests = _model()
+    model.set_song("1")
+    model.fetchMore()
+
+    model.set_song("2")
+    model.append_page("1", _page([Comment(content="旧歌评论", user="u", likes=0, comment_id=1)], cursor="c1"))
+
+    assert model.rowCount() == 0
+    assert model.canFetchMore()
+    model.fetchMore()
+    assert requests[-1] == ("2", 1, "-1")
+
+
+def test_dedup_across_pages():
+    """跨页重复的评论ID和近似重复的内容只保留第一次出现"""
+    model, _ = _model()
+    model.set_song("1")
+
+    model.fetchMore()
+    model.append_page("1", _page([
+        Comment(content=ORIGINAL, user="a", likes=0, comment_id=1),
+        Comment(content="这首歌的前奏一响起我就想起了大学宿舍楼下的那棵树", user="b", likes=0, comment_id=2),
+    ], cursor="c1"))
+
+    model.fetchMore()
+    model.append_page("1", _page([
+        Comment(content="这首歌的前奏一响起我就想起了大学宿舍楼下的那棵树", user="b", likes=0, comment_id=2),
+        Comment(content=ORIGINAL + "！！", user="c", likes=0, comment_id=3),
+        Comment(content="单曲循环了一整个下午，窗外一直在下雨", user="d", likes=0, comment_id=4),
+    ], cursor="c2"))
+
+    users = [model.data(model.index(row), CommentListModel.CommentRole).user for row in range(model.rowCount())]
+    assert users == ["a", "b", "d"]
+
+
+def test_failed_page_stops_loading():
+    """获取失败后不再自动请求，避免滚动时反复失败"""
+    model, requests = _model()
+    model.set_song("1")
+    model.fetchMore()
+
+    model.append_page("1", None)
+
+    assert not model.loading
+    assert not model.canFetchMore()
+    model.fetchMore()
+    assert len(requests) == 1
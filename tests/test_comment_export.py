@@ -0,0 +1,83 @@
+"""
+评论库导出测试
+
+测试分块流式导出 JSONL、按水位增量导出和 Parquet 输出
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.comment_store import CommentStore
+from src.models.song_info import SongInfo
+from src.models.comment import Comment
+from src.tools.export_comments import export_comments, main
+
+
+def _fill(store: CommentStore, song_id: str, first: int, count: int) -> None:
+    store.save_comments(song_id, [
+        Comment(content=f"评论{i}", user=f"u{i}", likes=i, time_ms=i * 1000, comment_id=i)
+        for i in range(first, first + count)
+    ])
+
+
+def _read_jsonl(path) -> list[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_export_jsonl_in_chunks(tmp_path):
+    """分块导出全部评论，附带歌曲信息；未缓存的歌曲信息为空字符串"""
+    store = CommentStore(tmp_path / "comments.db")
+    store.save_song(SongInfo(song_id="1", name="晴天", artist="周杰伦", album="叶惠美"))
+    _fill(store, "1", 1, 7)
+    _fill(store, "2", 100, 3)
+
+    result = export_comments(store, tmp_path / "out.jsonl", chunk_size=3)
+    rows = _read_jsonl(tmp_path / "out.jsonl")
+
+    assert result["rows"] == len(rows) == 10
+    assert result["watermark"] == rows[-1]["rowid"]
+    assert [row["comment_id"] for row in rows] == [*range(1, 8), 100, 101, 102]
+    assert rows[0]["song_name"] == "晴天" and rows[0]["content"] == "评论1"
+    assert rows[-1]["song_name"] == "" and rows[-1]["song_id"] == "2"
+    store.close()
+
+
+def test_incremental_export_with_state_file(tmp_path):
+    """状态文件记录水位，下次只导出新增评论；已有评论的点赞更新不重复导出"""
+    db = tmp_path / "comments.db"
+    state = tmp_path / "export.state"
+    store = CommentStore(db)
+    _fill(store, "1", 1, 5)
+
+    assert main([str(tmp_path / "a.jsonl"), "--db", str(db), "--state", str(state), "--chunk-size", "2"]) == 0
+    assert len(_read_jsonl(tmp_path / "a.jsonl")) == 5
+
+    _fill(store, "1", 3, 5)  # 3~5 已存在（只更新点赞），6~7 为新增
+    assert main([str(tmp_path / "b.jsonl"), "--db", str(db), "--state", str(state)]) == 0
+    assert [row["comment_id"] for row in _read_jsonl(tmp_path / "b.jsonl")] == [6, 7]
+
+    assert main([str(tmp_path / "c.jsonl"), "--db", str(db), "--state", str(state)]) == 0
+    assert _read_jsonl(tmp_path / "c.jsonl") == []
+    store.close()
+
+
+def test_export_parquet(tmp_path):
+    """Parquet 每块一个 row group，内容与 JSONL 一致"""
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    store = CommentStore(tmp_path / "comments.db")
+    _fill(store, "1", 1, 10)
+    result = export_comments(store, tmp_path / "out.parquet", fmt="parquet", chunk_size=4)
+    store.close()
+
+    parquet = pq.ParquetFile(tmp_path / "out.parquet")
+    assert result["rows"] == parquet.metadata.num_rows == 10
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.read().column("comment_id").to_pylist() == list(range(1, 11))
@@ -0,0 +1,92 @@
+"""
+增量刷新评论测试
+
+测试按评论ID合并、已缓存评论都已获取到时停止翻页、额外请求统计，以及重新获取热门评论时的增量刷新
+"""
+
+import sys
+import os
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.stub_server import StubNeteaseServer
+from src.core.netease_crawler import NeteaseMusicCrawler
+
+SONG_ID = 186016
+
+
+def _hot_and_page_ids(comments, start=0, page_size=20):
+    """替身服务第一页的热门评论ID，以及从 start 起一页最新评论的ID"""
+    hot = sorted(comments, key=lambda c: c["likedCount"], reverse=True)[:20]
+    return {c["commentId"] for c in hot}, {c["commentId"] for c in comments[start:start + page_size]}
+
+
+def test_refresh_merges_and_stops_when_cached_comments_are_covered(make_crawler):
+    """已缓存的评论都已获取到时停止翻页；新评论插入、点赞数更新，并报告相比直接获取热门评论多出的请求"""
+    with StubNeteaseServer(total_comments=200) as server:
+        crawler = make_crawler(server, store=True)
+
+        # 本地评论库为空：第一页即可，与直接获取热门评论的请求相同
+        hot_ids, page_ids = _hot_and_page_ids(server.comments_for(SONG_ID))
+        first = crawler.refresh_comments(str(SONG_ID), max_pages=20)
+        assert (first.new, first.updated, first.requests, first.extra_requests, first.extra_bytes) == (
+            len(hot_ids | page_ids), 0, 1, 0, 0)
+        known = set(crawler.store.get_comment_likes(str(SONG_ID)))
+        assert known == hot_ids | page_ids
+
+        # 5 条新评论把第一页最后 5 条挤到第二页：第一页没有覆盖全部已缓存评论，再请求一页
+        server.post_comments(SONG_ID, 5, like_bump=1)
+        server.reset_counters()
+        comments = server.comments_for(SONG_ID)
+        hot_ids, page_ids = _hot_and_page_ids(comments)
+        assert not known <= hot_ids | page_ids
+        _, next_page_ids = _hot_and_page_ids(comments, start=20)
+
+        second = crawler.refresh_comments(str(SONG_ID), max_pages=20)
+        assert server.request_counts["comments"] == second.requests == 2
+        assert second.extra_requests == 1
+        assert 0 < second.extra_bytes < second.bytes_received == server.bytes_sent
+        fetched = hot_ids | page_ids | next_page_ids
+        assert second.new == len(fetched - known)
+        # 替身服务给所有已有评论的点赞数 +1
+        assert second.updated == len(fetched & known)
+
+        likes = crawler.store.get_comment_likes(str(SONG_ID))
+        assert set(likes) == known | fetched
+        hot = second.hot_comments[0]
+        assert likes[hot.comment_id] == hot.likes
+
+        # 评论区没有变化：同样请求到第二页，没有新增和更新
+        third = crawler.refresh_comments(str(SONG_ID), max_pages=20)
+        assert (third.requests, third.new, third.updated) == (2, 0, 0)
+
+
+def test_hot_comments_refetch_refreshes_stored_song(make_crawler):
+    """缓存过期后重新获取已入库歌曲的热门评论时走增量刷新：一次请求，更新点赞数，结果进入实例缓存"""
+    with StubNeteaseServer(total_comments=200) as server:
+        crawler = make_crawler(server, store=True)
+        crawler.get_hot_comments(str(SONG_ID))
+
+        server.post_comments(SONG_ID, 5, like_bump=1)
+        server.reset_counters()
+        crawler.get_hot_comments.cache_clear()
+
+        hot = crawler.get_hot_comments(str(SONG_ID))
+        assert server.request_counts["comments"] == 1
+        likes = crawler.store.get_comment_likes(str(SONG_ID))
+        assert all(likes[comment.comment_id] == comment.likes for comment in hot)
+        # 第一页的最新评论也已合并
+        assert {c["commentId"] for c in server.comments_for(SONG_ID)[:20]} <= set(likes)
+
+        assert crawler.get_hot_comments(str(SONG_ID)) is hot
+        assert server.request_counts["comments"] == 1
+
+
+def test_refresh_returns_none_when_first_page_fails():
+    """第一页获取失败时返回 None，不写入任何内容"""
+    crawler = NeteaseMusicCrawler()
+    crawler.min_interval = 0
+    crawler.timeout = 0.5
+    crawler.COMMENT_URL = "http://127.0.0.1:9/weapi/comment?csrf_token="
+    assert crawler.refresh_comments("1") is None
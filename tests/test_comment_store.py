@@ -0,0 +1,40 @@
+"""
+本地评论库测试
+
+测试评论的增量写入和离线全文搜索
+"""
+
+import sys
+import os
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.comment_store import CommentStore
+from src.models.song_info import SongInfo
+from src.models.comment import Comment
+
+
+def test_search_comments_and_songs(tmp_path):
+    """长关键词走全文索引，短关键词退化为 LIKE，重复写入只更新点赞数"""
+    store = CommentStore(tmp_path / "comments.db")
+    store.save_song(SongInfo(song_id="1", name="晴天", artist="周杰伦", album="叶惠美"))
+    store.save_comments("1", [
+        Comment(content="那个下雨的夜晚我一个人听了很久", user="a", likes=10, comment_id=1),
+        Comment(content="前奏一响就回到了高中", user="b", likes=20, comment_id=2),
+    ])
+    store.save_comments("1", [
+        Comment(content="那个下雨的夜晚我一个人听了很久", user="a", likes=99, comment_id=1),
+    ])
+
+    matches = store.search_comments("下雨的夜晚")
+    assert [m.comment.comment_id for m in matches] == [1]
+    assert matches[0].comment.likes == 99
+    assert matches[0].song_name == "晴天"
+
+    assert [m.comment.comment_id for m in store.search_comments("高中")] == [2]
+    assert store.search_comments("不存在的内容") == []
+    assert [song.name for song in store.search_songs("周杰伦")] == ["晴天"]
+    assert store.count_comments() == 2
+
+    store.close()
@@ -0,0 +1,62 @@
+"""
+爬虫离线测试
+
+使用本地替身服务测试搜索、详情、热门评论和分页接口，不访问网络
+"""
+
+import gc
+import sys
+import os
+import weakref
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.stub_server import StubNeteaseServer
+from src.core.netease_crawler import NeteaseMusicCrawler
+
+
+def test_crawler_against_stub_server(make_crawler):
+    """完整获取流程与游标分页"""
+    with StubNeteaseServer(total_comments=50) as server:
+        crawler = make_crawler(server)
+
+        song_id = crawler.search_song("浪人情歌", "伍佰")
+        assert crawler.get_song_detail(song_id).song_id == song_id
+        assert 0 < len(crawler.get_hot_comments(song_id)) <= 20
+
+        seen = []
+        page_no, cursor, has_more = 1, "-1", True
+        while has_more:
+            page = crawler.get_comments_page(song_id, page_no, cursor)
+            seen.extend(comment.comment_id for comment in page.comments)
+            page_no, cursor, has_more = page_no + 1, page.cursor, page.has_more
+
+        assert len(seen) == len(set(seen)) == 50
+        assert server.request_counts["comments"] == 1 + 3
+
+
+def test_crawler_cache_is_per_instance(make_crawler):
+    """缓存不跨实例共享，废弃的爬虫实例可以被回收"""
+    with StubNeteaseServer() as server:
+        crawler = make_crawler(server)
+
+        song_id = crawler.search_song("浪人情歌", "伍佰")
+        crawler.get_song_detail(song_id)
+        crawler.get_song_detail(song_id)
+        assert crawler.get_song_detail.cache_info().hits == 1
+        assert NeteaseMusicCrawler().get_song_detail.cache_info().currsize == 0
+
+        ref = weakref.ref(crawler)
+        del crawler
+        gc.collect()
+        assert ref() is None
+
+
+def test_parse_comment_tolerates_null_fields():
+    """接口返回 null 的昵称、用户和点赞数时按空值处理，不影响整页解析"""
+    comment = NeteaseMusicCrawler._parse_comment(
+        {"content": "还在听", "user": {"nickname": None, "avatarUrl": None}, "likedCount": None, "commentId": 7}
+    )
+    assert (comment.user, comment.likes, comment.avatar_url, comment.comment_id) == ("", 0, "", 7)
+    assert NeteaseMusicCrawler._parse_comment({"content": None, "user": None}).user == ""
@@ -0,0 +1,41 @@
+"""
+评论去重测试
+
+测试 SimHash 近似去重与分段索引
+"""
+
+import sys
+import os
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.dedup import SimHashIndex, dedup_comments, hamming_distance, simhash
+from src.models.comment import Comment
+
+
+def test_near_duplicates_are_suppressed():
+    """复制粘贴的变体被去掉，不同内容保留"""
+    original = "第一次听这首歌是在高三的晚自习，后来再也没有那样的夏天了"
+    comments = [
+        Comment(content=original, user="a", likes=100),
+        Comment(content=original + "！！", user="b", likes=50),
+        Comment(content="这首歌的前奏一响起我就想起了大学宿舍楼下的那棵树", user="c", likes=10),
+    ]
+
+    result = dedup_comments(comments, SimHashIndex(threshold=3))
+
+    assert [comment.user for comment in result] == ["a", "c"]
+
+
+def test_index_matches_brute_force():
+    """分段索引的结果与逐一比较一致"""
+    index = SimHashIndex(threshold=3)
+    fingerprints = []
+    for i in range(300):
+        fingerprint = simhash(f"评论内容 {i % 40} 号，循环播放第 {i % 7} 遍")
+        expected = any(hamming_distance(f, fingerprint) <= 3 for f in fingerprints)
+        assert (index.find_near(fingerprint) is not None) == expected
+        if not expected:
+            index.add(fingerprint)
+            fingerprints.append(fingerprint)
@@ -0,0 +1,92 @@
+"""
+出口池测试
+
+测试按出口限速的请求分配、故障出口的剔除和恢复，以及经本地替身代理的完整请求
+"""
+
+import sys
+import os
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.stub_proxy import StubProxy
+from benchmarks.stub_server import StubNeteaseServer
+from src.core.egress_pool import EgressPool
+from src.core.netease_crawler import NeteaseMusicCrawler
+
+
+class FakeClock:
+    """虚拟时钟：sleep 直接推进时间"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _pool(count: int, clock: FakeClock, **kwargs) -> EgressPool:
+    return EgressPool([f"http://10.0.0.{i}:8080" for i in range(count)], clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_requests_spread_across_egress_buckets():
+    """每个出口单独限速：3 个出口每秒各 1 个请求，9 个请求耗时 2 秒且平均分配"""
+    clock = FakeClock()
+    pool = _pool(3, clock, rate=1.0)
+
+    used = [pool.acquire().spec for _ in range(9)]
+
+    assert clock.now == 2.0
+    assert used[:3] == [egress.spec for egress in pool.egresses]
+    assert all(egress.requests == 3 for egress in pool.egresses)
+
+
+def test_failing_egress_is_ejected_and_readmitted():
+    """连续失败的出口被剔除，到期后试用恢复，再次失败时剔除时长加倍"""
+    clock = FakeClock()
+    pool = _pool(2, clock, rate=100.0, eject_seconds=10.0)
+    bad, good = pool.egresses
+
+    for _ in range(3):
+        pool.report(bad, ok=False)
+    assert bad.ejected_until == 10.0
+    assert pool.healthy_count() == 1
+    assert {pool.acquire().spec for _ in range(5)} == {good.spec}
+
+    clock.now = 10.0
+    assert pool.healthy_count() == 2
+    pool.report(bad, ok=False)
+    assert bad.ejected_until == 30.0
+
+    # 全部出口被剔除时等待最早恢复的一个
+    for _ in range(3):
+        pool.report(good, ok=False)
+    assert pool.acquire() is good
+    assert clock.now == 20.0
+
+
+def test_crawler_through_stub_proxies():
+    """请求经替身代理分散到各出口，故障代理被剔除，所有请求仍然成功"""
+    with StubNeteaseServer() as server, StubProxy() as first, StubProxy() as second, \
+            StubProxy(failing=True) as broken:
+        crawler = NeteaseMusicCrawler()
+        crawler.egress_pool = EgressPool([first.url, second.url, broken.url], rate=50.0)
+        server.apply_to(crawler)
+
+        songs = [crawler.get_song_detail(str(i)) for i in range(1, 25)]
+
+        assert all(song is not None for song in songs)
+        assert server.request_counts["detail"] == 24
+        assert first.requests + second.requests == 24
+        assert min(first.requests, second.requests) >= 8
+        assert broken.requests == 3
+        assert pool_ejected(crawler.egress_pool, broken.url)
+
+
+def pool_ejected(pool: EgressPool, spec: str) -> bool:
+    """出口当前是否处于剔除状态"""
+    return next(egress for egress in pool.egresses if egress.spec == spec).ejected_until > 0
@@ -0,0 +1,95 @@
+"""
+图片加载流水线测试
+"""
+
+import sys
+import os
+import time
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from benchmarks.stub_server import StubNeteaseServer
+from src.core.image_cache import ImageDiskCache, thumbnail_url
+from src.gui.image_loader import ImageLoader, image_key
+
+
+def test_thumbnail_url():
+    """替换已有的查询参数"""
+    assert thumbnail_url("http://p1.music.126.net/a.jpg", 40, 40) == "http://p1.music.126.net/a.jpg?param=40y40"
+    assert thumbnail_url("http://p1.music.126.net/a.jpg?param=1y1", 8, 6).endswith("a.jpg?param=8y6")
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    """超过上限时淘汰最久未使用的文件"""
+    cache = ImageDiskCache(tmp_path, max_bytes=1000)
+    for name in "abc":
+        cache.put(name, b"x" * 300)
+        time.sleep(0.01)
+
+    assert cache.get("a") is not None  # 访问 a，使 b 成为最久未使用
+    time.sleep(0.01)
+    cache.put("d", b"x" * 300)
+
+    assert cache.get("b") is None
+    assert all(cache.get(name) is not None for name in "acd")
+    assert cache.total_bytes <= 1000
+
+
+def _wait_for(loader: ImageLoader, key: str, timeout_ms: int = 5000) -> None:
+    """等待指定图片加载完成，超时则测试失败"""
+    loaded = []
+    loop = QEventLoop()
+    loader.image_ready.connect(lambda ready: ready == key and (loaded.append(ready), loop.quit()))
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+    assert loaded, f"等待图片超时: {key}"
+
+
+def test_loader_decodes_off_thread_and_caches(tmp_path):
+    """首次加载走网络，之后命中内存；新加载器命中磁盘缓存"""
+    app = QApplication.instance() or QApplication([])  # noqa: F841 保持引用，避免被回收
+    disk = ImageDiskCache(tmp_path)
+
+    with StubNeteaseServer() as server:
+        url = f"{server.base_url}/img/avatar.png"
+        key = image_key(url, 16, round_crop=True)
+
+        loader = ImageLoader(disk_cache=disk)
+        assert loader.get(url, 16, round_crop=True) is None
+        _wait_for(loader, key)
+
+        pixmap = loader.get(url, 16, round_crop=True)
+        assert pixmap is not None
+        assert round(pixmap.width() / pixmap.devicePixelRatio()) == 16
+        assert server.request_counts["image"] == 1
+
+        second = ImageLoader(disk_cache=disk)
+        second.get(url, 16, round_crop=True)
+        _wait_for(second, key)
+        assert second.get(url, 16, round_crop=True) is not None
+        assert server.request_counts["image"] == 1
+
+        loader.shutdown()
+        second.shutdown()
+
+
+def test_background_color_change_drops_cached_pixmap():
+    """修改背景颜色时释放旧的背景缓存，下次绘制按新颜色重新生成"""
+    from PyQt6.QtGui import QColor
+    from src.gui.main_window import BackgroundContainer
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841 保持引用，避免被回收
+    container = BackgroundContainer()
+    container.resize(200, 100)
+    first = container._background_pixmap()
+    assert container._background_pixmap() is first
+
+    container.set_background_color(QColor(10, 20, 30, 200))
+    assert container._bg_pixmap is None
+    assert container._background_pixmap() is not first
+    assert container._bg_key[3] == QColor(10, 20, 30, 200).rgba()
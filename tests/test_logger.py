@@ -0,0 +1,53 @@
+"""
+日志工具测试
+"""
+
+import sys
+import os
+import logging
+import queue
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils import logger as logger_module
+
+
+def _record(msg, args):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, None)
+
+
+def test_mutable_args_are_formatted_in_calling_thread():
+    """参数含列表时立即格式化，之后修改列表不影响日志内容；标量参数推迟格式化"""
+    handler = logger_module._DeferredQueueHandler(queue.SimpleQueue())
+
+    pids = [1, 2]
+    record = handler.prepare(_record("进程: %s", (pids,)))
+    pids.append(3)
+    assert record.getMessage() == "进程: [1, 2]"
+    assert record.args is None
+
+    record = handler.prepare(_record("%s: %d", ("歌曲", 3)))
+    assert record.args == ("歌曲", 3)
+    assert record.getMessage() == "歌曲: 3"
+
+    record = handler.prepare(_record("%(name)s", ({"name": "歌曲"},)))
+    assert record.getMessage() == "歌曲"
+
+
+def test_atexit_registered_once(tmp_path, monkeypatch):
+    """多次 setup_logger 只注册一次退出回调"""
+    registered = []
+    monkeypatch.setattr(logger_module.atexit, "register", registered.append)
+    monkeypatch.setattr(logger_module, "_atexit_registered", False)
+    monkeypatch.setattr(logger_module, "_listener", None)
+    try:
+        for i in range(3):
+            logger = logger_module.setup_logger(f"test-logger-{i}", log_dir=tmp_path)
+            logger.info("第 %d 次", i)
+    finally:
+        logger_module._stop_listener()
+        for i in range(3):
+            logging.getLogger(f"test-logger-{i}").handlers.clear()
+
+    assert registered == [logger_module._stop_listener]
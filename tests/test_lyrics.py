@@ -0,0 +1,95 @@
+"""
+歌词测试
+
+测试 LRC 解析、按播放位置查找歌词行、歌词缓存和组件的换行定时
+"""
+
+import sys
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtWidgets import QApplication
+
+from benchmarks.stub_server import StubNeteaseServer
+from src.models.lyrics import Lyrics
+from src.models.song_info import SongInfo
+from src.models.comment import Comment
+
+LRC = """[ar:伍佰]
+[ti:浪人情歌]
+[offset:500]
+{"t":0,"c":[{"tx":"作词: "},{"tx":"伍佰"}]}
+[00:20.50]第二行
+[00:10.5][01:00.000]副歌
+[00:05]
+[00:01.23]第一行
+"""
+
+
+def test_parse_sorts_and_expands_tags():
+    """多个时间标签展开为多行，按时间排序，整体偏移生效，无时间标签的行被忽略"""
+    lyrics = Lyrics.parse(LRC)
+
+    assert lyrics.times_ms == [730, 4500, 10000, 20000, 59500]
+    assert lyrics.lines == ["第一行", "", "副歌", "第二行", "副歌"]
+
+
+def test_lookup_by_position():
+    """二分查找当前行和下一行开始时间"""
+    lyrics = Lyrics([1000, 5000, 9000], ["a", "b", "c"])
+
+    assert lyrics.index_at(0) == -1
+    assert lyrics.line_at(0) == ""
+    assert lyrics.next_time(0) == 1000
+
+    assert lyrics.line_at(5000) == "b"
+    assert lyrics.next_time(5000) == 9000
+    assert lyrics.line_at(8999) == "b"
+
+    assert lyrics.line_at(60000) == "c"
+    assert lyrics.next_time(60000) is None
+    assert not Lyrics.parse("纯音乐，请欣赏")
+
+
+def test_lyrics_are_cached_in_store(make_crawler):
+    """歌词保存在本地评论库，新实例重复获取不再请求；没有歌词的歌曲同样缓存"""
+    with StubNeteaseServer() as server:
+        crawlers = [make_crawler(server, store=True) for _ in range(2)]
+
+        lyrics = crawlers[0].get_lyrics("12345")
+        assert len(lyrics) == 48
+        assert not crawlers[0].get_lyrics("12340")
+        assert server.request_counts["lyric"] == 2
+
+        assert crawlers[1].get_lyrics("12345").lines == lyrics.lines
+        assert not crawlers[1].get_lyrics("12340")
+        assert server.request_counts["lyric"] == 2
+
+
+def test_widget_schedules_next_line():
+    """组件显示当前行，单次定时器设到下一行开始时；切歌后清除歌词"""
+    app = QApplication.instance() or QApplication([])  # noqa: F841 保持引用，避免被回收
+    from src.gui.comment_widget import CommentWidget
+
+    widget = CommentWidget()
+    song = SongInfo(song_id="1", name="浪人情歌", artist="伍佰")
+    widget.update_song(song, [Comment(content="评论", user="u", likes=1)])
+    height_without = widget.preferred_height()
+
+    widget.set_lyrics(Lyrics([0, 4000, 8000], ["一", "二", "三"]), position_ms=5000)
+    assert widget.lyric_label.text() == "二"
+    assert widget.lyric_timer.isActive()
+    assert 2900 <= widget.lyric_timer.remainingTime() <= 3000
+    assert widget.preferred_height() > height_without
+
+    widget.sync(9000)
+    assert widget.lyric_label.text() == "三"
+    assert not widget.lyric_timer.isActive()
+
+    widget.update_song(SongInfo(song_id="2", name="挪威的森林", artist="伍佰"), widget.comments)
+    assert widget.lyrics is None
+    assert widget.preferred_height() == height_without
@@ -0,0 +1,76 @@
+"""
+延迟统计测试
+
+测试滚动窗口上的百分位数、空统计、阶段计时、@timed 装饰器和 JSON 导出
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.metrics import LatencyHistogram, MetricsRegistry, get_metrics, timed
+
+
+def test_percentiles_use_only_recent_window():
+    """百分位数按最近秩法计算，只基于窗口内的样本；count 统计全部记录次数"""
+    histogram = LatencyHistogram(window=100)
+    for value in range(1, 101):
+        histogram.record(float(value))
+
+    assert histogram.summary() == {"count": 100, "p50": 50.0, "p95": 95.0, "max": 100.0, "last": 100.0}
+
+    # 再记录 100 个更小的值，旧样本全部滑出窗口
+    for value in range(100, 0, -1):
+        histogram.record(value / 10)
+
+    summary = histogram.summary()
+    assert summary["count"] == 200
+    assert (summary["p50"], summary["p95"], summary["max"], summary["last"]) == (5.0, 9.5, 10.0, 0.1)
+
+
+def test_empty_and_single_sample():
+    """没有样本时统计值为 0；只有一个样本时各百分位都等于它"""
+    histogram = LatencyHistogram()
+    assert histogram.summary() == {"count": 0, "p50": 0.0, "p95": 0.0, "max": 0.0, "last": 0.0}
+
+    histogram.record(3.25)
+    assert histogram.summary() == {"count": 1, "p50": 3.25, "p95": 3.25, "max": 3.25, "last": 3.25}
+
+
+def test_stage_and_timed_record_even_on_error():
+    """stage 和 @timed 记录耗时；被计时的函数抛出异常时同样记录"""
+    registry = MetricsRegistry()
+    with registry.stage("parse"):
+        pass
+    assert registry.summary()["parse"]["count"] == 1
+
+    @timed("test_metrics_failing")
+    def failing():
+        raise ValueError("boom")
+
+    before = get_metrics().histogram("test_metrics_failing").count
+    with pytest.raises(ValueError):
+        failing()
+    assert get_metrics().histogram("test_metrics_failing").count == before + 1
+    assert failing.__name__ == "failing"
+
+
+def test_dump_json(tmp_path):
+    """导出的 JSON 包含单位和各阶段摘要"""
+    registry = MetricsRegistry()
+    registry.record("search_song", 12.5)
+    registry.record("search_song", 7.5)
+
+    path = registry.dump_json(tmp_path / "latency.json")
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    assert path == tmp_path / "latency.json"
+    assert data["unit"] == "ms"
+    assert data["stages"] == {"search_song": {"count": 2, "p50": 7.5, "p95": 12.5, "max": 12.5, "last": 7.5}}
+    assert "generated_at" in data
@@ -0,0 +1,99 @@
+"""
+运行时性能分析器测试
+"""
+
+import sys
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.profiler import RuntimeProfiler
+
+
+def _busy(n: int) -> int:
+    return sum(range(n))
+
+
+def test_concurrent_threads_are_profiled(tmp_path):
+    """两个线程同时执行被分析的调用，不报错且结果合并到一个文件"""
+    profiler = RuntimeProfiler(log_dir=tmp_path)
+    profiler.start_cprofile(duration=60)
+
+    inside = threading.Event()
+    release = threading.Event()
+    results = []
+
+    def slow():
+        inside.set()
+        release.wait(5)
+        return _busy(1000)
+
+    worker = threading.Thread(target=lambda: results.append(profiler._run_profiled(slow, (), {})))
+    worker.start()
+    inside.wait(5)
+
+    # 工作线程的调用尚未结束时，主线程执行另一个被分析的调用
+    results.append(profiler._run_profiled(_busy, (2000,), {}))
+    release.set()
+    worker.join()
+
+    path = profiler.stop_cprofile()
+    assert sorted(results) == [_busy(1000), _busy(2000)]
+    names = {func for _, _, func in pstats.Stats(str(path)).stats}
+    assert {"slow", "_busy"} <= names
+
+
+def test_stop_without_calls(tmp_path):
+    """开启后没有被分析的调用，结束时不写文件"""
+    profiler = RuntimeProfiler(log_dir=tmp_path)
+    profiler.start_cprofile(duration=60)
+    assert profiler.stop_cprofile() is None
+
+
+def test_stop_does_not_wait_for_long_calls(tmp_path):
+    """被分析的调用长时间不结束时，结束分析最多等待 stop_timeout 秒"""
+    profiler = RuntimeProfiler(log_dir=tmp_path, stop_timeout=0.2)
+    profiler.start_cprofile(duration=60)
+
+    inside = threading.Event()
+    release = threading.Event()
+
+    def stuck():
+        inside.set()
+        release.wait(10)
+
+    worker = threading.Thread(target=profiler._run_profiled, args=(stuck, (), {}))
+    worker.start()
+    inside.wait(5)
+
+    start = time.monotonic()
+    profiler.stop_cprofile()
+    assert time.monotonic() - start < 2
+    release.set()
+    worker.join()
+
+    # 之后可以重新开启分析
+    profiler.start_cprofile(duration=60)
+    profiler._run_profiled(_busy, (1000,), {})
+    assert profiler.stop_cprofile() is not None
+
+
+def test_tracemalloc_started_elsewhere_keeps_running(tmp_path):
+    """内存分析只停止自己开启的 tracemalloc"""
+    profiler = RuntimeProfiler(log_dir=tmp_path)
+    tracemalloc.start()
+    try:
+        profiler.start_tracemalloc()
+        assert profiler.stop_tracemalloc() is not None
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+    profiler.start_tracemalloc()
+    assert profiler.stop_tracemalloc() is not None
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,56 @@
+"""
+本地推送接口测试
+"""
+
+import sys
+import os
+import json
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import requests
+
+from src.core.push_server import PushServer
+from src.models.song_info import SongInfo
+from src.models.comment import Comment
+
+
+def _read_event(lines) -> tuple[str, dict]:
+    """从 SSE 行迭代器读取一条消息"""
+    event, data = "", ""
+    for line in lines:
+        if line.startswith("event: "):
+            event = line[len("event: "):]
+        elif line.startswith("data: "):
+            data = line[len("data: "):]
+        elif not line and event:
+            return event, json.loads(data)
+
+
+def test_state_and_event_stream():
+    """订阅时收到完整状态，之后按切歌/轮播推送"""
+    server = PushServer().start()
+    base = f"http://127.0.0.1:{server.port}"
+    song = SongInfo(song_id="1", name="浪人情歌", artist="伍佰")
+    comments = [Comment(content="第一条", user="a", likes=1), Comment(content="第二条", user="b", likes=2)]
+
+    try:
+        server.publish_song(song, comments, 0)
+
+        with requests.get(f"{base}/events", stream=True, timeout=5) as response:
+            lines = response.iter_lines(chunk_size=1, decode_unicode=True)
+
+            event, data = _read_event(lines)
+            assert event == "song"
+            assert data["song"]["name"] == "浪人情歌"
+            assert [c["content"] for c in data["comments"]] == ["第一条", "第二条"]
+
+            server.publish_rotation(1)
+            assert _read_event(lines) == ("rotation", {"index": 1})
+
+        state = requests.get(f"{base}/state", timeout=5).json()
+        assert state["index"] == 1
+        assert state["song"]["artist"] == "伍佰"
+    finally:
+        server.stop()
@@ -0,0 +1,93 @@
+"""
+请求调度器测试
+"""
+
+import sys
+import os
+import threading
+import time
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.stub_server import StubNeteaseServer
+from src.core.scheduler import Priority, RequestScheduler
+from src.utils.metrics import get_metrics
+
+
+def _run_in_order(scheduler: RequestScheduler, jobs: list[tuple[Priority, str]], delay: float = 0) -> list[str]:
+    """先用一个任务占住工作线程，再按顺序提交 jobs，返回实际执行顺序"""
+    gate = threading.Event()
+    order = []
+    scheduler.submit(Priority.FOREGROUND, gate.wait)
+
+    futures = []
+    for priority, name in jobs:
+        futures.append(scheduler.submit(priority, order.append, name))
+        time.sleep(delay)
+
+    gate.set()
+    for future in futures:
+        future.result(timeout=5)
+    return order
+
+
+def test_strict_priority():
+    """排队中的任务按优先级出队"""
+    scheduler = RequestScheduler(aging_seconds=60)
+    order = _run_in_order(scheduler, [
+        (Priority.BACKGROUND, "prefetch"),
+        (Priority.INTERACTIVE, "page"),
+        (Priority.FOREGROUND, "current"),
+        (Priority.BACKGROUND, "crawl"),
+    ])
+    scheduler.shutdown()
+
+    assert order == ["current", "page", "prefetch", "crawl"]
+    assert get_metrics().histogram("queue_wait_background").count >= 2
+
+
+def test_aging_prevents_starvation():
+    """等待足够久的后台任务排到新来的前台任务前面"""
+    scheduler = RequestScheduler(aging_seconds=0.02)
+    order = _run_in_order(scheduler, [
+        (Priority.BACKGROUND, "prefetch"),
+        (Priority.FOREGROUND, "current"),
+    ], delay=0.1)
+    scheduler.shutdown()
+
+    assert order == ["prefetch", "current"]
+
+
+def test_foreground_request_overtakes_waiting_background_request(make_crawler):
+    """后台任务的请求在限速入口等待时，新到的前台请求先取得下一个名额"""
+    with StubNeteaseServer() as server:
+        crawler = make_crawler(server, min_interval=0.3)
+
+        sent = []
+        original_request = crawler.session.request
+
+        def recording_request(method, url, *args, **kwargs):
+            sent.append("search" if "/search/" in url else "page")
+            return original_request(method, url, *args, **kwargs)
+
+        crawler.session.request = recording_request
+
+        def crawl():
+            for page_no in (1, 2):
+                crawler.get_comments_page("1", page_no)
+
+        scheduler = RequestScheduler(max_workers=3)
+        background = [scheduler.submit(Priority.BACKGROUND, crawl) for _ in range(2)]
+
+        # 两个后台任务的第二、三个请求正在入口排队
+        time.sleep(0.1)
+        foreground = scheduler.submit(Priority.FOREGROUND, crawler.search_song, "浪人情歌", "伍佰")
+
+        assert foreground.result(timeout=5)
+        for future in background:
+            future.result(timeout=5)
+        scheduler.shutdown()
+
+    assert sent[:3] == ["page", "page", "search"]
+    assert get_metrics().histogram("admit_wait_background").count >= 4
@@ -0,0 +1,45 @@
+"""
+会话快照测试
+
+测试快照的保存、读取以及与窗口标题的匹配
+"""
+
+import sys
+import os
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.session_snapshot import (
+    SessionSnapshot, load_session_snapshot, save_session_snapshot
+)
+from src.models.song_info import SongInfo
+from src.models.comment import Comment
+
+
+def test_snapshot_round_trip(tmp_path):
+    """快照保存后可以原样读取"""
+    path = tmp_path / "last_session.json"
+    snapshot = SessionSnapshot(
+        title_song="浪人情歌",
+        title_artist="伍佰",
+        song=SongInfo(song_id="347230", name="浪人情歌", artist="伍佰", genres=["单曲"]),
+        comments=[Comment(content="好听", user="用户", likes=1200, time_ms=1489154520000)],
+        index=0,
+    )
+
+    save_session_snapshot(snapshot, path)
+    loaded = load_session_snapshot(path)
+
+    assert loaded == snapshot
+    assert loaded.matches("浪人情歌", "伍佰")
+    assert not loaded.matches("浪人情歌", "其他歌手")
+
+
+def test_invalid_snapshot_is_ignored(tmp_path):
+    """损坏的快照返回 None 而不是抛出异常"""
+    path = tmp_path / "last_session.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert load_session_snapshot(path) is None
+    assert load_session_snapshot(tmp_path / "missing.json") is None
@@ -0,0 +1,92 @@
+"""
+跨进程共享缓存测试
+
+每个 SharedCache / SharedTokenBucket 实例使用独立连接，与多个进程访问同一文件的行为一致
+"""
+
+import sys
+import os
+import threading
+import time
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.stub_server import StubNeteaseServer
+from src.core.shared_cache import SharedCache, SharedTokenBucket
+
+
+def test_entries_are_shared_and_expire(tmp_path):
+    """一个实例写入的值另一个实例可读，过期后失效"""
+    path = tmp_path / "shared.db"
+    first, second = SharedCache(path), SharedCache(path)
+
+    first.put("detail:1", {"name": "浪人情歌"}, ttl=60)
+    first.put("detail:2", {"name": "过期"}, ttl=-1)
+
+    assert second.get("detail:1") == {"name": "浪人情歌"}
+    assert second.get("detail:2") is None
+
+
+def test_concurrent_misses_fetch_once(tmp_path):
+    """多个实例同时未命中同一个键，只调用一次 loader"""
+    path = tmp_path / "shared.db"
+    caches = [SharedCache(path) for _ in range(4)]
+    calls = []
+    results = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.2)
+        return ["评论"]
+
+    threads = [
+        threading.Thread(target=lambda c=cache: results.append(c.fetch("hot:1", loader, ttl=60)))
+        for cache in caches
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [["评论"]] * 4
+
+
+def test_token_bucket_is_shared(tmp_path):
+    """两个实例共用同一个令牌桶，合计速率不超过限速"""
+    path = tmp_path / "shared.db"
+    buckets = [SharedTokenBucket(path), SharedTokenBucket(path)]
+
+    waits = [buckets[i % 2].reserve(rate=10) for i in range(6)]
+
+    assert waits[0] == 0
+    # 令牌预支后按到达顺序排队：第 n 个请求约等待 n / rate 秒
+    assert waits[-1] > 0.45
+
+
+class _CountingBucket(SharedTokenBucket):
+    """记录取令牌次数的令牌桶"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.acquired = 0
+
+    def acquire(self, rate: float) -> None:
+        self.acquired += 1
+        super().acquire(rate)
+
+
+def test_every_request_takes_a_token(tmp_path, make_crawler):
+    """搜索、详情、热门评论和分页的每个请求都经过共享令牌桶"""
+    with StubNeteaseServer() as server:
+        crawler = make_crawler(server, min_interval=0.001)
+        crawler.token_bucket = _CountingBucket(tmp_path / "shared.db")
+
+        song_id = crawler.search_song("浪人情歌", "伍佰")
+        crawler.get_song_detail(song_id)
+        crawler.get_hot_comments(song_id)
+        crawler.get_comments_page(song_id)
+
+        assert sum(server.request_counts.values()) == 4
+        assert crawler.token_bucket.acquired == 4